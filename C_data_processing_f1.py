@@ -1,21 +1,40 @@
 import pandas as pd
 import re
 from typing import List ,Dict,Any, Set
-from openpyxl import load_workbook
-from openpyxl.styles import PatternFill
-from openpyxl.utils.dataframe import dataframe_to_rows
 from io import BytesIO 
 from pandas.api.types import is_object_dtype, is_categorical_dtype, CategoricalDtype 
 from fuzzywuzzy import fuzz
 from datetime import datetime, timedelta
 import numpy as np
 
+from qc_ingest import open_source, source_digest
+from qc_loader import read_bsr_sheet, read_bsr_sheet_split
+from qc_report import write_qc_report
+from qc_intervals import find_overlaps
+from qc_idmap import id_bijection_columns
+from qc_matching import event_matchday_competition_columns, load_reference_competitions
+from qc_reference import OBLIGATION_SHEET, ObligationIndex, get_reference
+from qc_durations import (
+    DURATION_MINUTES,
+    add_duration_minutes,
+    duration_minutes,
+    program_category_columns,
+    start_end_category_columns,
+)
+from qc_registry import VALIDATOR_CHECKS, market_check_columns, run_checks
+from qc_schedule import airing_times, time_strings
+from qc_metrics import CheckProfile
+from qc_dimensions import (
+    dimension_mask,
+    encode_dimensions,
+    map_distinct,
+    normalize_dimension,
+    recode_dimension,
+)
+
 
 # --- Constants ---
 DATE_FORMAT = "%Y-%m-%d"
-GREEN_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-RED_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-HEADER_FILL = PatternFill(start_color="BDD7EE", end_color="BDD7EE", fill_type="solid")
 
 
 class BSRValidator:
@@ -37,13 +56,25 @@ class BSRValidator:
     DATE_COLUMN = 'Date'
     SESSION_COMPETITION_COLUMN = 'Competition'
 
-    def __init__(self, bsr_path: str , obligation_path: str = None, overnight_path: str = None):
+    # Source row of each self.df row when only some columns were loaded
+    ROW_ID_COLUMN = '__bsr_row__'
+
+    def __init__(self, bsr_path: str , obligation_path: str = None, overnight_path: str = None, cache=None, checks=None):
         self.bsr_path = bsr_path
+        # Optional ParsedUploadCache: repeat uploads of the same bytes skip .xlsx parsing
+        self.cache = cache
+        # With `checks` (market check keys), only the columns they declare are loaded into
+        # self.df; the rest is kept aside untouched and joined back by output_frame()
+        self.columns = market_check_columns(checks) if checks is not None else None
+        self.source_columns = None
+        self.passthrough = None
         self.df = self._load_bsr()
 
         # New: Store the obligation path, but don't load the full DF yet
         self.obligation_path = obligation_path
         self.full_obligation_df = None # Will store the entire obligation sheet
+        self.obligation_index = None # Shared ObligationIndex from the reference data service
+        self.check_profiles = {} # Per-check profiles of the last run_full_qc
 
         # NEW: Store the overnight path
         self.overnight_path = overnight_path # <-- STORED HERE
@@ -111,8 +142,7 @@ class BSRValidator:
             OVERNIGHT_COLS_RAW = ['Country', 'Channel', 'Date', 'Session', 'Grand Prix', self.OVERNIGHT_AUDIENCE_COL]
             
             # Load data using raw column names
-            df_overnight = pd.read_excel(self.overnight_path, sheet_name=self.OVERNIGHT_SHEET, header=0, usecols=OVERNIGHT_COLS_RAW)
-            df_overnight.columns = [str(c).strip() for c in df_overnight.columns]
+            df_overnight = self._read_upload_sheet(self.overnight_path, self.OVERNIGHT_SHEET, usecols=OVERNIGHT_COLS_RAW)
             
             # --- Initial Renaming (Country -> Market, Channel -> TV-Channel) ---
             if 'Country' in df_overnight.columns:
@@ -198,10 +228,10 @@ class BSRValidator:
         # 2. Prepare BSR for merging (Standardize keys)
         self.df[BSR_TARGET_COL_RAW] = pd.to_numeric(self.df[BSR_TARGET_COL_RAW], errors='coerce')
         
-        # Apply standardization to BSR columns
+        # Apply standardization to BSR columns (per category, the columns stay encoded)
         for col in [COUNTRY_COLUMN, CHANNEL_COLUMN, SESSION_COMPETITION_COLUMN]:
             if col in self.df.columns:
-                self.df.loc[:, col] = self.df[col].astype(str).str.strip().str.upper()
+                self.df[col] = recode_dimension(self.df[col], case="upper")
         if DATE_COLUMN in self.df.columns:
             self.df.loc[:, DATE_COLUMN] = pd.to_datetime(self.df[DATE_COLUMN], errors='coerce')
             
@@ -268,35 +298,25 @@ class BSRValidator:
     # New Private Method to load the full obligation sheet once
     def _load_full_obligation_data(self) -> pd.DataFrame:
         """
-        Loads the F1 Obligation sheet and filters it to include ONLY the '15_Dutch GP' 
-        event data, storing the filtered DataFrame in self.full_obligation_df.
+        Loads the F1 Obligation sheet filtered to the reference target GP, storing
+        the filtered DataFrame in self.full_obligation_df. The indexed rows are
+        shared through the reference data service, so a workbook with the same
+        bytes is only read and filtered once per process.
         """
         if self.full_obligation_df is not None:
             return self.full_obligation_df
 
         if not self.obligation_path:
             return pd.DataFrame()
-            
-        TARGET_GP = '15_Dutch GP' # <-- Define the target GP here
-        
+
         try:
-            # Load the entire obligation sheet
-            df_obl = pd.read_excel(
-                self.obligation_path, 
-                sheet_name="F1 - Broadcaster Obligations",
+            self.obligation_index = get_reference().obligations(
+                self.obligation_path,
+                lambda: self._read_upload_sheet(self.obligation_path, OBLIGATION_SHEET),
             )
-            df_obl.columns = [str(c).strip() for c in df_obl.columns]
-            
-            # --- CRITICAL FILTERING STEP ---
-            # Filter the loaded DataFrame for the specific GP
-            df_obl_filtered = df_obl[df_obl.get('GP') == TARGET_GP].copy()
+            self.full_obligation_df = self.obligation_index.frame
+            return self.full_obligation_df
 
-            print(f"Obligation data loaded and filtered for: {TARGET_GP}. Rows found: {len(df_obl_filtered)}")
-            
-            # Store and return the filtered DataFrame
-            self.full_obligation_df = df_obl_filtered
-            return df_obl_filtered
-            
         except FileNotFoundError:
             print(f"Error: Obligation file not found at {self.obligation_path}")
             return pd.DataFrame()
@@ -304,102 +324,123 @@ class BSRValidator:
             print(f"Error loading/filtering obligation sheet: {e}")
             return pd.DataFrame()
 
-    def _detect_header_row(self, sheet_name=0):
-        """
-        Detects the header row index by scanning the first 200 rows 
-        of the specified sheet for key column names.
-        
-        Args:
-            sheet_name: The name or index of the Excel sheet to read. Defaults to the first sheet (0).
-        """
-        # Read a sample of the specified sheet
-        df_sample = pd.read_excel(
-            self.bsr_path, 
-            sheet_name=sheet_name, 
-            header=None, 
-            nrows=200
-        )
-        
-        for i, row in df_sample.iterrows():
-            # Convert row to a single, space-separated, lowercase string for detection
-            # Use fillna('') to handle rows that might be mostly empty
-            row_str = " ".join(row.fillna('').astype(str).tolist()).lower()
+    def _read_upload_sheet(self, path, sheet_name, usecols=None) -> pd.DataFrame:
+        """Reads a plain (header on row 0) sheet with stripped column names, through the upload cache if set."""
+        def loader(src):
+            df = pd.read_excel(src, sheet_name=sheet_name, header=0, usecols=usecols)
+            df.columns = [str(c).strip() for c in df.columns]
+            return df, 0
 
-            # First set of keywords (common BSR columns)
-            if all(k in row_str for k in ["region", "market", "broadcaster"]):
-                return i
-            
-            # Second set of keywords (common date/time columns)
-            if "date" in row_str and ("utc" in row_str or "gmt" in row_str):
-                return i
-                
-        raise ValueError(f"Could not detect header row in '{sheet_name}' sheet of BSR file.")
+        if self.cache is None:
+            return loader(open_source(path))[0]
+        variant = sheet_name if usecols is None else f"{sheet_name}_{'_'.join(usecols)}"
+        return self.cache.load(path, variant, loader)
 
     def _load_bsr(self):
-        # Define the specific sheet name based on your example
-        sheet_name_to_load = "Worksheet" 
-
-        # Detect the header row on the specified sheet
-        header_row = self._detect_header_row(sheet_name=sheet_name_to_load)
-
-        # Load the full data using the detected header row and sheet name
-        df = pd.read_excel(
-            self.bsr_path, 
-            sheet_name=sheet_name_to_load,  # Use the specific sheet name
-            header=header_row               # Use the dynamically detected header row
-        )
-        
-        # Ensure column names are clean
-        df.columns = [str(c).strip() for c in df.columns]
+        """
+        Loads the "Worksheet" sheet in a single streaming pass. The header row is
+        detected from the first rows of the same stream the data is built from.
+        """
+        sheet_name_to_load = "Worksheet"
+        if self.columns is not None:
+            df = self._load_bsr_projection(sheet_name_to_load)
+        elif self.cache is not None:
+            df = self.cache.load(self.bsr_path, sheet_name_to_load, lambda src: read_bsr_sheet(src, sheet_name=sheet_name_to_load))
+        else:
+            df, _ = read_bsr_sheet(open_source(self.bsr_path), sheet_name=sheet_name_to_load)
+        # Duration is parsed once here; the checks read Duration_Minutes
+        add_duration_minutes(df)
+        # Market / channel / broadcaster-like columns are dictionary encoded, so
+        # normalizing and comparing them runs over the distinct values only
+        return encode_dimensions(df)
+
+    def _load_bsr_projection(self, sheet_name) -> pd.DataFrame:
+        """
+        Loads only self.columns (plus a source row id) and keeps the other columns
+        as raw values in self.passthrough. A parsed copy in the upload cache is
+        split instead of re-reading the workbook.
+        """
+        cached = self.cache.get(source_digest(self.bsr_path), sheet_name) if self.cache is not None else None
+        if cached is not None:
+            full = cached[0]
+            used = [c for c in full.columns if c in self.columns]
+            df, rest, self.source_columns = full[used].copy(), full.drop(columns=used), list(full.columns)
+        else:
+            df, rest, self.source_columns = read_bsr_sheet_split(open_source(self.bsr_path), self.columns, sheet_name=sheet_name)
+        self.passthrough = rest
+        df[self.ROW_ID_COLUMN] = np.arange(len(df))
+        print(f"Projected BSR load: {len(df.columns) - 1} of {len(df.columns) - 1 + len(rest.columns)} columns parsed")
         return df
 
+    def output_frame(self) -> pd.DataFrame:
+        """
+        self.df for writing out. After a projected load, the untouched columns are
+        joined back by source row (rows added by a check get blanks) and the
+        columns are put back in sheet order, followed by the ones checks added.
+        The parsed Duration_Minutes helper column is internal and left out.
+        """
+        df = self.df.drop(columns=[DURATION_MINUTES], errors="ignore")
+        if self.passthrough is None:
+            return df
+        rows = df[self.ROW_ID_COLUMN].to_numpy()
+        rest = self.passthrough.reindex(rows)
+        rest.index = df.index
+        out = pd.concat([df.drop(columns=[self.ROW_ID_COLUMN]), rest], axis=1)
+        ordered = [c for c in self.source_columns if c in out.columns]
+        return out[ordered + [c for c in out.columns if c not in ordered]]
+
     # --- Public Methods to Run Full QC Pipeline ---
 
     def run_full_qc(self, df_data=None):
-        """Runs all standard QC checks in sequence."""
-        self.df = self.period_check()
-        self.df = self.completeness_check()
-        self.df = self.overlap_duplicate_daybreak_check()
-        self.df = self.program_category_check()
-        self.df = self.duration_check()
-        
-        # rosco_path dependency removed, passing None to checks that used to require it.
-        self.df = self.check_event_matchday_competition(df_data=df_data, rosco_path=None) 
-        self.df = self.market_channel_program_duration_check(reference_df=df_data)
-        self.df = self.domestic_market_coverage_check(reference_df=df_data)
-
-        self.df = self.rates_and_ratings_check()
-        self.df = self.duplicated_markets_check()
-        self.df = self.country_channel_id_check()
-        self.df = self.client_lstv_ott_check()
+        """
+        Runs all standard QC checks. Independent checks run concurrently on column
+        projections (dependency order comes from the declarations in qc_registry.py).
+        """
+        # rosco_path dependency removed, checks that used to require it get None.
+        # Per-check timings end up in self.check_profiles ({check name: profile dict}).
+        self.check_profiles = {}
+        self.df = run_checks(
+            self.df, VALIDATOR_CHECKS, context={"validator": self, "df_data": df_data}, profiles=self.check_profiles
+        )
         return self.df
 
     # --- Methods for Market Specific Checks (Placeholder Implementation) ---
 
     # --- Core Processing Method (FIXED) ---
     # --- Core Processing Method ---
-    def market_check_processor(self, checks: List[str]) -> List[Dict[str, Any]]:
-        # ... (Method contents remain unchanged - assumed correct)
+    def market_check_processor(self, checks: List[str], on_check=None) -> List[Dict[str, Any]]:
+        # on_check(check_key, summary) is called after every check (used for job progress)
         status_summaries = [] 
         
         for check_key in checks:
+            result = None
             if check_key in self.market_check_map:
+                # Wall/CPU time, peak RSS growth and rows in/out go into the summary details
+                profile = CheckProfile(len(self.df))
                 try:
-                    result = self.market_check_map[check_key]()
+                    with profile:
+                        result = self.market_check_map[check_key]()
+                    profile.rows_out = len(self.df)
                     if result:
+                        result.setdefault("details", {})["profile"] = profile.as_dict()
                         status_summaries.append(result)
                     print(f"Applied custom check: {check_key}")
                 except Exception as e:
-                    status_summaries.append({
+                    result = {
                         "check_key": check_key,
                         "status": "Failed",
                         "action": "Error during execution",
                         "description": f"Check failed due to internal error: {str(e)}",
-                        "details": {"error": str(e)}
-                    })
+                        "details": {"error": str(e), "profile": profile.as_dict()}
+                    }
+                    status_summaries.append(result)
                     print(f"Error applying check {check_key}: {e}")
             else:
+                result = {"check_key": check_key, "status": "Skipped"}
                 print(f"Warning: Unknown check key received: {check_key}")
+
+            if on_check is not None:
+                on_check(check_key, result)
                 
         return status_summaries
 
@@ -410,7 +451,8 @@ class BSRValidator:
         initial_rows = len(self.df)
         
         # Logic to filter rows (Keep all rows NOT matching the country name)
-        self.df = self.df[self.df.get('Market', self.df.get('Country', '')).astype(str).str.lower() != country_name.lower()]
+        markets = self.df.get('Market', self.df.get('Country', ''))
+        self.df = self.df[~dimension_mask(markets, lambda v: v == country_name.lower(), case="lower", strip=False)]
         
         rows_removed = initial_rows - len(self.df)
         
@@ -434,8 +476,8 @@ class BSRValidator:
         initial_rows = len(self.df)
         
         mask_to_remove = (
-            (self.df.get('Market', '').astype(str).str.lower() == 'brazil') & 
-            (self.df.get('Broadcaster', '').astype(str).str.lower().str.contains('espn|fox', na=False))
+            dimension_mask(self.df.get('Market', ''), lambda v: v == 'brazil', case="lower", strip=False) & 
+            dimension_mask(self.df.get('Broadcaster', ''), lambda v: 'espn' in v or 'fox' in v, case="lower", strip=False)
         )
         
         rows_removed = mask_to_remove.sum()
@@ -458,8 +500,8 @@ class BSRValidator:
     def _remove_switz_canal(self) -> Dict[str, Any]:
         """Removes rows for Switzerland where TV-Channel contains Canal+ or ServusTV."""
         initial_rows = len(self.df)
-        mask_to_remove = ((self.df.get('Market', '').astype(str).str.lower() == 'switzerland') & 
-                            (self.df.get('TV-Channel', '').astype(str).str.contains(r'Canal\+|ServusTV', case=False, na=False)))
+        mask_to_remove = (dimension_mask(self.df.get('Market', ''), lambda v: v == 'switzerland', case="lower", strip=False) & 
+                            dimension_mask(self.df.get('TV-Channel', ''), lambda v: 'canal+' in v or 'servustv' in v, case="lower", strip=False))
         rows_removed = mask_to_remove.sum()
         self.df = self.df[~mask_to_remove].reset_index(drop=True)
         
@@ -480,8 +522,8 @@ class BSRValidator:
         """Removes Viaplay Group rows from Baltics/Poland."""
         initial_rows = len(self.df)
         countries = ['latvia', 'lithuania', 'poland', 'estonia']
-        mask_to_remove = ((self.df.get('Broadcaster', '').astype(str).str.lower() == 'viaplay group') & 
-                            (self.df.get('Market', '').astype(str).str.lower().isin(countries)))
+        mask_to_remove = (dimension_mask(self.df.get('Broadcaster', ''), lambda v: v == 'viaplay group', case="lower", strip=False) & 
+                            dimension_mask(self.df.get('Market', ''), lambda v: v in countries, case="lower", strip=False))
         rows_removed = mask_to_remove.sum()
         self.df = self.df[~mask_to_remove].reset_index(drop=True)
         
@@ -570,76 +612,13 @@ class BSRValidator:
         Ensures a required Channel is present in the correct Market by mapping BSR Groups 
         (e.g., Mediapro) to Obligation Channels (e.g., Fox Sports 1).
         """
-        TARGET_GP = '15_Dutch GP'
+        reference = get_reference()
+        TARGET_GP = reference.target_gp
         FLAG_COLUMN = 'Obligation_Broadcaster_Status'
-        
-        # --- Source Mapping List (Obligation Channel : BSR Group Name) ---
-        # This list is used to generate the functional map by inverting it.
-        OBLIGATION_CHANNEL_TO_BSR_GROUP_LIST = {
-            'DigitAlb': 'Digit-Alb',
-            'Fox Sports 1': 'Mediapro',
-            'Fast Sports': 'Fast Media',
-            'beIN': 'beIN Media Group',
-            'Fox Sport': 'Fox Broadcasting Company',
-            'ORF': 'ORF',
-            'Sky Sport': 'Sky',
-            'Idman TV': 'Idman TV',
-            'RTBF': 'RTBF',
-            'Telenet': 'Telenet',
-            'ESPN': 'ESPN',
-            'Bandsports': 'Grupo Bandeirantes de Comunicacao',
-            'TV Bandeirantes': 'Grupo Bandeirantes de Comunicaçao',
-            'Nova TV': 'Nova Broadcasting Group',
-            'TSN': 'CTV Specialty Television',
-            'CCTV5': 'CCTV',
-            'Great Sports': 'Shanghai Media Group',
-            'Guangdong TV': 'Guangdong TV',
-            'Tencent': 'Tencent',
-            'Cytavision': 'Cytavision',
-            'Nova Sport': 'CME Group',
-            'TV3': 'TV3',
-            'Go3': 'Go3',
-            'TV6': 'All Media Baltics',
-            'Setanta Sports': 'Setanta Eurasia',
-            'Viasat': 'Viasat',
-            'Canal+': 'Canal+ Group',
-            'ANT1': 'Antenna Group',
-            'Now Sports': 'Now Sports',
-            'M4': 'MTVA',
-            'Viaplay': 'Viaplay Group',
-            'Fancode': 'Fancode',
-            'Sport5': 'Sport5',
-            'DAZN': 'DAZN',
-            'Fuji TV': 'Fuji Media Holdings Inc.',
-            'RTL Lux': 'RTL',
-            'V Sport': 'Viaplay Group',
-            'TVWAN': 'TVWAN',
-            'SuperSport': 'MultiChoice',
-            'beIN Sports': 'beIN Media Group',
-            'Arena Sport': 'Arena TV',
-            'Sportklub': 'United Media',
-            'RUSH Sports': 'RUSH Sports',
-            'Eleven Sports': 'Eleven Sports Network',
-            'Polsat': 'Polsat Group',
-            'Antena': 'Antena TV Group',
-            'Coupang': 'Coupang',
-            'Vsport': 'Viaplay Group',
-            'RSI': 'RSI',
-            'RTS': 'RTS',
-            'SRF': 'SRG SSR',
-            'ELTA': 'ELTA TV',
-            'Videoland Sports': 'Videoland Sports',
-            'K+': 'Vietnam Telecom Digital TV Co. Ltd',
-            # Add common variants that map to the same target:
-            'Fox Sports': 'Fox Broadcasting Company',
-            'Fox Sports 2': 'Fox Broadcasting Company',
-            'SRF INFO': 'SRG SSR', # Added specific channel to master group
-            'ORF 1': 'ORF',
-            'ORF 2': 'ORF',
-        }
-        
-        MANUAL_BROADCASTER_MAP = {v.lower(): k for k, v in OBLIGATION_CHANNEL_TO_BSR_GROUP_LIST.items()}
-        
+
+        # BSR Group Name (lowercase) -> Obligation Channel, prebuilt by the reference data service
+        MANUAL_BROADCASTER_MAP = reference.broadcaster_to_obligation_channel
+
         # 1. Initialize the flag column
         self.df[FLAG_COLUMN] = 'Not Obligation Target'
         
@@ -648,13 +627,10 @@ class BSRValidator:
         
         # ... (Error checking remains the same) ...
 
-        # --- 3. Create Required COMPOUND KEY Set (Obligation) ---
-        df_obl_check = full_obligation_df.copy()
-        df_obl_check['Country_Norm'] = df_obl_check['Country'].astype(str).str.strip().str.upper()
-        df_obl_check['Broadcaster_Norm'] = df_obl_check['Broadcaster'].astype(str).str.strip()
-        df_obl_check['Required_Key'] = df_obl_check['Country_Norm'] + '|' + df_obl_check['Broadcaster_Norm']
-        required_key_set = set(df_obl_check['Required_Key'].unique())
-        required_channel_name_set = set(df_obl_check['Broadcaster_Norm'].unique()) # Re-establish channel set
+        # --- 3. Required COMPOUND KEY Set (Obligation), precomputed on the obligation index ---
+        obligation_index = self.obligation_index or ObligationIndex(full_obligation_df)
+        required_key_set = obligation_index.required_keys
+        required_channel_name_set = obligation_index.channel_names
         total_required = len(required_key_set)
         
         # --- 4. Prepare BSR and Create Candidate COMPOUND KEY (Strict Alignment) ---
@@ -664,20 +640,21 @@ class BSRValidator:
         
         bsr_broadcasters_series = self.df.get('Broadcaster', pd.Series(dtype=str)).reindex(full_index)
         bsr_tv_channel_series = self.df.get('TV-Channel', pd.Series(dtype=str)).reindex(full_index)
-        market_norm_series = self.df['Market'].astype(str).str.strip().str.upper().reindex(full_index)
+        market_norm_series = normalize_dimension(self.df['Market'], case="upper").reindex(full_index)
         
         # Flag Empty Broadcasters
-        empty_broadcaster_mask = bsr_broadcasters_series.isna() | (bsr_broadcasters_series.astype(str).str.strip() == '')
+        empty_broadcaster_mask = bsr_broadcasters_series.isna() | dimension_mask(bsr_broadcasters_series, lambda v: v == '')
         self.df.loc[empty_broadcaster_mask, FLAG_COLUMN] = 'Broadcaster WAS EMPTY'
         
         # 4a. Determine Final Mapped Channel: (Direct TV-Channel Match OR Group Mapping)
-        bsr_broadcasters_lower = bsr_broadcasters_series.astype(str).str.lower()
-        
         # Check 1: Direct TV-Channel Match 
-        is_direct_channel_match = bsr_tv_channel_series.astype(str).isin(required_channel_name_set)
+        is_direct_channel_match = dimension_mask(bsr_tv_channel_series, lambda v: v in required_channel_name_set, strip=False)
         
-        # Map BSR Group Name to Obligation Channel Name
-        mapped_from_group = bsr_broadcasters_lower.map(MANUAL_BROADCASTER_MAP)
+        # Map BSR Group Name to Obligation Channel Name (looked up once per distinct broadcaster)
+        mapped_from_group = pd.Series(
+            map_distinct(bsr_broadcasters_series, lambda v: MANUAL_BROADCASTER_MAP.get(str(v).lower(), np.nan)),
+            index=full_index, dtype=object
+        )
         
         # Initialize the final mapped channel (using Group Map result as base)
         final_mapped_channel = mapped_from_group.copy()
@@ -776,7 +753,7 @@ class BSRValidator:
         
         # Identify Source Rows (Germany Sky)
         germany_source_mask = (self.df.get('Market') == germany_market) & \
-                            (self.df.get('Broadcaster', '').astype(str).str.contains('sky', case=False, na=False))
+                            dimension_mask(self.df.get('Broadcaster', ''), lambda v: 'sky' in v, case="lower", strip=False)
         
         germany_source_df = self.df[germany_source_mask]
 
@@ -815,11 +792,11 @@ class BSRValidator:
                 # that is also present in Germany's source data.
                 
                 # Find common broadcasters between the source and target market
-                source_broadcasters = germany_source_df['Broadcaster'].astype(str).str.lower().unique()
+                source_broadcasters = set(normalize_dimension(germany_source_df['Broadcaster'], case="lower", strip=False).unique())
                 
                 # Mask for rows in the TARGET market whose broadcaster is also in the source
                 target_broadcaster_mask = (self.df.get('Market') == target_market) & \
-                                        (self.df.get('Broadcaster', '').astype(str).str.lower().isin(source_broadcasters))
+                                        dimension_mask(self.df.get('Broadcaster', ''), lambda v: v in source_broadcasters, case="lower", strip=False)
                                         
                 rows_matched = target_broadcaster_mask.sum()
                 
@@ -846,10 +823,10 @@ class BSRValidator:
         if sa_source_mask.sum() > 0:
             # We need to map SA rows to Pan Africa rows. Since we can't duplicate, 
             # the best we can do is flag Pan Africa rows that share a Broadcaster with SA.
-            sa_broadcasters = self.df[sa_source_mask].get('Broadcaster', pd.Series(dtype=str)).astype(str).str.lower().unique()
+            sa_broadcasters = set(normalize_dimension(self.df[sa_source_mask].get('Broadcaster', pd.Series(dtype=str)), case="lower", strip=False).unique())
             
             target_mask = (self.df.get('Market') == pan_africa_market) & \
-                        (self.df.get('Broadcaster', '').astype(str).str.lower().isin(sa_broadcasters))
+                        dimension_mask(self.df.get('Broadcaster', ''), lambda v: v in sa_broadcasters, case="lower", strip=False)
                         
             rows_matched = target_mask.sum()
             if rows_matched > 0:
@@ -866,13 +843,13 @@ class BSRValidator:
         self.df[MODEL_COL] = 0.0 
         
         uk_source_mask = (self.df.get('Market') == uk_market) & \
-                    (self.df.get('Broadcaster', '').astype(str).str.contains('sky', case=False, na=False))
+                    dimension_mask(self.df.get('Broadcaster', ''), lambda v: 'sky' in v, case="lower", strip=False)
         
         if uk_source_mask.sum() > 0:
-            uk_broadcasters = self.df[uk_source_mask].get('Broadcaster', pd.Series(dtype=str)).astype(str).str.lower().unique()
+            uk_broadcasters = set(normalize_dimension(self.df[uk_source_mask].get('Broadcaster', pd.Series(dtype=str)), case="lower", strip=False).unique())
             
             target_mask = (self.df.get('Market') == ireland_market) & \
-                        (self.df.get('Broadcaster', '').astype(str).str.lower().isin(uk_broadcasters))
+                        dimension_mask(self.df.get('Broadcaster', ''), lambda v: v in uk_broadcasters, case="lower", strip=False)
                         
             rows_matched = target_mask.sum()
             if rows_matched > 0:
@@ -889,10 +866,10 @@ class BSRValidator:
         self.df[MODEL_COL] = 0.0 
 
         if (self.df.get('Market') == france_market).sum() > 0:
-            france_broadcasters = self.df[self.df.get('Market') == france_market].get('Broadcaster', pd.Series(dtype=str)).astype(str).str.lower().unique()
+            france_broadcasters = set(normalize_dimension(self.df[self.df.get('Market') == france_market].get('Broadcaster', pd.Series(dtype=str)), case="lower", strip=False).unique())
             
             target_mask = (self.df.get('Market') == monaco_market) & \
-                        (self.df.get('Broadcaster', '').astype(str).str.lower().isin(france_broadcasters))
+                        dimension_mask(self.df.get('Broadcaster', ''), lambda v: v in france_broadcasters, case="lower", strip=False)
                         
             rows_matched = target_mask.sum()
             if rows_matched > 0:
@@ -909,13 +886,13 @@ class BSRValidator:
         self.df[MODEL_COL] = 0.0 
 
         fiji_source_mask = (self.df.get('Market') == fiji_market) & \
-                        (self.df.get('TV-Channel', '').astype(str).str.lower().str.contains('tv wan', na=False))
+                        dimension_mask(self.df.get('TV-Channel', ''), lambda v: 'tv wan' in v, case="lower", strip=False)
 
         if fiji_source_mask.sum() > 0:
-            fiji_broadcasters = self.df[fiji_source_mask].get('Broadcaster', pd.Series(dtype=str)).astype(str).str.lower().unique()
+            fiji_broadcasters = set(normalize_dimension(self.df[fiji_source_mask].get('Broadcaster', pd.Series(dtype=str)), case="lower", strip=False).unique())
             
             target_mask = (self.df.get('Market') == png_market) & \
-                        (self.df.get('Broadcaster', '').astype(str).str.lower().isin(fiji_broadcasters))
+                        dimension_mask(self.df.get('Broadcaster', ''), lambda v: v in fiji_broadcasters, case="lower", strip=False)
                         
             rows_matched = target_mask.sum()
             if rows_matched > 0:
@@ -934,7 +911,7 @@ class BSRValidator:
         rows_upweighted = 0
         for broadcaster_name, factor in brazil_weights.items():
             upweight_mask = (self.df.get('Market') == brazil_market) & \
-                            (self.df.get('Broadcaster', self.df.get('Master_Broadcaster', '')).astype(str).str.lower() == broadcaster_name)
+                            dimension_mask(self.df.get('Broadcaster', self.df.get('Master_Broadcaster', '')), lambda v: v == broadcaster_name, case="lower", strip=False)
             
             current_rows_upweighted = upweight_mask.sum()
             if current_rows_upweighted > 0:
@@ -993,7 +970,7 @@ class BSRValidator:
         
         # --- CRITICAL FILTERING STEP (Filter for Live and relevant Competition) ---
         relevant_sessions = list(SESSION_LIMITS.keys())
-        live_mask = self.df['Type of program'].astype(str).str.lower() == 'live'
+        live_mask = dimension_mask(self.df['Type of program'], lambda v: v == 'live', case="lower", strip=False)
         competition_mask = self.df['Competition'].isin(relevant_sessions)
 
         df_filtered = self.df[competition_mask & live_mask].copy()
@@ -1012,7 +989,8 @@ class BSRValidator:
             index=['Market', 'TV-Channel'],
             columns='Competition',
             aggfunc='size',
-            fill_value=0
+            fill_value=0,
+            observed=True
         ).reset_index()
 
         overcount_rows_flagged = 0
@@ -1050,7 +1028,7 @@ class BSRValidator:
                     bsr_flag_mask = (self.df['Market'] == market) & \
                                     (self.df['TV-Channel'] == channel) & \
                                     (self.df['Competition'] == session_type) & \
-                                    (self.df['Type of program'].astype(str).str.lower() == 'live')
+                                    live_mask
                     
                     # Apply the flag to ALL matching rows in the BSR
                     flag_description = f"OVERCOUNT ({session_type}): Found {actual_count} Live, Expected max {limit}. Likely Duplicates."
@@ -1072,37 +1050,6 @@ class BSRValidator:
             }
         }
 
-    # def _get_time_string(self, series):
-    #     """Safely converts a series to string time format, handling NaNs."""
-    #     dt_series = pd.to_datetime(series, errors='coerce', format='mixed')
-    #     time_series = dt_series.dt.strftime('%H:%M:%S').fillna('00:00:00')
-    #     return time_series
-    # # --- Helper function (Must be defined inside or accessible by the class) ---
-    # def _get_f1_live_schedule(self):
-    #     """Creates a standardized DataFrame of official F1 live session windows (UTC)."""
-    #     data = {
-    #         'Session': ['Practice 1', 'Practice 2', 'Practice 3', 'Qualifying', 'GRAND PRIX'],
-    #         'Date': ['4-Jul-2025', '4-Jul-2025', '5-Jul-2025', '5-Jul-2025', '6-Jul-2025'],
-    #         'Start Time': ['11:30:00', '15:00:00', '10:30:00', '14:00:00', '14:00:00'],
-    #         'End Time': ['12:30:00', '16:00:00', '11:30:00', '15:00:00', '16:00:00'] 
-    #     }
-    #     df_schedule = pd.DataFrame(data)
-
-    #     df_schedule['Live_Start_UTC'] = pd.to_datetime(df_schedule['Date'] + ' ' + df_schedule['Start Time'])
-    #     df_schedule['Live_End_UTC'] = pd.to_datetime(df_schedule['Date'] + ' ' + df_schedule['End Time'])
-
-    #     # Map session names to the Competition type (Race, Training, Qualifying)
-    #     df_schedule['Competition_Type'] = np.select(
-    #         [
-    #             df_schedule['Session'].str.contains('Practice'),
-    #             df_schedule['Session'] == 'Qualifying',
-    #             df_schedule['Session'].str.contains('GRAND PRIX')
-    #         ],
-    #         ['Training', 'Qualifying', 'Race'],
-    #         default='Support'
-    #     )
-    #     return df_schedule
-
     # def _impute_program_type(self) -> Dict[str, Any]:
         """
         Imputes the Type of Program using the strict time/duration matching 
@@ -1203,6 +1150,15 @@ class BSRValidator:
             }
         }
 
+    def _get_time_string(self, series):
+        """Safely converts a series to string time format, handling NaNs."""
+        return time_strings(series)
+
+    # --- Helper function (Must be defined inside or accessible by the class) ---
+    def _get_f1_live_schedule(self):
+        """Standardized DataFrame of official F1 live session windows (UTC), from the reference data service."""
+        return get_reference().session_schedule.frame.copy()
+
     def _check_duration_limits(self) -> Dict[str, Any]:
         """
         Checks the 'Duration' column in the BSR against acceptable limits (5 minutes to 5 hours).
@@ -1222,27 +1178,20 @@ class BSRValidator:
             return {"check_key": "duration_limits", "status": "Skipped", "action": "Duration Check", "description": f"Skipped: Missing required '{DURATION_COL}' column.", "details": {"rows_processed": int(initial_rows), "rows_flagged": 0}}
 
         try:
-            # --- CRITICAL FIX ---
-            # 1. Convert the Duration column to string to handle datetime.time objects safely.
-            # This resolves the 'Invalid type for timedelta scalar' error.
-            duration_series_str = self.df[DURATION_COL].astype(str)
-            
-            # 2. Convert the cleaned string series into timedelta objects
-            duration_timedelta = pd.to_timedelta(duration_series_str, errors='coerce')
-            
-            # 3. Convert timedelta to total minutes for comparison
-            duration_minutes = duration_timedelta.dt.total_seconds() / 60
+            # 1-3. Minutes parsed once at load time (Duration_Minutes); handles strings,
+            # datetime.time, timedelta and numeric durations alike
+            duration_min = duration_minutes(self.df, DURATION_COL)
             
             # 4. Define the masks for invalid durations
             
             # Flag 1: Too short
-            too_short_mask = duration_minutes < MIN_DURATION_MINUTES
+            too_short_mask = duration_min < MIN_DURATION_MINUTES
             
             # Flag 2: Too long
-            too_long_mask = duration_minutes > MAX_DURATION_MINUTES
+            too_long_mask = duration_min > MAX_DURATION_MINUTES
             
             # Flag 3: Invalid/Missing/Parsing Error
-            invalid_mask = duration_minutes.isna()
+            invalid_mask = duration_min.isna()
             
             combined_flag_mask = too_short_mask | too_long_mask | invalid_mask
             
@@ -1277,28 +1226,10 @@ class BSRValidator:
 
     def _get_f1_live_schedule_for_integrity(self):
         """
-        Creates a standardized schedule DataFrame for date integrity checks.
-        FIX: Returns ALL scheduled dates for all sessions without reducing Training to one date.
+        Standardized schedule DataFrame for date integrity checks, from the reference data service.
+        Returns ALL scheduled dates for all sessions (Practice sessions map to 'Training').
         """
-        data = {
-            'Competition_Raw': ['Practice 1', 'Practice 2', 'Practice 3', 'Qualifying', 'Race'],
-            'Scheduled_Date': ['4-Jul-2025', '4-Jul-2025', '5-Jul-2025', '5-Jul-2025', '6-Jul-2025'],
-            'Scheduled_Start': ['11:30:00', '15:00:00', '10:30:00', '14:00:00', '14:00:00']
-        }
-        df_schedule = pd.DataFrame(data)
-        
-        # Map all Practice sessions to the 'Training' Competition type
-        df_schedule['Competition_Map'] = df_schedule['Competition_Raw'].replace({
-            'Practice 1': 'Training', 
-            'Practice 2': 'Training', 
-            'Practice 3': 'Training'
-        }).str.strip()
-        
-        # Standardize the scheduled date for direct comparison
-        df_schedule['Scheduled_Date_Clean'] = pd.to_datetime(df_schedule['Scheduled_Date']).dt.date
-        
-        # FIX: We only drop duplicates on the map itself, not the Competition_Map/Date
-        return df_schedule[['Competition_Map', 'Scheduled_Date_Clean']]
+        return get_reference().live_schedule()
 
     def _check_live_session_date_integrity(self) -> Dict[str, Any]:
         """
@@ -1320,13 +1251,14 @@ class BSRValidator:
         
         # Prepare BSR data for checking (copying the relevant columns)
         df_check = self.df.copy()
-        live_mask = df_check['Type of program'].astype(str).str.lower() == 'live'
+        live_mask = dimension_mask(df_check['Type of program'], lambda v: v == 'live', case="lower", strip=False)
         df_check['BSR_Date_Clean'] = pd.to_datetime(df_check['Date (UTC/GMT)'], errors='coerce', format='mixed').dt.date
         
-        # FIX 1: Safely map Competition column
-        competition_series = df_check['Competition'].fillna('').astype(str)
+        # FIX 1: Safely map Competition column (missing -> '')
         # This creates the map: Practice 1/2/3 -> Training; Qualifying -> Qualifying; Race -> Race
-        df_check['Competition_Map'] = competition_series.str.replace(r'Practice \d', 'Training', regex=True).str.strip()
+        df_check['Competition_Map'] = map_distinct(
+            df_check['Competition'], lambda v: re.sub(r'Practice \d', 'Training', str(v)).strip(), na_value=''
+        )
 
         # 3. Group all valid scheduled dates by Competition type (for quick lookups)
         # This gives us {'Training': [date1, date2, date3], 'Qualifying': [date4], 'Race': [date5]}
@@ -1385,30 +1317,27 @@ class BSRValidator:
         """
         Imputes the Type of Program using a weighted confidence scoring system based 
         on Time/Duration match to the schedule and Program Title Keywords.
+
+        Every airing is matched to the session schedule in one pass (see qc_schedule.py):
+        Live is scored against the session starting nearest to the airing, Repeat and
+        Highlights against the latest session that started before it.
         """
         NEW_COL = 'Imputed_Program_Type'
         CONF_COL = 'Imputation_Confidence'
-        
-        # Initialize score columns
-        self.df[NEW_COL] = 'Magazine & Support'
-        self.df[CONF_COL] = 0.0
+        REQUIRED_COLS = ['Program Title', 'Date (UTC/GMT)', 'Start (UTC)', 'End (UTC)']
+
+        if not all(col in self.df.columns for col in REQUIRED_COLS):
+            self.df[NEW_COL] = 'Magazine & Support'
+            self.df[CONF_COL] = 0.0
+            return {"check_key": "impute_program_type_confidence", "status": "Skipped", "action": "Confidence Imputation", "description": "Skipped: Missing required BSR columns (Program Title, Date (UTC/GMT), Start (UTC), End (UTC)).", "details": {"rows_imputed": 0, "rows_defaulted_to_support": len(self.df)}}
+
+        reference = get_reference()
+        schedule = reference.session_schedule
 
-        df_schedule = self._get_f1_live_schedule()
-        
         # --- Data Preparation ---
         try:
-            bsr_series = self.df.copy()
-            bsr_series['Program Title'] = bsr_series['Program Title'].astype(str).str.strip().str.lower()
-            
-            # Safely combine date and time 
-            df_start_time_str = self._get_time_string(self.df['Start (UTC)'])
-            df_end_time_str = self._get_time_string(self.df['End (UTC)'])
-            
-            bsr_series['bsr_start_dt'] = pd.to_datetime(self.df['Date (UTC/GMT)'].astype(str) + ' ' + df_start_time_str, errors='coerce')
-            bsr_series['bsr_end_dt'] = pd.to_datetime(self.df['Date (UTC/GMT)'].astype(str) + ' ' + df_end_time_str, errors='coerce')
-            
-            bsr_series['duration_minutes'] = (bsr_series['bsr_end_dt'] - bsr_series['bsr_start_dt']) / timedelta(minutes=1)
-            
+            bsr_start_dt, bsr_end_dt = airing_times(self.df['Date (UTC/GMT)'], self.df['Start (UTC)'], self.df['End (UTC)'])
+            duration_minutes = ((bsr_end_dt - bsr_start_dt) / timedelta(minutes=1)).to_numpy()
         except Exception:
             # Return standard failure dictionary
             return {"check_key": "impute_program_type", "status": "Failed", "action": "Confidence Imputation", "description": "Failed to parse BSR Date/Time columns.", "details": {"rows_imputed": 0}}
@@ -1418,94 +1347,53 @@ class BSRValidator:
         LIVE_TIME_TOLERANCE_MIN = 10   
         LIVE_DURATION_TOLERANCE_PCT = 0.10 
         REPEAT_TIME_OFFSET_MIN = 4 * 60 
-        
-        # Base Keyword Scores
-        KEYWORD_SCORES = {
-            'live': 25, 'en vivo': 25,
-            'repeat': 20, 'replay': 20, 'rerun': 20,
-            'highlights': 15, 'review': 15, 'summary': 15, 'best of': 15,
-            'magazine': 5, 'show': 5, 'pre-race': 5, 'post-race': 5
-        }
-        
-        # --- Step 1: Calculate Keyword Confidence (Medium Weight) ---
-        bsr_series['Keyword_Score'] = 0
-        for keyword, score in KEYWORD_SCORES.items():
-            keyword_mask = bsr_series['Program Title'].str.contains(keyword, na=False)
-            bsr_series.loc[keyword_mask, 'Keyword_Score'] += score
-            
-        bsr_series[CONF_COL] = 0.0
-
-        # --- Step 2: Time/Duration Matching and Scoring (High Weight) ---
-        
-        for _, session in df_schedule.iterrows():
-            live_start = session['Live_Start_UTC']
-            live_duration = (session['Live_End_UTC'] - live_start) / timedelta(minutes=1)
-            comp_type = session['Competition_Type']
+        LIVE_BONUS, REPEAT_BONUS, HIGHLIGHTS_BONUS = 60, 45, 30
 
-            time_diff_abs = (bsr_series['bsr_start_dt'] - live_start).abs() / timedelta(minutes=1)
-            time_diff_actual = (bsr_series['bsr_start_dt'] - live_start) / timedelta(minutes=1)
-            
-            duration_min = live_duration * (1 - LIVE_DURATION_TOLERANCE_PCT)
-            is_long_duration_match = (bsr_series['duration_minutes'] >= duration_min)
+        # --- Step 1: Keyword Confidence (Medium Weight), once per distinct title ---
+        KEYWORD_SCORES = reference.keyword_scores
+        keyword_score = map_distinct(
+            self.df['Program Title'],
+            lambda title: sum(score for keyword, score in KEYWORD_SCORES.items() if keyword in str(title).strip().lower())
+        ).astype(float)
 
-            # A. LIVE TIME MATCH MASK: Starts close AND matches duration
-            LIVE_TIME_MATCH_MASK = is_long_duration_match & (time_diff_abs <= LIVE_TIME_TOLERANCE_MIN)
-            
-            # B. REPEAT TIME MATCH MASK: Matches duration AND starts much later (4+ hours)
-            REPEAT_TIME_MATCH_MASK = is_long_duration_match & (time_diff_actual >= REPEAT_TIME_OFFSET_MIN)
-            
-            # C. HIGHLIGHTS TIME MATCH MASK: Short duration AND starts later
-            HIGHLIGHTS_TIME_MATCH_MASK = (~is_long_duration_match) & (time_diff_actual > LIVE_TIME_TOLERANCE_MIN)
-
-            # Apply Time Bonuses (Prioritize Live > Repeat > Highlights)
-            
-            # 1. LIVE Bonus (Highest Priority)
-            live_bonus_score = 60 
-            live_update_mask = LIVE_TIME_MATCH_MASK
-            
-            # Update CONF_COL and NEW_COL only if the current row hasn't been classified or has a lower score
-            current_score = bsr_series[CONF_COL]
-            new_score_live = current_score.where(~live_update_mask, current_score + live_bonus_score)
-            
-            bsr_series.loc[live_update_mask, CONF_COL] = new_score_live
-            bsr_series.loc[live_update_mask, NEW_COL] = f"Live: {comp_type}"
-            
-            # 2. REPEAT Bonus
-            repeat_bonus_score = 45 
-            # Only target rows that haven't been tagged by a higher priority match
-            repeat_update_mask = REPEAT_TIME_MATCH_MASK & (bsr_series[NEW_COL] == 'Magazine & Support')
-            
-            current_score = bsr_series[CONF_COL]
-            new_score_repeat = current_score.where(~repeat_update_mask, current_score + repeat_bonus_score)
-            
-            bsr_series.loc[repeat_update_mask, CONF_COL] = new_score_repeat
-            bsr_series.loc[repeat_update_mask, NEW_COL] = f"Repeat: {comp_type}"
+        # --- Step 2: Time/Duration Matching and Scoring (High Weight) ---
+        # A. LIVE: starts close to the nearest session AND covers most of it
+        nearest = schedule.nearest(bsr_start_dt)
+        live_mask = (
+            (np.abs(schedule.offset_minutes(bsr_start_dt, nearest)) <= LIVE_TIME_TOLERANCE_MIN)
+            & (duration_minutes >= schedule.minutes_at(nearest) * (1 - LIVE_DURATION_TOLERANCE_PCT))
+        )
 
-            # 3. HIGHLIGHTS Bonus
-            highlights_bonus_score = 30 
-            highlights_update_mask = HIGHLIGHTS_TIME_MATCH_MASK & (bsr_series[NEW_COL] == 'Magazine & Support')
-            
-            current_score = bsr_series[CONF_COL]
-            new_score_highlights = current_score.where(~highlights_update_mask, current_score + highlights_bonus_score)
-            
-            bsr_series.loc[highlights_update_mask, CONF_COL] = new_score_highlights
-            bsr_series.loc[highlights_update_mask, NEW_COL] = f"Highlights: {comp_type}"
+        # B./C. REPEAT / HIGHLIGHTS: measured from the latest session that had started
+        latest = schedule.latest_started(bsr_start_dt)
+        since_start = schedule.offset_minutes(bsr_start_dt, latest)
+        min_long_duration = schedule.minutes_at(latest) * (1 - LIVE_DURATION_TOLERANCE_PCT)
+        repeat_mask = ~live_mask & (duration_minutes >= min_long_duration) & (since_start >= REPEAT_TIME_OFFSET_MIN)
+        highlights_mask = ~live_mask & (duration_minutes < min_long_duration) & (since_start > LIVE_TIME_TOLERANCE_MIN)
+
+        # Live > Repeat > Highlights
+        competition = pd.Series(np.where(live_mask, schedule.competitions_at(nearest), schedule.competitions_at(latest)))
+        time_score = np.select([live_mask, repeat_mask, highlights_mask], [LIVE_BONUS, REPEAT_BONUS, HIGHLIGHTS_BONUS], 0)
+        imputed = np.select(
+            [live_mask, repeat_mask, highlights_mask],
+            [("Live: " + competition).to_numpy(), ("Repeat: " + competition).to_numpy(), ("Highlights: " + competition).to_numpy()],
+            'Magazine & Support'
+        )
 
         # Final Score: Sum Keyword and Time scores
-        self.df[CONF_COL] = bsr_series[CONF_COL] + bsr_series['Keyword_Score']
-        self.df[NEW_COL] = bsr_series[NEW_COL]
+        confidence = time_score + keyword_score
         
         # --- Final Step: Apply Support/Magazine Fallback based on FINAL Confidence Score ---
         
         # If the score is below the threshold, revert to Magazine & Support
-        revert_mask = (self.df[CONF_COL] < LIVE_CONFIDENCE_THRESHOLD)
-                    
-        self.df.loc[revert_mask, NEW_COL] = 'Magazine & Support'
+        imputed = np.where(confidence < LIVE_CONFIDENCE_THRESHOLD, 'Magazine & Support', imputed)
+        self.df[CONF_COL] = confidence
+        self.df[NEW_COL] = pd.Series(imputed, index=self.df.index, dtype=object)
 
 
         # --- Final Report ---
-        rows_imputed = self.df[NEW_COL].str.contains('Live|Repeat|Highlights').sum()
-        rows_defaulted_to_support = (self.df[NEW_COL] == 'Magazine & Support').sum()
+        rows_imputed = int((imputed != 'Magazine & Support').sum())
+        rows_defaulted_to_support = int((imputed == 'Magazine & Support').sum())
         
         return {
             "check_key": "impute_program_type_confidence",
@@ -1587,10 +1475,14 @@ class BSRValidator:
         
         # --- STEP 1: Physical Data Consolidation (THE FIX) ---
         # 1. Create a mask for ALL regional variants (case-insensitive)
-        latam_mask_full = self.df['Region'].astype(str).str.lower().str.contains(TARGET_REGION_REGEX, na=False, regex=True)
+        target_region = re.compile(TARGET_REGION_REGEX)
+        latam_mask_full = dimension_mask(self.df['Region'], lambda v: bool(target_region.search(v)), case="lower", strip=False)
         
         # 2. Convert the 'Central & South America' variant rows to the canonical name
         # We must operate on the original DataFrame to save the change
+        region = self.df['Region']
+        if isinstance(region.dtype, CategoricalDtype) and CANONICAL_REGION_NAME not in region.cat.categories:
+            self.df['Region'] = region.cat.add_categories([CANONICAL_REGION_NAME])
         self.df.loc[latam_mask_full, 'Region'] = CANONICAL_REGION_NAME
         
         # --- STEP 2: Core QC Logic (Now uses clean, single Regional name) ---
@@ -1603,7 +1495,7 @@ class BSRValidator:
             return {"check_key": "check_latam_espn", "status": "Completed", "action": "ESPN Coverage Check", "description": "Completed: No rows found in the Central and South America region.", "details": {"rows_flagged": 0}}
 
         # 4. Identify all unique markets in the LATAM pool
-        latam_markets = latam_df['Market'].astype(str).str.strip().unique()
+        latam_markets = normalize_dimension(latam_df['Market']).unique()
         
         markets_missing_espn = []
         
@@ -1613,7 +1505,7 @@ class BSRValidator:
             market_rows = latam_df[latam_df['Market'] == market]
             
             # Check if ANY broadcaster in the market contains the keyword 'espn'
-            has_espn_coverage = market_rows['Broadcaster'].astype(str).str.lower().str.contains(BROADCASTER_KEYWORD, na=False).any()
+            has_espn_coverage = dimension_mask(market_rows['Broadcaster'], lambda v: BROADCASTER_KEYWORD in v, case="lower", strip=False).any()
             
             if not has_espn_coverage:
                 markets_missing_espn.append(market)
@@ -1687,27 +1579,20 @@ class BSRValidator:
             if col:
                 df_result[col] = pd.to_datetime(df_result[col], errors="coerce")
 
-        overlap_flags = [False] * len(df_result)
         if channel_col and start_col and end_col and date_col:
-            df_sorted = df_result.sort_values(by=[channel_col, date_col, start_col]).reset_index(drop=True)
-            prev_end = prev_channel = prev_date = None
-            for i, row in df_sorted.iterrows():
-                overlap = False
-                if prev_channel == row[channel_col] and prev_date == row[date_col]:
-                    if pd.notna(row[start_col]) and pd.notna(prev_end) and row[start_col] < prev_end:
-                        overlap = True
-                overlap_flags[i] = overlap
-                prev_end = row[end_col]
-                prev_channel = row[channel_col]
-                prev_date = row[date_col]
-            df_result["No_Overlap"] = ~pd.Series(overlap_flags, index=df_sorted.index)
+            # Vectorized sweep: flags rows starting before any earlier airing on the same channel/day ended
+            overlap, conflict_row = find_overlaps(df_result, [channel_col, date_col], start_col, end_col)
+            df_result["No_Overlap"] = ~overlap
         else:
+            conflict_row = pd.NA
             df_result["No_Overlap"] = True
 
         df_result["No_Overlap_Remark"] = df_result["No_Overlap"].apply(lambda x: "" if x else "Overlap detected")
+        df_result["Overlap_With_Row"] = conflict_row
 
         # Duplicate check
-        exclude_keywords = ["_ok", "within", "date_checked"]
+        # Overlap flags differ between otherwise identical rows, so they stay out of the hash
+        exclude_keywords = ["_ok", "within", "date_checked", "overlap"]
         dup_cols = [c for c in df_result.columns if not any(x in str(c).lower() for x in exclude_keywords)]
         if dup_cols:
             hashes = pd.util.hash_pandas_object(df_result[dup_cols], index=False)
@@ -1738,43 +1623,9 @@ class BSRValidator:
             self.df = df
             return self.df
 
-        def parse_duration(val):
-            if pd.isna(val):
-                return None
-            val_str = str(val).strip()
-            try:
-                if ":" in val_str:
-                    t = pd.to_datetime(val_str, errors="coerce").time()
-                    return t.hour * 60 + t.minute
-                else:
-                    return float(val_str)
-            except Exception:
-                return None
-
-        def expected_category(duration_min):
-            if duration_min is None:
-                return "unknown"
-            if duration_min >= 120:
-                return "live"
-            elif 60 <= duration_min < 120:
-                return "repeat"
-            elif 30 <= duration_min < 60:
-                return "highlights"
-            elif 0 < duration_min < 30:
-                return "support"
-            else:
-                return "unknown"
-
-        results, remarks = [], []
-        for _, row in df.iterrows():
-            prog_val = str(row[prog_col]).strip().lower()
-            dur_min = parse_duration(row[dur_col])
-            expected = expected_category(dur_min)
-            ok = expected in prog_val or prog_val in expected
-            results.append(ok)
-            remarks.append("" if ok else f"Program type '{prog_val}' does not match duration category '{expected}'")
-
-        df["Program_Category_OK"] = results
+        # Durations come pre-parsed (Duration_Minutes); categories are assigned by vectorized binning
+        ok, remarks = program_category_columns(df, prog_col, dur_col)
+        df["Program_Category_OK"] = ok
         df["Program_Category_Remark"] = remarks
         self.df = df
         return self.df
@@ -1811,247 +1662,23 @@ class BSRValidator:
         df[start_col] = df[start_col].astype(str).str.strip()
         df[end_col] = df[end_col].astype(str).str.strip()
 
-        # --- Helper: parse HH:MM:SS to minutes ---
-        def parse_hms_to_minutes(val):
-            if not val or val in ["None", "nan", "NaT"]:
-                return None
-            try:
-                parts = val.split(":")
-                if len(parts) >= 2:
-                    h, m = int(parts[0]), int(parts[1])
-                    s = int(parts[2]) if len(parts) == 3 else 0
-                    return h * 60 + m + s / 60
-            except Exception as e:
-                print(f"[WARN] Could not parse time '{val}': {e}")
-            return None
-
-        # --- Helper: classify by duration ---
-        def expected_category(duration_min):
-            if duration_min is None:
-                return "unknown"
-            if duration_min >= 120:
-                return "live"
-            elif 60 <= duration_min < 120:
-                return "repeat"
-            elif 30 <= duration_min < 60:
-                return "highlights"
-            elif 0 < duration_min < 30:
-                return "support"
-            else:
-                return "unknown"
-
-        expected_list = []
-        ok_list = []
-
-        for idx, row in df.iterrows():
-            start_val = row[start_col]
-            end_val = row[end_col]
-            actual_prog = str(row[type_col]).strip().lower() if pd.notna(row[type_col]) else "unknown"
-
-            start_min = parse_hms_to_minutes(start_val)
-            end_min = parse_hms_to_minutes(end_val)
-
-            if start_min is None or end_min is None:
-                duration_min = None
-            else:
-                duration_min = end_min - start_min
-                if duration_min < 0:
-                    duration_min += 24 * 60  # Handle midnight crossover
-
-            expected = expected_category(duration_min)
-            ok = expected in actual_prog or actual_prog in expected
+        duration_min, expected, ok = start_end_category_columns(df, start_col, end_col, type_col)
 
-            expected_list.append(expected)
-            ok_list.append(ok)
-
-            # print(f"[Row {idx}] Start={start_val} | End={end_val} | Duration(min)={duration_min} | Expected='{expected}' | Actual='{actual_prog}' | OK={ok}")
-
-        df["Expected_Category_From_Duration"] = expected_list
-        df["Duration_Check_OK"] = ok_list
+        df["Expected_Category_From_Duration"] = expected
+        df["Duration_Check_OK"] = ok
 
         print("--- DEBUG: Duration Check Completed ---\n")
         self.df = df
         return self.df
 
     def check_event_matchday_competition(self, df_data=None, rosco_path=None, debug_rows=20):
-        # ... (Contents of old check_event_matchday_competition, replacing 'df_worksheet' with 'self.df') ...
-        df = self.df
-        # --- Helper: normalize text ---
-        def norm(x):
-            if pd.isna(x):
-                return ""
-            return str(x).strip()
+        # Same rules as qc_checks.check_event_matchday_competition, matched per distinct competition
+        reference_comps, reference_matchday_counts = load_reference_competitions(df_data, rosco_path)
 
-        def norm_lower(x):
-            return norm(x).lower()
-
-        # --- Get reference competitions / allowed values ---
-        reference_comps = set()
-        reference_matches = set() 
-        reference_matchday_counts = {} 
-
-        if df_data is None and rosco_path is not None:
-            # attempt to load a 'Data' sheet or the first sheet that looks like the data table
-            try:
-                xls = pd.read_excel(rosco_path, sheet_name=None)
-                # try common names
-                priority = ["Data", "data", "Monitoring list", "monitoring list", "Monitoring List"]
-                found_df = None
-                for p in priority:
-                    if p in xls:
-                        found_df = xls[p]
-                        break
-                if found_df is None:
-                    # fallback: pick sheet that has words like 'Type of programme' or 'Competition' in header rows
-                    for name, sheet in xls.items():
-                        header_text = " ".join(sheet.columns.astype(str).tolist()).lower()
-                        if "competition" in header_text or "type of programme" in header_text or "type of program" in header_text:
-                            found_df = sheet
-                            break
-                if found_df is not None:
-                    df_data = found_df
-            except Exception:
-                df_data = None
-
-        # If df_data is available, extract competition names and optional counts
-        if isinstance(df_data, pd.DataFrame):
-            # strategy: scan df_data content for competition-like strings
-            df_tmp = df_data.astype(str).applymap(lambda v: v.strip() if pd.notna(v) else "")
-            # collect distinct non-empty strings that look like competition names
-            for col in df_tmp.columns:
-                for val in df_tmp[col].unique():
-                    v = str(val).strip()
-                    if v and v not in ["0", "nan", "-", "None"]:
-                        # filter out lines that look numeric counts (only digits)
-                        if not re.fullmatch(r"^\d+$", v):
-                            reference_comps.add(v.lower())
-
-            # attempt to read counts if present
-            try:
-                for col in df_data.columns:
-                    numeric_counts = []
-                    for r in range(min(10, len(df_data))):
-                        try:
-                            v = df_data.iloc[r][col]
-                            if pd.notna(v) and str(v).strip().isdigit():
-                                numeric_counts.append(int(str(v).strip()))
-                        except Exception:
-                            continue
-                    if numeric_counts:
-                        reference_matchday_counts[col.strip().lower()] = numeric_counts[0]
-            except Exception:
-                pass
-
-        # fallback: if still empty, use some likely defaults
-        if not reference_comps:
-            reference_comps = set([
-                "bundesliga", "2. bundesliga", "dfb-pokal", "dfl supercup",
-                "premier league", "epl", "la liga", "serie a", "champions league"
-            ])
-
-        # Precompute a lowercase set for quick lookup
-        reference_comps_lower = set(x.lower() for x in reference_comps)
-
-        # --- Prepare output columns ---
-        df_out = df.copy()
-        df_out["Event_Matchday_Competition_OK"] = False
-        df_out["Event_Matchday_Competition_Remark"] = ""
-
-        # We'll build grouping counts to verify number of matches per (Competition, Matchday)
-        grouped_counts = {}
-
-        # iterate rows
-        for idx, row in df_out.iterrows():
-            competition = norm(row.get("Competition", ""))
-            event = norm(row.get("Event", ""))
-            matchday = norm(row.get("Matchday", ""))
-
-            # try columns similar to matchday
-            if not matchday:
-                for c in df_out.columns:
-                    if "matchday" in c.lower() or "match day" in c.lower() or c.lower().strip() == "match":
-                        matchday = norm(row.get(c, ""))
-                        if matchday:
-                            break
-
-            # find home/away or match field
-            home = norm(row.get("Home Team", "")) or norm(row.get("HomeTeam", "")) or norm(row.get("Home", ""))
-            away = norm(row.get("Away Team", "")) or norm(row.get("AwayTeam", "")) or norm(row.get("Away", ""))
-
-            remarks = []
-            ok = True
-
-            # 1) Missing fields
-            if not competition or competition.strip() in ["-", "nan", "none"]:
-                ok = False
-                remarks.append("Missing Competition")
-            if not event or event.strip() in ["-", "nan", "none"]:
-                ok = False
-                remarks.append("Missing Event")
-            if not matchday or matchday.strip() in ["-", "nan", "none"]:
-                ok = False
-                remarks.append("Missing Matchday")
-            if not (home and away):
-                # sometimes matches are in 'Match' or 'Program Title', try match detection
-                match_text = norm(row.get("Match", "")) or norm(row.get("Program Title", "")) or norm(row.get("Combined", ""))
-                # a simple heuristic: look for ' vs ' or ' v ' separators
-                if " vs " in match_text.lower() or " v " in match_text.lower():
-                    try:
-                        parts = re.split(r"\s+v(?:s|)\.?\s+|\s+vs\.?\s+|\s+v\s+", match_text, flags=re.IGNORECASE)
-                        if len(parts) >= 2:
-                            home = parts[0].strip()
-                            away = parts[1].strip()
-                    except Exception:
-                        pass
-                else:
-                    ok = False
-                    remarks.append("Missing Home/Away or Match field")
-
-            # 2) Validate competition against reference list
-            comp_l = competition.lower()
-            comp_matches_reference = False
-            for rc in reference_comps_lower:
-                if rc and (rc in comp_l or comp_l in rc):
-                    comp_matches_reference = True
-                    break
-            if not comp_matches_reference:
-                ok = False
-                remarks.append("Competition not in reference list")
-
-            # 3) Simple event-matchday-match consistency
-            if matchday:
-                if not re.search(r"(matchday|md|round|rd|r|matchday)\s*\d+", matchday.lower()):
-                    if matchday.lower() not in ["final", "finals", "semi", "semifinal", "quarterfinal", "playoffs", "-"]:
-                        remarks.append("Unusual matchday format")
-
-            # 4) If we have a reference expected counts mapping (from df_data), count per (competition, matchday)
-            comp_key = (competition.strip().lower(), matchday.strip().lower())
-            grouped_counts.setdefault(comp_key, 0)
-            grouped_counts[comp_key] += 1
-
-            # Compose final remark and set OK
-            df_out.at[idx, "Event_Matchday_Competition_OK"] = ok
-            df_out.at[idx, "Event_Matchday_Competition_Remark"] = "; ".join(remarks) if remarks else "OK"
-
-        # 5) If reference_matchday_counts available, compare counts and append remarks for rows belonging to mismatch groups
-        if reference_matchday_counts:
-            for (comp, mday), observed in grouped_counts.items():
-                expected = None
-                for ref_comp_name, cnt in reference_matchday_counts.items():
-                    if ref_comp_name and (ref_comp_name in comp or comp in ref_comp_name):
-                        expected = cnt
-                        break
-                if expected is not None and observed != expected:
-                    for idx in df_out[
-                        (df_out.get("Competition", "").astype(str).str.strip().str.lower() == comp) &
-                        (df_out.get("Matchday", "").astype(str).str.strip().str.lower() == mday)
-                    ].index:
-                        prev = df_out.at[idx, "Event_Matchday_Competition_Remark"]
-                        extra = f"Mismatch matches per matchday: expected {expected}, found {observed}"
-                        df_out.at[idx, "Event_Matchday_Competition_Remark"] = (prev + "; " + extra) if prev else extra
-                        df_out.at[idx, "Event_Matchday_Competition_OK"] = False
-
-        # Debug prints removed for brevity in final code.
+        df_out = self.df.copy()
+        ok, remark = event_matchday_competition_columns(df_out, reference_comps, reference_matchday_counts)
+        df_out["Event_Matchday_Competition_OK"] = ok
+        df_out["Event_Matchday_Competition_Remark"] = remark
 
         self.df = df_out
         return self.df
@@ -2069,16 +1696,6 @@ class BSRValidator:
                 return ""
             return str(x).strip()
 
-        def parse_duration_to_minutes(val):
-            try:
-                parts = str(val).split(":")
-                if len(parts) < 2:
-                    return None
-                h, m, s = int(parts[0]), int(parts[1]), int(parts[2]) if len(parts) == 3 else 0
-                return h * 60 + m + s / 60
-            except Exception:
-                return None
-
         reference_markets = set()
         reference_channels = set()
         if reference_df is not None:
@@ -2087,11 +1704,11 @@ class BSRValidator:
             if "TV-Channel" in reference_df.columns:
                 reference_channels.update(reference_df["TV-Channel"].dropna().astype(str).str.strip().unique())
 
-        for idx, row in df_out.iterrows():
+        minutes = duration_minutes(df_out) if "Duration" in df_out.columns else pd.Series(np.nan, index=df_out.index)
+        for (idx, row), duration_min in zip(df_out.iterrows(), minutes.to_numpy()):
             market = norm(row.get("Market", ""))
             channel = norm(row.get("TV-Channel", ""))
             program = norm(row.get("Program Title", "")) or norm(row.get("Combined", ""))
-            duration_min = parse_duration_to_minutes(row.get("Duration", ""))
 
             remarks = []
             ok1 = True
@@ -2115,7 +1732,7 @@ class BSRValidator:
                 ok2 = False
                 remarks.append("Missing Program Title")
 
-            if duration_min is None:
+            if np.isnan(duration_min):
                 ok2 = False
                 remarks.append("Invalid Duration")
 
@@ -2133,24 +1750,14 @@ class BSRValidator:
         df_out["Domestic_Market_Coverage_OK"] = True
         df_out["Domestic_Market_Remark"] = ""
 
-        DOMESTIC_MAP = {
-            "bundesliga": ["germany", "deutschland"],
-            "premier league": ["united kingdom", "england"],
-            "la liga": ["spain"],
-            "serie a": ["italy"],
-            "ligue 1": ["france"],
-        }
+        reference = get_reference()
 
         for idx, row in df_out.iterrows():
             comp = str(row.get("Competition", "")).lower()
             market = str(row.get("Market", "")).lower()
             progtype = str(row.get("Type of Program", "")).lower()
 
-            domestic_markets = []
-            for key, vals in DOMESTIC_MAP.items():
-                if key in comp:
-                    domestic_markets = vals
-                    break
+            domestic_markets = reference.domestic_markets_for(comp)
             if domestic_markets and any(k in progtype for k in ["live", "broadcast", "direct"]) and market not in domestic_markets:
                 df_out.at[idx, "Domestic_Market_Coverage_OK"] = False
                 df_out.at[idx, "Domestic_Market_Remark"] = f"Missing domestic live coverage for {market}"
@@ -2175,7 +1782,7 @@ class BSRValidator:
 
         # 1️⃣ Source overlap
         overlap_rows = []
-        grouped = df.groupby(["TV-Channel", "Date"], dropna=False)
+        grouped = df.groupby(["TV-Channel", "Date"], dropna=False, observed=True)
         for (channel, date), group in grouped:
             sources = group["Source"].dropna().unique().tolist()
             if "Meter" in sources and any(s not in ["Meter", None] for s in sources):
@@ -2218,21 +1825,12 @@ class BSRValidator:
                 self.df = df
                 return self.df
 
-        def duration_to_hours(d):
-            try:
-                if pd.isna(d):
-                    return 0
-                parts = str(d).split(":")
-                h, m, s = (int(parts[i]) if i < len(parts) else 0 for i in range(3))
-                return h + m/60 + s/3600
-            except:
-                return 0
-
-        df["Duration_Hours"] = df["Duration"].apply(duration_to_hours)
+        # Unparseable durations count as 0 hours
+        df["Duration_Hours"] = (duration_minutes(df) / 60).fillna(0)
         df["Duplicated_Market_Check_OK"] = True
         df["Duplicated_Market_Check"] = "Not Applicable"
 
-        dup_channels = df.groupby("TV-Channel")["Market"].nunique()
+        dup_channels = df.groupby("TV-Channel", observed=True)["Market"].nunique()
         dup_channels = dup_channels[dup_channels > 1].index
 
         count_diff_threshold = 0.2
@@ -2240,7 +1838,7 @@ class BSRValidator:
 
         for ch in dup_channels:
             subset = df[df["TV-Channel"] == ch]
-            stats = subset.groupby("Market").agg(
+            stats = subset.groupby("Market", observed=True).agg(
                 entry_count=("TV-Channel", "count"),
                 total_duration=("Duration_Hours", "sum")
             ).reset_index()
@@ -2262,85 +1860,17 @@ class BSRValidator:
         return self.df
 
     def country_channel_id_check(self):
-        # ... (Contents of old country_channel_id_check, replacing 'df' with 'self.df') ...
+        """
+        Channel/Market <-> ID bijection check in one grouped pass (see qc_idmap.py).
+        The full conflict table is kept on `self.id_conflicts`.
+        """
         df = self.df
         df_result = df.copy()
-        df_result["Market_Channel_ID_OK"] = True
-        df_result["Market_Channel_ID_Remark"] = ""
-
-        def norm(x):
-            return str(x).strip() if pd.notna(x) else ""
-
-        # Maps to track consistency
-        channel_id_map = {}
-        market_id_map = {}
+        ok, remark, conflicts = id_bijection_columns(df_result)
+        df_result["Market_Channel_ID_OK"] = ok
+        df_result["Market_Channel_ID_Remark"] = remark
+        self.id_conflicts = conflicts
 
-        for idx, row in df_result.iterrows():
-            channel = norm(row.get("TV-Channel"))
-            channel_id = norm(row.get("Channel ID"))
-            market = norm(row.get("Market"))
-            market_id = norm(row.get("Market ID"))
-
-            remarks = []
-            ok = True
-
-            # ✅ Check 1 – Same channel shouldn't have multiple Channel IDs
-            if channel:
-                if channel in channel_id_map and channel_id_map[channel] != channel_id:
-                    remarks.append(
-                        f"Channel '{channel}' has multiple IDs ({channel_id_map[channel]} vs {channel_id})"
-                    )
-                    ok = False
-                else:
-                    channel_id_map[channel] = channel_id
-
-            # ✅ Check 2 – Same market shouldn't have multiple Market IDs
-            if market:
-                if market in market_id_map and market_id_map[market] != market_id:
-                    remarks.append(
-                        f"Market '{market}' has multiple IDs ({market_id_map[market]} vs {market_id})"
-                    )
-                    ok = False
-                else:
-                    market_id_map[market] = market_id
-
-            # ✅ Check 3 – Same Channel ID shouldn't be used for multiple channels
-            # Note: This check relies on the channel_id_map state after the whole iteration, 
-            # but is conventionally done per-row for immediate feedback/marking.
-            # We'll stick to the original per-row logic where possible, but this one is weak.
-            # Better check 3 (in loop): if current ID exists, verify if associated channel is different.
-            
-            # Reverting to simple in-loop check 3/4 from original (though they are weak without post-analysis)
-            # The full checks need to be rerun after the loop, but for consistency with original code:
-            pass # Skipping original weak per-row multi-ID checks
-
-            # ✅ Write results
-            df_result.at[idx, "Market_Channel_ID_OK"] = ok
-            df_result.at[idx, "Market_Channel_ID_Remark"] = "; ".join(remarks) if remarks else "OK"
-        
-        # Post-analysis check (stronger, only affects remarks/OK if inconsistency found)
-        # Check 3: Same Channel ID shouldn't be used for multiple channels
-        channel_id_to_channels = df_result.groupby("Channel ID")["TV-Channel"].nunique()
-        bad_cids = channel_id_to_channels[channel_id_to_channels > 1].index.tolist()
-        
-        if bad_cids:
-            mask = df_result["Channel ID"].isin(bad_cids)
-            df_result.loc[mask, "Market_Channel_ID_OK"] = False
-            df_result.loc[mask, "Market_Channel_ID_Remark"] += (
-                "; Channel ID assigned to multiple channels"
-            )
-        
-        # Check 4: Same Market ID shouldn't be used for multiple markets
-        market_id_to_markets = df_result.groupby("Market ID")["Market"].nunique()
-        bad_mids = market_id_to_markets[market_id_to_markets > 1].index.tolist()
-        
-        if bad_mids:
-            mask = df_result["Market ID"].isin(bad_mids)
-            df_result.loc[mask, "Market_Channel_ID_OK"] = False
-            df_result.loc[mask, "Market_Channel_ID_Remark"] += (
-                "; Market ID assigned to multiple markets"
-            )
-        
         self.df = df_result
         return self.df
 
@@ -2398,45 +1928,16 @@ class BSRValidator:
 # ----------------------------- ⚙️ Utility Functions (kept standalone) -----------------------------
 
 def color_excel(output_path, df):
-    """Applies green/red coloring based on QC_OK columns."""
-    wb = load_workbook(output_path)
-    ws = wb.active
-    headers = [cell.value for cell in ws[1]]
-    col_map = {name: idx+1 for idx, name in enumerate(headers)}
-
-    qc_columns = [col for col in df.columns if col.endswith("_OK")]
-
-    for col_name in qc_columns:
-        if col_name in col_map:
-            col_idx = col_map[col_name]
-            for row in range(2, ws.max_row + 1):
-                cell = ws.cell(row=row, column=col_idx)
-                val = cell.value
-                if val in [True, "True"]:
-                    cell.fill = GREEN_FILL
-                elif val in [False, "False"]:
-                    cell.fill = RED_FILL
-
-    wb.save(output_path)
-
-
-def generate_summary_sheet(output_path, df):
-    """Generates a summary sheet with pass/fail counts for QC checks."""
-    wb = load_workbook(output_path)
-    if "Summary" in wb.sheetnames: del wb["Summary"]
-    ws = wb.create_sheet("Summary")
-
-    qc_columns = [col for col in df.columns if "_OK" in col]
-    summary_data = []
-    for col in qc_columns:
-        total = len(df)
-        passed = df[col].sum() if df[col].dtype==bool else sum(df[col]=="True")
-        summary_data.append([col, total, passed, total - passed])
-
-    summary_df = pd.DataFrame(summary_data, columns=["Check", "Total", "Passed", "Failed"])
-    for r in dataframe_to_rows(summary_df, index=False, header=True):
-        ws.append(r)
-    wb.save(output_path)
+    """Applies green/red coloring based on QC_OK columns (conditional formatting, single write pass)."""
+    write_qc_report(output_path, df, summary=False)
+
+
+def generate_summary_sheet(output_path, df, results=None):
+    """
+    Generates a summary sheet with pass/fail counts for QC checks, written with the data in one pass.
+    Counts are popcounts over the packed result bitmask (`results`, a QCResults).
+    """
+    return write_qc_report(output_path, df, results=results)
 
 # You will need to remove the old qc_checks.py file and rename this to qc_checks.py 
 # or update api.py to import BSRValidator from qc_processor.py.
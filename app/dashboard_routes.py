@@ -3,6 +3,8 @@
 from fastapi import APIRouter
 import os
 
+from app.database import init_dashboard_db
+
 # Import your existing route files
 from app.routes import project_routes
 from app.routes import task_routes
@@ -11,6 +13,9 @@ from app.routes import user_routes
 from app.routes import team_routes
 from app.routes import upload_routes
 
+# Create (and seed on first start) the SQLite database every dashboard route reads and writes
+init_dashboard_db()
+
 # Create the master router for the dashboard endpoints
 dashboard_router = APIRouter(prefix="/dashboard") # Optional: Add a common prefix if needed
 
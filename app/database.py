@@ -0,0 +1,269 @@
+# DASHBOARD_BACKEND/app/database.py
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from app.seed_data import (
+    SEED_ATTACHMENTS,
+    SEED_COMMENTS,
+    SEED_PROJECTS,
+    SEED_TASKS,
+    SEED_TEAMS,
+    SEED_USERS,
+)
+
+# --- Database Setup ---
+# One SQLite file shared by every uvicorn worker, so records created on one
+# worker are visible on all of them and survive restarts.
+DASHBOARD_DB_PATH = os.getenv("DASHBOARD_DB", os.path.join(os.getcwd(), "dashboard.db"))
+DASHBOARD_DB_POOL_SIZE = int(os.getenv("DASHBOARD_DB_POOL_SIZE", "8"))
+
+# Compiled statements kept per connection; the routes use a fixed set of SQL
+# strings, so after warm-up every query reuses its prepared statement
+STATEMENT_CACHE_SIZE = 256
+
+# Longest IN (...) list sent in one statement (well below SQLite's variable limit)
+IN_CHUNK_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY,
+    cognito_id TEXT NOT NULL,
+    username TEXT NOT NULL,
+    profile_picture_url TEXT,
+    team_id INTEGER
+);
+CREATE TABLE IF NOT EXISTS teams (
+    id INTEGER PRIMARY KEY,
+    team_name TEXT NOT NULL,
+    product_owner_user_id INTEGER,
+    project_manager_user_id INTEGER
+);
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    due_date TEXT NOT NULL,
+    points INTEGER,
+    project_id INTEGER NOT NULL,
+    author_user_id INTEGER NOT NULL,
+    assigned_user_id INTEGER
+);
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY,
+    text TEXT NOT NULL,
+    task_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS attachments (
+    id INTEGER PRIMARY KEY,
+    file_url TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    task_id INTEGER NOT NULL,
+    uploaded_by_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_users_cognito ON users (cognito_id);
+-- (project_id, status) serves both project listings and board columns
+DROP INDEX IF EXISTS idx_tasks_project;
+CREATE INDEX IF NOT EXISTS idx_tasks_project_status ON tasks (project_id, status);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_author ON tasks (author_user_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_assignee ON tasks (assigned_user_id);
+CREATE INDEX IF NOT EXISTS idx_comments_task ON comments (task_id);
+CREATE INDEX IF NOT EXISTS idx_attachments_task ON attachments (task_id);
+"""
+
+# --- Full-Text Search Indexes ---
+# Each searchable table gets two FTS5 inverted indexes over its text columns:
+# `<table>_fts` (unicode61 word tokens, for ranked word / prefix queries) and
+# `<table>_trigram` (trigram tokens, for substring queries). Both are
+# external-content tables that store only the index, kept current by
+# triggers on every insert, delete and text update.
+SEARCH_INDEXES = {
+    "tasks": ("id", ("title", "description")),
+    "projects": ("id", ("name", "description")),
+    "users": ("user_id", ("username",)),
+}
+SEARCH_TOKENIZERS = {"fts": "unicode61 remove_diacritics 2", "trigram": "trigram"}
+
+
+def _search_schema(table: str, key: str, columns) -> str:
+    cols = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    statements = []
+    for suffix, tokenizer in SEARCH_TOKENIZERS.items():
+        index = f"{table}_{suffix}"
+        statements.append(f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5({cols}, content='{table}', content_rowid='{key}', tokenize='{tokenizer}');
+CREATE TRIGGER IF NOT EXISTS {index}_ai AFTER INSERT ON {table} BEGIN
+    INSERT INTO {index} (rowid, {cols}) VALUES (new.{key}, {new});
+END;
+CREATE TRIGGER IF NOT EXISTS {index}_ad AFTER DELETE ON {table} BEGIN
+    INSERT INTO {index} ({index}, rowid, {cols}) VALUES ('delete', old.{key}, {old});
+END;
+CREATE TRIGGER IF NOT EXISTS {index}_au AFTER UPDATE OF {cols} ON {table} BEGIN
+    INSERT INTO {index} ({index}, rowid, {cols}) VALUES ('delete', old.{key}, {old});
+    INSERT INTO {index} (rowid, {cols}) VALUES (new.{key}, {new});
+END;""")
+    return "".join(statements)
+
+
+_SEARCH_SCHEMA = "".join(_search_schema(table, key, columns) for table, (key, columns) in SEARCH_INDEXES.items())
+
+_SEED = (
+    ("users", SEED_USERS),
+    ("teams", SEED_TEAMS),
+    ("projects", SEED_PROJECTS),
+    ("tasks", SEED_TASKS),
+    ("comments", SEED_COMMENTS),
+    ("attachments", SEED_ATTACHMENTS),
+)
+
+
+# --- Connection Pool ---
+
+class ConnectionPool:
+    """
+    Reusable SQLite connections to one database file.
+
+    Opening a connection (and re-preparing its statements) costs more than the
+    indexed queries the routes run, so connections are kept and handed out
+    again instead of being opened per request. Each one keeps its own
+    prepared-statement cache. Connections beyond `size` are closed on release.
+    """
+
+    def __init__(self, db_path: str, size: int = DASHBOARD_DB_POOL_SIZE):
+        self.db_path = db_path
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=size)
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=30,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        # WAL: readers never block the writer; NORMAL sync is durable across app crashes in WAL mode
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrows a connection; commits on success, rolls back on error, then returns it to the pool."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._open()
+        try:
+            with conn:
+                yield conn
+        finally:
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+_pools: Dict[Any, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Optional[str] = None) -> ConnectionPool:
+    """The pool for `db_path` in this process (connections are never shared across a fork)."""
+    key = (os.getpid(), db_path or DASHBOARD_DB_PATH)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(key[1])
+        return pool
+
+
+def init_dashboard_db(db_path: Optional[str] = None) -> None:
+    """
+    Creates the dashboard tables and indexes (idempotent) and seeds them.
+
+    Seed rows are inserted with INSERT OR IGNORE on their fixed ids, so running
+    this on every worker start never duplicates them and never overwrites
+    changes made through the API. Search indexes missing from an existing
+    database are built once from its rows; afterwards triggers maintain them.
+    """
+    search_indexes = [f"{table}_{suffix}" for table in SEARCH_INDEXES for suffix in SEARCH_TOKENIZERS]
+    with get_pool(db_path).connection() as conn:
+        existing = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        conn.executescript(_SCHEMA + _SEARCH_SCHEMA)
+        for table, rows in _SEED:
+            if not rows:
+                continue
+            columns = list(rows[0])
+            conn.executemany(
+                f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                [tuple(row[c] for c in columns) for row in rows],
+            )
+        for index in search_indexes:
+            if index not in existing:
+                conn.execute(f"INSERT INTO {index} ({index}) VALUES ('rebuild')")
+
+
+# --- Queries ---
+
+def fetch_all(sql: str, params: Union[Sequence[Any], Dict[str, Any]] = (), db_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Rows of a SELECT as dicts keyed by column name."""
+    with get_pool(db_path).connection() as conn:
+        return [dict(row) for row in conn.execute(sql, params)]
+
+
+def fetch_one(sql: str, params: Union[Sequence[Any], Dict[str, Any]] = (), db_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """First row of a SELECT as a dict, or None."""
+    with get_pool(db_path).connection() as conn:
+        row = conn.execute(sql, params).fetchone()
+    return dict(row) if row is not None else None
+
+
+def fetch_in(sql: str, values: Iterable[Any], db_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Rows of a SELECT whose `{ids}` placeholder is filled with one `?` per value,
+    run in chunks of IN_CHUNK_SIZE values on a single connection.
+    """
+    values = list(dict.fromkeys(values))
+    rows: List[Dict[str, Any]] = []
+    if not values:
+        return rows
+    with get_pool(db_path).connection() as conn:
+        for start in range(0, len(values), IN_CHUNK_SIZE):
+            chunk = values[start:start + IN_CHUNK_SIZE]
+            rows.extend(dict(row) for row in conn.execute(sql.format(ids=", ".join("?" * len(chunk))), chunk))
+    return rows
+
+
+def execute_returning(sql: str, params: Sequence[Any] = (), db_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Runs one INSERT / UPDATE ... RETURNING in its own transaction; returns the written row, or None if none matched."""
+    with get_pool(db_path).connection() as conn:
+        rows = conn.execute(sql, params).fetchall()
+    return dict(rows[0]) if rows else None
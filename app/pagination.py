@@ -0,0 +1,26 @@
+# DASHBOARD_BACKEND/app/pagination.py
+
+import base64
+import json
+from typing import Any, Dict
+
+# --- Opaque Keyset Cursors ---
+# A cursor carries the position after which the next page starts, together
+# with the query/filters it was issued for, so it cannot be replayed against
+# a different result set.
+
+def encode_cursor(query: Dict[str, Any], after: Any) -> str:
+    payload = json.dumps({"query": query, "after": after}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, query: Dict[str, Any]) -> Any:
+    """Position stored in the cursor; raises ValueError for a malformed or foreign cursor."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        after = payload["after"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Malformed cursor: {e}")
+    if payload.get("query") != query:
+        raise ValueError("Cursor belongs to a different query or filter set.")
+    return after
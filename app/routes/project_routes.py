@@ -5,6 +5,8 @@ from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
 
+from app.database import execute_returning, fetch_all
+
 # --- Pydantic Models ---
 
 class ProjectBase(BaseModel):
@@ -26,77 +28,14 @@ class Project(ProjectBase):
     # status: str = "To Do" 
     # progress: int = 0
 
-# --- STATIC DATA (Complete and Syntactically Valid) ---
-
-# This list now contains all 10 projects from your Node.js controller data.
-DUMMY_PROJECTS: List[Project] = [
-    Project.model_validate({ # Project ID 1
-        "id": 1,
-        "name": "Formula 1",
-        "description": "A space exploration project.",
-        "startDate": "2023-01-01T00:00:00Z",
-        "endDate": "2023-12-31T00:00:00Z"
-    }),
-    Project.model_validate({ # Project ID 3
-        "id": 3,
-        "name": "Cricket",
-        "description": "A project to boost renewable energy use.",
-        "startDate": "2023-03-05T00:00:00Z",
-        "endDate": "2024-03-05T00:00:00Z"
-    }),
-    Project.model_validate({ # Project ID 4
-        "id": 4,
-        "name": "Tennis",
-        "description": "Tennis project for new software development techniques.",
-        "startDate": "2023-01-20T00:00:00Z",
-        "endDate": "2023-09-20T00:00:00Z"
-    }),
-    Project.model_validate({ # Project ID 5
-        "id": 5, 
-        "name": "Echo", 
-        "description": "Echo project focused on AI advancements.", 
-        "startDate": "2023-04-15T00:00:00Z", 
-        "endDate": "2023-11-30T00:00:00Z" 
-    }),
-    Project.model_validate({ # Project ID 6
-        "id": 6, 
-        "name": "Foot Ball", 
-        "description": "Exploring cutting-edge biotechnology.", 
-        "startDate": "2023-02-25T00:00:00Z", 
-        "endDate": "2023-08-25T00:00:00Z" 
-    }),
-    Project.model_validate({ # Project ID 7
-        "id": 7, 
-        "name": "Golf", 
-        "description": "Development of new golf equipment using AI.", 
-        "startDate": "2023-05-10T00:00:00Z", 
-        "endDate": "2023-12-10T00:00:00Z" 
-    }),
-    Project.model_validate({ # Project ID 8
-        "id": 8, 
-        "name": "Hockey", 
-        "description": "Hockey management system overhaul.", 
-        "startDate": "2023-03-01T00:00:00Z", 
-        "endDate": "2024-01-01T00:00:00Z" 
-    }),
-    Project.model_validate({ # Project ID 9
-        "id": 9, 
-        "name": "India", 
-        "description": "Telecommunication infrastructure upgrade.", 
-        "startDate": "2023-06-01T00:00:00Z", 
-        "endDate": "2023-12-01T00:00:00Z" 
-    }),
-    Project.model_validate({ # Project ID 10
-        "id": 10,
-        "name": "Judo",
-        "description": "Initiative to enhance cyber-security measures.",
-        "startDate": "2023-07-01T00:00:00Z",
-        "endDate": "2024-02-01T00:00:00Z"
-    })
-]
+# --- SQL (fixed strings, so each pooled connection prepares them once) ---
 
-# Initialize the ID counter based on the existing data
-current_max_project_id = max(p.id for p in DUMMY_PROJECTS) if DUMMY_PROJECTS else 0
+SELECT_PROJECTS = "SELECT id, name, description, start_date, end_date FROM projects ORDER BY id"
+INSERT_PROJECT = """
+    INSERT INTO projects (name, description, start_date, end_date)
+    VALUES (?, ?, ?, ?)
+    RETURNING id, name, description, start_date, end_date
+"""
 
 # --- APIRouter (The entry point for this set of routes) ---
 
@@ -106,12 +45,12 @@ router = APIRouter()
 
 # GET /projects (Equivalent to router.get("/", getProjects))
 @router.get("/", response_model=List[Project])
-async def get_projects():
+def get_projects():
     """
     Mocks Project.findMany() and returns the list of all static projects.
     """
     try:
-        return DUMMY_PROJECTS
+        return [Project.model_validate(row) for row in fetch_all(SELECT_PROJECTS)]
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -120,26 +59,15 @@ async def get_projects():
 
 # POST /projects (Equivalent to router.post("/", createProject))
 @router.post("/", response_model=Project, status_code=201)
-async def create_project(project_data: ProjectBase):
+def create_project(project_data: ProjectBase):
     """
-    Mocks Project.create() and creates a new project.
+    Creates a new project; the database assigns its id.
     """
-    global current_max_project_id
-
     try:
-        current_max_project_id += 1 
-
-        # Create the new project object
-        new_project = Project(
-            id=current_max_project_id,
-            name=project_data.name,
-            description=project_data.description,
-            start_date=project_data.start_date,
-            end_date=project_data.end_date,
-        )
-
-        # Simulate saving (add to array)
-        DUMMY_PROJECTS.append(new_project)
+        row = execute_returning(INSERT_PROJECT, (
+            project_data.name, project_data.description, project_data.start_date, project_data.end_date,
+        ))
+        new_project = Project.model_validate(row)
 
         # Return the newly created object with a 201 status
         return new_project
@@ -1,8 +1,17 @@
 # DASHBOARD_BACKEND/app/routes/search_routes.py
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
-from typing import List, Optional, Any, Dict
+from typing import List, Literal, Optional, Any, Dict
+import asyncio
+import re
+import time
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from app.database import fetch_all
+from app.pagination import decode_cursor, encode_cursor
 
 # --- Pydantic Models for Search Results ---
 
@@ -17,7 +26,7 @@ class Task(BaseModel):
     due_date: str = Field(alias="dueDate")
     project_id: int = Field(alias="projectId")
     author_user_id: int = Field(alias="authorUserId")
-    assigned_user_id: int = Field(alias="assignedUserId")
+    assigned_user_id: Optional[int] = Field(None, alias="assignedUserId")
 
     class Config:
         populate_by_name = True
@@ -46,90 +55,242 @@ class SearchResults(BaseModel):
     tasks: List[Task]
     projects: List[Project]
     users: List[User]
+    # Opaque cursor for the next page (None when every entity is exhausted)
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
+    # Fuzzy mode only: the latency budget ran out before every candidate was scored
+    truncated: bool = False
+
+    class Config:
+        populate_by_name = True
+
+# --- Search Settings ---
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+# Trigram substring matching needs at least one trigram
+MIN_SUBSTRING_LENGTH = 3
+
+# Fuzzy mode: trigram-index shortlist size per entity, candidates scored per
+# RapidFuzz batch, default minimum score (0-100) and latency budget
+FUZZY_CANDIDATES = 500
+FUZZY_BATCH_SIZE = 128
+DEFAULT_FUZZY_MIN_SCORE = 70
+DEFAULT_FUZZY_BUDGET_MS = 200
+MAX_FUZZY_BUDGET_MS = 2000
+
+# Per entity: primary key, selected columns, indexed text columns, bm25
+# column weights (title-like columns count more than descriptions) and the
+# equality filters it accepts
+SEARCH_ENTITIES: Dict[str, Dict[str, Any]] = {
+    "tasks": {
+        "key": "id",
+        "columns": "id, title, description, status, priority, tags, start_date, due_date, project_id, author_user_id, assigned_user_id",
+        "text": ("title", "description"),
+        "weights": "4.0, 1.0",
+        "filters": ("status", "priority", "project_id", "assigned_user_id"),
+    },
+    "projects": {
+        "key": "id",
+        "columns": "id, name, description, start_date, end_date",
+        "text": ("name", "description"),
+        "weights": "4.0, 1.0",
+        "filters": (),
+    },
+    "users": {
+        "key": "user_id",
+        "columns": "user_id, cognito_id, username, profile_picture_url, team_id",
+        "text": ("username",),
+        "weights": "1.0",
+        "filters": ("team_id",),
+    },
+}
+
+# --- SQL ---
+
+def _search_sql(table: str, key: str, columns: str, weights: str, filters) -> Dict[str, str]:
+    """
+    The fixed statements of one entity (prepared once per pooled connection).
 
-# --- STATIC DATA (Complete and Syntactically Valid) ---
-
-# Replicating the full 40-task dataset
-DUMMY_TASKS: List[Task] = [
-    Task.model_validate({"id": 1, "title": "Task 1", "description": "Design the main module.", "status": "Work In Progress", "priority": "Urgent", "tags": "Design", "startDate": "2023-01-10T00:00:00Z", "dueDate": "2023-04-10T00:00:00Z", "projectId": 1, "authorUserId": 1, "assignedUserId": 2}),
-    Task.model_validate({"id": 2, "title": "Task 2", "description": "Implement the navigation algorithm.", "status": "To Do", "priority": "High", "tags": "Coding", "startDate": "2023-01-15T00:00:00Z", "dueDate": "2023-05-15T00:00:00Z", "projectId": 2, "authorUserId": 3, "assignedUserId": 4}),
-    Task.model_validate({"id": 3, "title": "Task 3", "description": "Develop renewable energy solutions.", "status": "Work In Progress", "priority": "Urgent", "tags": "Development", "startDate": "2023-03-20T00:00:00Z", "dueDate": "2023-09-20T00:00:00Z", "projectId": 3, "authorUserId": 5, "assignedUserId": 6}),
-    Task.model_validate({"id": 4, "title": "Task 4", "description": "Outline new software development workflows.", "status": "To Do", "priority": "High", "tags": "Planning", "startDate": "2023-01-25T00:00:00Z", "dueDate": "2023-06-25T00:00:00Z", "projectId": 4, "authorUserId": 7, "assignedUserId": 8}),
-    Task.model_validate({"id": 5, "title": "Task 5", "description": "Research AI models for prediction.", "status": "Work In Progress", "priority": "Urgent", "tags": "Research", "startDate": "2023-04-20T00:00:00Z", "dueDate": "2023-10-20T00:00:00Z", "projectId": 5, "authorUserId": 9, "assignedUserId": 10}),
-    Task.model_validate({"id": 6, "title": "Task 6", "description": "Biotech product testing.", "status": "To Do", "priority": "Backlog", "tags": "Testing", "startDate": "2023-03-01T00:00:00Z", "dueDate": "2023-08-01T00:00:00Z", "projectId": 6, "authorUserId": 11, "assignedUserId": 12}),
-    Task.model_validate({"id": 7, "title": "Task 7", "description": "AI optimization for golf equipment.", "status": "Work In Progress", "priority": "Urgent", "tags": "Optimization", "startDate": "2023-05-15T00:00:00Z", "dueDate": "2023-11-15T00:00:00Z", "projectId": 7, "authorUserId": 13, "assignedUserId": 14}),
-    Task.model_validate({"id": 8, "title": "Task 8", "description": "Overhaul of the database for Hockey management.", "status": "To Do", "priority": "High", "tags": "Database", "startDate": "2023-04-01T00:00:00Z", "dueDate": "2023-10-01T00:00:00Z", "projectId": 8, "authorUserId": 15, "assignedUserId": 16}),
-    Task.model_validate({"id": 9, "title": "Task 9", "description": "Upgrade telecom infrastructure.", "status": "Work In Progress", "priority": "Urgent", "tags": "Infrastructure", "startDate": "2023-06-10T00:00:00Z", "dueDate": "2023-12-10T00:00:00Z", "projectId": 9, "authorUserId": 17, "assignedUserId": 18}),
-    Task.model_validate({"id": 10, "title": "Task 10", "description": "Enhance security protocols.", "status": "To Do", "priority": "Urgent", "tags": "Security", "startDate": "2023-07-05T00:00:00Z", "dueDate": "2024-01-05T00:00:00Z", "projectId": 10, "authorUserId": 19, "assignedUserId": 20}),
-    Task.model_validate({"id": 11, "title": "Task 11", "description": "Finalize AI training parameters.", "status": "Work In Progress", "priority": "Urgent", "tags": "AI, Training", "startDate": "2023-01-20T00:00:00Z", "dueDate": "2023-05-20T00:00:00Z", "projectId": 5, "authorUserId": 1, "assignedUserId": 3}),
-    Task.model_validate({"id": 12, "title": "Task 12", "description": "Update server security protocols.", "status": "To Do", "priority": "High", "tags": "Security", "startDate": "2023-02-10T00:00:00Z", "dueDate": "2023-06-10T00:00:00Z", "projectId": 1, "authorUserId": 2, "assignedUserId": 4}),
-    Task.model_validate({"id": 13, "title": "Task 13", "description": "Redesign user interface for better UX.", "status": "Work In Progress", "priority": "Urgent", "tags": "Design, UX", "startDate": "2023-03-15T00:00:00Z", "dueDate": "2023-07-15T00:00:00Z", "projectId": 2, "authorUserId": 5, "assignedUserId": 6}),
-    Task.model_validate({"id": 14, "title": "Task 14", "description": "Implement real-time data analytics.", "status": "To Do", "priority": "High", "tags": "Analytics", "startDate": "2023-04-05T00:00:00Z", "dueDate": "2023-08-05T00:00:00Z", "projectId": 3, "authorUserId": 7, "assignedUserId": 8}),
-    Task.model_validate({"id": 15, "title": "Task 15", "description": "Develop end-to-end encryption solution.", "status": "Work In Progress", "priority": "Urgent", "tags": "Encryption", "startDate": "2023-05-01T00:00:00Z", "dueDate": "2023-09-01T00:00:00Z", "projectId": 4, "authorUserId": 9, "assignedUserId": 10}),
-    Task.model_validate({"id": 16, "title": "Task 16", "description": "Optimize cloud storage usage.", "status": "To Do", "priority": "Backlog", "tags": "Cloud, Storage", "startDate": "2023-06-15T00:00:00Z", "dueDate": "2023-10-15T00:00:00Z", "projectId": 5, "authorUserId": 11, "assignedUserId": 12}),
-    Task.model_validate({"id": 17, "title": "Task 17", "description": "Test software for hardware compatibility.", "status": "Work In Progress", "priority": "Urgent", "tags": "Testing, Hardware", "startDate": "2023-07-10T00:00:00Z", "dueDate": "2023-11-10T00:00:00Z", "projectId": 6, "authorUserId": 13, "assignedUserId": 14}),
-    Task.model_validate({"id": 18, "title": "Task 18", "description": "Create new data visualization tools.", "status": "To Do", "priority": "High", "tags": "Visualization", "startDate": "2023-08-05T00:00:00Z", "dueDate": "2023-12-05T00:00:00Z", "projectId": 7, "authorUserId": 15, "assignedUserId": 16}),
-    Task.model_validate({"id": 19, "title": "Task 19", "description": "Build prototype for new IoT devices.", "status": "Work In Progress", "priority": "Urgent", "tags": "IoT", "startDate": "2023-09-01T00:00:00Z", "dueDate": "2024-01-01T00:00:00Z", "projectId": 8, "authorUserId": 17, "assignedUserId": 18}),
-    Task.model_validate({"id": 20, "title": "Task 20", "description": "Update legacy systems to new tech standards.", "status": "To Do", "priority": "Urgent", "tags": "Legacy, Upgrade", "startDate": "2023-10-10T00:00:00Z", "dueDate": "2024-02-10T00:00:00Z", "projectId": 9, "authorUserId": 19, "assignedUserId": 20}),
-    Task.model_validate({"id": 21, "title": "Task 21", "description": "Establish new network security framework.", "status": "Work In Progress", "priority": "Urgent", "tags": "Security", "startDate": "2023-01-30T00:00:00Z", "dueDate": "2023-05-30T00:00:00Z", "projectId": 10, "authorUserId": 1, "assignedUserId": 3}),
-    Task.model_validate({"id": 22, "title": "Task 22", "description": "Revise application deployment strategies.", "status": "To Do", "priority": "High", "tags": "Deployment", "startDate": "2023-02-20T00:00:00Z", "dueDate": "2023-06-20T00:00:00Z", "projectId": 1, "authorUserId": 2, "assignedUserId": 4}),
-    Task.model_validate({"id": 23, "title": "Task 23", "description": "Conduct market analysis for product fit.", "status": "Work In Progress", "priority": "Urgent", "tags": "Market Analysis", "startDate": "2023-03-25T00:00:00Z", "dueDate": "2023-07-25T00:00:00Z", "projectId": 2, "authorUserId": 5, "assignedUserId": 6}),
-    Task.model_validate({"id": 24, "title": "Task 24", "description": "Optimize user feedback collection mechanism.", "status": "To Do", "priority": "High", "tags": "Feedback", "startDate": "2023-04-15T00:00:00Z", "dueDate": "2023-08-15T00:00:00Z", "projectId": 3, "authorUserId": 7, "assignedUserId": 8}),
-    Task.model_validate({"id": 25, "title": "Task 25", "description": "Integrate new API for third-party services.", "status": "Work In Progress", "priority": "Urgent", "tags": "API Integration", "startDate": "2023-05-05T00:00:00Z", "dueDate": "2023-09-05T00:00:00Z", "projectId": 4, "authorUserId": 9, "assignedUserId": 10}),
-    Task.model_validate({"id": 26, "title": "Task 26", "description": "Update internal tooling for development teams.", "status": "To Do", "priority": "Backlog", "tags": "Tooling", "startDate": "2023-06-25T00:00:00Z", "dueDate": "2023-10-25T00:00:00Z", "projectId": 5, "authorUserId": 11, "assignedUserId": 12}),
-    Task.model_validate({"id": 27, "title": "Task 27", "description": "Prepare cloud migration strategy document.", "status": "Work In Progress", "priority": "Urgent", "tags": "Cloud Migration", "startDate": "2023-07-20T00:00:00Z", "dueDate": "2023-11-20T00:00:00Z", "projectId": 6, "authorUserId": 13, "assignedUserId": 14}),
-    Task.model_validate({"id": 28, "title": "Task 28", "description": "Design scalable database architecture.", "status": "To Do", "priority": "Medium", "tags": "Database Design", "startDate": "2023-08-15T00:00:00Z", "dueDate": "2023-12-15T00:00:00Z", "projectId": 7, "authorUserId": 15, "assignedUserId": 16}),
-    Task.model_validate({"id": 29, "title": "Task 29", "description": "Prototype new mobile technology.", "status": "Work In Progress", "priority": "Urgent", "tags": "Mobile Tech", "startDate": "2023-09-10T00:00:00Z", "dueDate": "2024-01-10T00:00:00Z", "projectId": 8, "authorUserId": 17, "assignedUserId": 18}),
-    Task.model_validate({"id": 30, "title": "Task 30", "description": "Enhance data encryption levels.", "status": "To Do", "priority": "High", "tags": "Encryption", "startDate": "2023-10-15T00:00:00Z", "dueDate": "2024-02-15T00:00:00Z", "projectId": 9, "authorUserId": 19, "assignedUserId": 20}),
-    Task.model_validate({"id": 31, "title": "Task 31", "description": "Refactor backend code for better maintainability.", "status": "Work In Progress", "priority": "Urgent", "tags": "Refactoring, Backend", "startDate": "2023-11-01T00:00:00Z", "dueDate": "2024-03-01T00:00:00Z", "projectId": 10, "authorUserId": 20, "assignedUserId": 1}),
-    Task.model_validate({"id": 32, "title": "Task 32", "description": "Expand the network infrastructure to support increased traffic.", "status": "To Do", "priority": "Medium", "tags": "Networking, Infrastructure", "startDate": "2023-11-05T00:00:00Z", "dueDate": "2024-01-05T00:00:00Z", "projectId": 1, "authorUserId": 2, "assignedUserId": 3}),
-    Task.model_validate({"id": 33, "title": "Task 33", "description": "Create a new client dashboard interface.", "status": "Work In Progress", "priority": "Urgent", "tags": "UI, Dashboard", "startDate": "2023-11-10T00:00:00Z", "dueDate": "2024-02-10T00:00:00Z", "projectId": 2, "authorUserId": 4, "assignedUserId": 5}),
-    Task.model_validate({"id": 34, "title": "Task 34", "description": "Develop an automated testing framework for new software releases.", "status": "To Do", "priority": "Medium", "tags": "Testing, Automation", "startDate": "2023-11-15T00:00:00Z", "dueDate": "2024-03-15T00:00:00Z", "projectId": 3, "authorUserId": 6, "assignedUserId": 7}),
-    Task.model_validate({"id": 35, "title": "Task 35", "description": "Optimize database queries to improve application performance.", "status": "Work In Progress", "priority": "Urgent", "tags": "Database, Optimization", "startDate": "2023-11-20T00:00:00Z", "dueDate": "2024-01-20T00:00:00Z", "projectId": 4, "authorUserId": 8, "assignedUserId": 9}),
-    Task.model_validate({"id": 36, "title": "Task 36", "description": "Implement end-user training for new system features.", "status": "To Do", "priority": "Backlog", "tags": "Training, User Experience", "startDate": "2023-11-25T00:00:00Z", "dueDate": "2024-01-25T00:00:00Z", "projectId": 5, "authorUserId": 10, "assignedUserId": 11}),
-    Task.model_validate({"id": 37, "title": "Task 37", "description": "Conduct a comprehensive security audit of the existing infrastructure.", "status": "Work In Progress", "priority": "Urgent", "tags": "Security, Audit", "startDate": "2023-12-01T00:00:00Z", "dueDate": "2024-02-01T00:00:00Z", "projectId": 6, "authorUserId": 12, "assignedUserId": 13}),
-    Task.model_validate({"id": 38, "title": "Task 38", "description": "Revise mobile app to incorporate new payment integrations.", "status": "To Do", "priority": "Medium", "tags": "Mobile, Payments", "startDate": "2023-12-05T00:00:00Z", "dueDate": "2024-02-05T00:00:00Z", "projectId": 7, "authorUserId": 14, "assignedUserId": 15}),
-    Task.model_validate({"id": 39, "title": "Task 39", "description": "Update cloud configuration to optimize costs.", "status": "Work In Progress", "priority": "Urgent", "tags": "Cloud, Cost Saving", "startDate": "2023-12-10T00:00:00Z", "dueDate": "2024-02-10T00:00:00Z", "projectId": 8, "authorUserId": 16, "assignedUserId": 17}),
-    Task.model_validate({"id": 40, "title": "Task 40", "description": "Implement automated backup procedures for critical data.", "status": "To Do", "priority": "High", "tags": "Backup, Automation", "startDate": "2023-12-15T00:00:00Z", "dueDate": "2024-02-15T00:00:00Z", "projectId": 9, "authorUserId": 18, "assignedUserId": 19}),
-]
-
-# Replicating the full 10-project dataset
-DUMMY_PROJECTS: List[Project] = [
-    Project.model_validate({"id": 1, "name": "Formula 1", "description": "A space exploration project.", "startDate": "2023-01-01T00:00:00Z", "endDate": "2023-12-31T00:00:00Z"}),
-    Project.model_validate({"id": 3, "name": "Cricket", "description": "A project to boost renewable energy use.", "startDate": "2023-03-05T00:00:00Z", "endDate": "2024-03-05T00:00:00Z"}),
-    Project.model_validate({"id": 4, "name": "Tennis", "description": "Tennis project for new software development techniques.", "startDate": "2023-01-20T00:00:00Z", "endDate": "2023-09-20T00:00:00Z"}),
-    Project.model_validate({"id": 5, "name": "Echo", "description": "Echo project focused on AI advancements.", "startDate": "2023-04-15T00:00:00Z", "endDate": "2023-11-30T00:00:00Z"}),
-    Project.model_validate({"id": 6, "name": "Foot Ball", "description": "Exploring cutting-edge biotechnology.", "startDate": "2023-02-25T00:00:00Z", "endDate": "2023-08-25T00:00:00Z"}),
-    Project.model_validate({"id": 7, "name": "Golf", "description": "Development of new golf equipment using AI.", "startDate": "2023-05-10T00:00:00Z", "endDate": "2023-12-10T00:00:00Z"}),
-    Project.model_validate({"id": 8, "name": "Hockey", "description": "Hockey management system overhaul.", "startDate": "2023-03-01T00:00:00Z", "endDate": "2024-01-01T00:00:00Z"}),
-    Project.model_validate({"id": 9, "name": "India", "description": "Telecommunication infrastructure upgrade.", "startDate": "2023-06-01T00:00:00Z", "endDate": "2023-12-01T00:00:00Z"}),
-    Project.model_validate({"id": 10, "name": "Judo", "description": "Initiative to enhance cyber-security measures.", "startDate": "2023-07-01T00:00:00Z", "endDate": "2024-02-01T00:00:00Z"}),
-    # Note: Project ID 2 is skipped in your provided data, consistent with your Node.js mock.
-]
-
-# Replicating the user lookup data (only the users relevant to the task/project data you gave)
-DUMMY_USERS: List[User] = [
-    User.model_validate({"userId": 1, "cognitoId": "user-a1b2c3d4", "username": "Bharath Raj", "profilePictureUrl": "p1.jpeg", "teamId": 1}),
-    User.model_validate({"userId": 2, "cognitoId": "123e4567-e89b-12d3-a456-426614174002", "username": "Priya", "profilePictureUrl": "p2.jpeg", "teamId": 2}),
-    User.model_validate({"userId": 3, "cognitoId": "123e4567-e89b-12d3-a456-426614174003", "username": "Hitesh", "profilePictureUrl": "p3.jpeg", "teamId": 3}),
-    User.model_validate({"userId": 4, "cognitoId": "213b7530-1031-70e0-67e9-fe0805e18fb3", "username": "Naveen", "profilePictureUrl": "p4.jpeg", "teamId": 4}),
-    User.model_validate({"userId": 5, "cognitoId": "123e4567-e89b-12d3-a456-426614174005", "username": "EveClark", "profilePictureUrl": "p5.jpeg", "teamId": 5}),
-    User.model_validate({"userId": 6, "cognitoId": "123e4567-e89b-12d3-a456-426614174006", "username": "FrankWright", "profilePictureUrl": "p6.jpeg", "teamId": 1}),
-    User.model_validate({"userId": 7, "cognitoId": "123e4567-e89b-12d3-a456-426614174007", "username": "GraceHall", "profilePictureUrl": "p7.jpeg", "teamId": 2}),
-    User.model_validate({"userId": 8, "cognitoId": "123e4567-e89b-12d3-a456-426614174008", "username": "HenryAllen", "profilePictureUrl": "p8.jpeg", "teamId": 3}),
-    User.model_validate({"userId": 9, "cognitoId": "123e4567-e89b-12d3-a456-426614174009", "username": "IdaMartin", "profilePictureUrl": "p9.jpeg", "teamId": 4}),
-    User.model_validate({"userId": 10, "cognitoId": "123e4567-e89b-12d3-a456-426614174010", "username": "bharath", "profilePictureUrl": "p10.jpeg", "teamId": 5}),
-    User.model_validate({"userId": 11, "cognitoId": "123e4567-e89b-12d3-a456-426614174011", "username": "Vivek", "profilePictureUrl": "p11.jpeg", "teamId": 1}),
-    User.model_validate({"userId": 12, "cognitoId": "123e4567-e89b-12d3-a456-426614174012", "username": "NormanBates", "profilePictureUrl": "p12.jpeg", "teamId": 2}),
-    User.model_validate({"userId": 13, "cognitoId": "123e4567-e89b-12d3-a456-426614174013", "username": "OliviaPace", "profilePictureUrl": "p13.jpeg", "teamId": 3}),
-    User.model_validate({"userId": 14, "cognitoId": "123e4567-e89b-12d3-a456-426614174014", "username": "PeterQuill", "profilePictureUrl": "p1.jpeg", "teamId": 4}),
-    User.model_validate({"userId": 15, "cognitoId": "123e4567-e89b-12d3-a456-426614174015", "username": "QuincyAdams", "profilePictureUrl": "p2.jpeg", "teamId": 5}),
-    User.model_validate({"userId": 16, "cognitoId": "123e4567-e89b-12d3-a456-426614174016", "username": "RachelGreen", "profilePictureUrl": "p3.jpeg", "teamId": 1}),
-    User.model_validate({"userId": 17, "cognitoId": "123e4567-e89b-12d3-a456-426614174017", "username": "SteveJobs", "profilePictureUrl": "p4.jpeg", "teamId": 2}),
-    User.model_validate({"userId": 18, "cognitoId": "123e4567-e89b-12d3-a456-426614174018", "username": "TinaFey", "profilePictureUrl": "p5.jpeg", "teamId": 3}),
-    User.model_validate({"userId": 19, "cognitoId": "123e4567-e89b-12d3-a456-426614174019", "username": "UrsulaMonroe", "profilePictureUrl": "p6.jpeg", "teamId": 4}),
-    User.model_validate({"userId": 20, "cognitoId": "123e4567-e89b-12d3-a456-426614174020", "username": "VictorHugo", "profilePictureUrl": "p7.jpeg", "teamId": 5}),
-]
+    "match": word hits (tier 0, ranked by bm25 on the word index) come before
+    substring-only hits (tier 1, ranked by bm25 on the trigram index); rows
+    found by both keep their word rank. "browse": every row by key, for an
+    empty query. Both page by keyset on (tier, score, key), and a NULL filter
+    parameter means "any". "fuzzy": the fuzzy-mode shortlist, rows sharing
+    any trigram with the query, most shared (rarest) trigrams first.
+    """
+    selected = ", ".join(f"e.{c.strip()}" for c in columns.split(","))
+    where = "".join(f" AND (:{f} IS NULL OR e.{f} = :{f})" for f in filters)
+    return {
+        "match": f"""
+            WITH hits AS (
+                SELECT rowid AS id, bm25({table}_fts, {weights}) AS score, 0 AS tier
+                FROM {table}_fts WHERE :words IS NOT NULL AND {table}_fts MATCH :words
+                UNION ALL
+                SELECT rowid, bm25({table}_trigram, {weights}), 1
+                FROM {table}_trigram WHERE :substring IS NOT NULL AND {table}_trigram MATCH :substring
+            ),
+            best AS (
+                -- SQLite takes the bare `score` from the row holding MIN(tier)
+                SELECT id, MIN(tier) AS tier, score FROM hits GROUP BY id
+            )
+            SELECT {selected}, b.tier AS search_tier, b.score AS search_score
+            FROM best b JOIN {table} e ON e.{key} = b.id
+            WHERE (b.tier, b.score, b.id) > (:after_tier, :after_score, :after_id){where}
+            ORDER BY b.tier, b.score, b.id
+            LIMIT :limit
+        """,
+        "browse": f"""
+            SELECT {selected}, 0 AS search_tier, 0.0 AS search_score
+            FROM {table} e
+            WHERE e.{key} > :after_id{where}
+            ORDER BY e.{key}
+            LIMIT :limit
+        """,
+        "fuzzy": f"""
+            SELECT {selected}, bm25({table}_trigram) AS search_score
+            FROM {table}_trigram JOIN {table} e ON e.{key} = {table}_trigram.rowid
+            WHERE {table}_trigram MATCH :trigrams{where}
+            ORDER BY search_score
+            LIMIT :limit
+        """,
+    }
+
+
+SEARCH_SQL = {
+    table: _search_sql(table, spec["key"], spec["columns"], spec["weights"], spec["filters"])
+    for table, spec in SEARCH_ENTITIES.items()
+}
+
+# --- Query Parsing ---
+
+def word_query(text: str) -> Optional[str]:
+    """FTS5 query matching rows that contain every word of `text` as a word prefix (None if no words)."""
+    tokens = re.findall(r"\w+", text.lower())
+    return " ".join(f'"{token}"*' for token in tokens) or None
+
+
+def substring_query(text: str) -> Optional[str]:
+    """FTS5 trigram phrase matching `text` anywhere, case-insensitively (None if too short)."""
+    text = text.strip()
+    if len(text) < MIN_SUBSTRING_LENGTH:
+        return None
+    return '"' + text.replace('"', '""') + '"'
+
+
+def trigram_query(tokens: List[str]) -> Optional[str]:
+    """FTS5 trigram query matching rows that share at least one trigram with the tokens (None if none has 3+ characters)."""
+    trigrams = dict.fromkeys(token[i:i + 3] for token in tokens for i in range(len(token) - 2))
+    return " OR ".join(f'"{trigram}"' for trigram in trigrams) or None
+
+
+# --- Fuzzy Scoring ---
+
+def fuzzy_scores(tokens: List[str], texts: List[str]) -> np.ndarray:
+    """
+    Typo-tolerant score (0-100) of each text for the query tokens.
+
+    Each query token takes its best fuzz.ratio against any word of the text,
+    and a text scores the mean over the tokens, so "refactr backnd" matches
+    "Refactor backend code". All token x word similarities come from one
+    process.cdist call over the batch's distinct words, reduced per text
+    with numpy; there is no per-item Python scoring loop.
+    """
+    vocabulary: Dict[str, int] = {}
+    owners, word_ids = [], []
+    for position, text in enumerate(texts):
+        for word in set(re.findall(r"\w+", text.lower())):
+            owners.append(position)
+            word_ids.append(vocabulary.setdefault(word, len(vocabulary)))
+    scores = np.zeros(len(texts))
+    if not owners:
+        return scores
+
+    similarity = process.cdist(tokens, list(vocabulary), scorer=fuzz.ratio, dtype=np.uint8, workers=-1)
+    owners = np.asarray(owners)
+    starts = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+    best = np.maximum.reduceat(similarity[:, word_ids], starts, axis=1)
+    scores[owners[starts]] = best.mean(axis=0)
+    return scores
+
+
+def fuzzy_search(entity: str, tokens: List[str], filters: Dict[str, Any], limit: int,
+                 min_score: float, deadline: float):
+    """
+    Top `limit` rows of one entity by fuzzy score (at least `min_score`).
+
+    Candidates come from the trigram index in shortlist order and are scored
+    in batches of FUZZY_BATCH_SIZE; once `deadline` (perf_counter time) has
+    passed no further batch is scored. Returns (rows, truncated).
+    """
+    spec = SEARCH_ENTITIES[entity]
+    trigrams = trigram_query(tokens)
+    if trigrams is None:
+        return [], False
+
+    params = {"trigrams": trigrams, "limit": FUZZY_CANDIDATES, **{f: filters[f] for f in spec["filters"]}}
+    candidates = fetch_all(SEARCH_SQL[entity]["fuzzy"], params)
+
+    scored, truncated = [], False
+    for start in range(0, len(candidates), FUZZY_BATCH_SIZE):
+        if start and time.perf_counter() > deadline:
+            truncated = True
+            break
+        batch = candidates[start:start + FUZZY_BATCH_SIZE]
+        texts = [" ".join(row[c] or "" for c in spec["text"]) for row in batch]
+        scored.append(fuzzy_scores(tokens, texts))
+
+    if not scored:
+        return [], truncated
+    scores = np.concatenate(scored)
+    # Stable sort: equal scores keep the shortlist (trigram bm25) order
+    order = np.argsort(-scores, kind="stable")[:limit]
+    return [candidates[i] for i in order if scores[i] >= min_score], truncated
+
+
+def fuzzy_results(tokens: List[str], selected: List[str], filters: Dict[str, Any], limit: int,
+                  min_score: float, deadline: float) -> Dict[str, Any]:
+    """The single page of fuzzy results for the selected entities, sharing one `deadline`."""
+    results: Dict[str, list] = {entity: [] for entity in SEARCH_ENTITIES}
+    truncated = False
+    for entity in selected:
+        results[entity], cut = fuzzy_search(entity, tokens, filters, limit, min_score, deadline)
+        truncated = truncated or cut
+    return {**results, "nextCursor": None, "truncated": truncated}
+
+
+# --- Ranked Search ---
+
+def ranked_search(text: str, selected: List[str], filters: Dict[str, Any], limit: int,
+                  after: Dict[str, list], query: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    One page of the ranked search: up to `limit` rows per selected entity after
+    its `after` position, and the cursor for the next page.
+    """
+    words, substring = word_query(text), substring_query(text)
+    statement = "match" if text else "browse"
+
+    results: Dict[str, list] = {entity: [] for entity in SEARCH_ENTITIES}
+    next_positions: Dict[str, list] = {}
+    for entity in selected:
+        if entity not in after:
+            continue  # exhausted on an earlier page
+        spec = SEARCH_ENTITIES[entity]
+        after_tier, after_score, after_id = after[entity]
+        params = {
+            "words": words, "substring": substring, "limit": limit + 1,
+            "after_tier": after_tier, "after_score": after_score, "after_id": after_id,
+            **{f: filters[f] for f in spec["filters"]},
+        }
+        rows = fetch_all(SEARCH_SQL[entity][statement], params)
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_positions[entity] = [last["search_tier"], last["search_score"], last[spec["key"]]]
+        results[entity] = rows
+
+    next_cursor = encode_cursor(query, next_positions) if next_positions else None
+    return {**results, "nextCursor": next_cursor}
 
 
 # --- APIRouter (Equivalent to Express Router) ---
@@ -139,35 +300,70 @@ router = APIRouter()
 # --- Search Controller Function (Equivalent to searchController.search) ---
 
 @router.get("/", response_model=SearchResults)
-async def search(q: Optional[str] = None):
+async def search(
+    q: Optional[str] = None,
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    cursor: Optional[str] = None,
+    entities: Optional[str] = None,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    project_id: Optional[int] = None,
+    assigned_user_id: Optional[int] = None,
+    team_id: Optional[int] = None,
+    mode: Literal["ranked", "fuzzy"] = "ranked",
+    min_score: float = Query(DEFAULT_FUZZY_MIN_SCORE, ge=0, le=100),
+    budget_ms: int = Query(DEFAULT_FUZZY_BUDGET_MS, ge=1, le=MAX_FUZZY_BUDGET_MS),
+):
     """
-    Performs a combined search across tasks, projects, and users based on a query string (q).
+    Performs a combined, ranked search across tasks, projects, and users based on a query string (q).
+
+    Whole words and word prefixes are looked up in the inverted word index and
+    ranked by BM25; substrings of 3+ characters are found through the trigram
+    index and listed after the word matches. An empty query lists every record.
+    `limit` applies per entity; pass `nextCursor` back as `cursor` for the next
+    page. `entities` (comma-separated) restricts the search, and the filters
+    apply to the entities that have them (status, priority, project_id,
+    assigned_user_id for tasks; team_id for users).
+
+    `mode=fuzzy` tolerates typos: rows sharing trigrams with the query are
+    shortlisted from the trigram index and scored with RapidFuzz, returning
+    the top `limit` per entity scoring at least `min_score`. Scoring stops
+    after `budget_ms` (the best rows scored so far are returned and
+    `truncated` is set). Fuzzy results are a single page, without a cursor;
+    queries without a word of 3+ characters fall back to the ranked search.
     """
-    query = (q or "").lower()
+    text = (q or "").strip()
+    selected = [e.strip() for e in entities.split(",") if e.strip()] if entities else list(SEARCH_ENTITIES)
+    unknown = [e for e in selected if e not in SEARCH_ENTITIES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown search entities: {', '.join(unknown)}.")
+
+    filters = {"status": status, "priority": priority, "project_id": project_id,
+               "assigned_user_id": assigned_user_id, "team_id": team_id}
+    query = {"q": text, "entities": selected, **filters}
+    tokens = re.findall(r"\w+", text.lower())
+    if mode == "fuzzy" and trigram_query(tokens):
+        if cursor:
+            raise HTTPException(status_code=400, detail="Bad Request: fuzzy search returns a single page; cursor is not supported.")
+        deadline = time.perf_counter() + budget_ms / 1000
+        try:
+            # Scoring runs up to budget_ms; keep it off the event loop
+            return await asyncio.to_thread(fuzzy_results, tokens, selected, filters, limit, min_score, deadline)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error performing search: {e}")
+
+    if cursor:
+        try:
+            after = decode_cursor(cursor, query)
+        except ValueError as ve:
+            raise HTTPException(status_code=400, detail=f"Bad Request: {ve}")
+    else:
+        after = {entity: [-1, 0.0, 0] for entity in selected}
 
     try:
-        # --- 1. TASK SEARCH (title OR description) ---
-        tasks = [
-            task for task in DUMMY_TASKS
-            if query in task.title.lower() or query in task.description.lower()
-        ]
-
-        # --- 2. PROJECT SEARCH (name OR description) ---
-        projects = [
-            project for project in DUMMY_PROJECTS
-            if query in project.name.lower() or query in project.description.lower()
-        ]
-
-        # --- 3. USER SEARCH (username) ---
-        users = [
-            user for user in DUMMY_USERS
-            if query in user.username.lower()
-        ]
-
-        return {"tasks": tasks, "projects": projects, "users": users}
-        
+        return await asyncio.to_thread(ranked_search, text, selected, filters, limit, after, query)
     except Exception as e:
         raise HTTPException(
             status_code=500, 
             detail=f"Error performing search: {e}"
-        )
\ No newline at end of file
+        )
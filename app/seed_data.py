@@ -0,0 +1,141 @@
+# DASHBOARD_BACKEND/app/seed_data.py
+
+from typing import Any, Dict, List
+
+# --- SEED DATA ---
+# The records the dashboard started with (previously copied into each route
+# module). app/database.py inserts them once into a fresh database; keys are
+# the column names.
+
+# --- Users (20 records) ---
+SEED_USERS: List[Dict[str, Any]] = [
+    {"username": "Bharath Raj", "cognito_id": "123e4567-e89b-12d3-a456-426614174001", "profile_picture_url": "p1.jpeg", "team_id": 1, "user_id": 1},
+    {"username": "Priya", "cognito_id": "123e4567-e89b-12d3-a456-426614174002", "profile_picture_url": "p2.jpeg", "team_id": 2, "user_id": 2},
+    {"username": "Hitesh", "cognito_id": "123e4567-e89b-12d3-a456-426614174003", "profile_picture_url": "p3.jpeg", "team_id": 3, "user_id": 3},
+    {"username": "Naveen", "cognito_id": "213b7530-1031-70e0-67e9-fe0805e18fb3", "profile_picture_url": "p4.jpeg", "team_id": 4, "user_id": 4},
+    {"username": "EveClark", "cognito_id": "123e4567-e89b-12d3-a456-426614174005", "profile_picture_url": "p5.jpeg", "team_id": 5, "user_id": 5},
+    {"username": "FrankWright", "cognito_id": "123e4567-e89b-12d3-a456-426614174006", "profile_picture_url": "p6.jpeg", "team_id": 1, "user_id": 6},
+    {"username": "GraceHall", "cognito_id": "123e4567-e89b-12d3-a456-426614174007", "profile_picture_url": "p7.jpeg", "team_id": 2, "user_id": 7},
+    {"username": "HenryAllen", "cognito_id": "123e4567-e89b-12d3-a456-426614174008", "profile_picture_url": "p8.jpeg", "team_id": 3, "user_id": 8},
+    {"username": "IdaMartin", "cognito_id": "123e4567-e89b-12d3-a456-426614174009", "profile_picture_url": "p9.jpeg", "team_id": 4, "user_id": 9},
+    {"username": "bharath", "cognito_id": "123e4567-e89b-12d3-a456-426614174010", "profile_picture_url": "p10.jpeg", "team_id": 5, "user_id": 10},
+    {"username": "Vivek", "cognito_id": "123e4567-e89b-12d3-a456-426614174011", "profile_picture_url": "p11.jpeg", "team_id": 1, "user_id": 11},
+    {"username": "NormanBates", "cognito_id": "123e4567-e89b-12d3-a456-426614174012", "profile_picture_url": "p12.jpeg", "team_id": 2, "user_id": 12},
+    {"username": "OliviaPace", "cognito_id": "123e4567-e89b-12d3-a456-426614174013", "profile_picture_url": "p13.jpeg", "team_id": 3, "user_id": 13},
+    {"username": "PeterQuill", "cognito_id": "123e4567-e89b-12d3-a456-426614174014", "profile_picture_url": "p1.jpeg", "team_id": 4, "user_id": 14},
+    {"username": "QuincyAdams", "cognito_id": "123e4567-e89b-12d3-a456-426614174015", "profile_picture_url": "p2.jpeg", "team_id": 5, "user_id": 15},
+    {"username": "RachelGreen", "cognito_id": "123e4567-e89b-12d3-a456-426614174016", "profile_picture_url": "p3.jpeg", "team_id": 1, "user_id": 16},
+    {"username": "SteveJobs", "cognito_id": "123e4567-e89b-12d3-a456-426614174017", "profile_picture_url": "p4.jpeg", "team_id": 2, "user_id": 17},
+    {"username": "TinaFey", "cognito_id": "123e4567-e89b-12d3-a456-426614174018", "profile_picture_url": "p5.jpeg", "team_id": 3, "user_id": 18},
+    {"username": "UrsulaMonroe", "cognito_id": "123e4567-e89b-12d3-a456-426614174019", "profile_picture_url": "p6.jpeg", "team_id": 4, "user_id": 19},
+    {"username": "VictorHugo", "cognito_id": "123e4567-e89b-12d3-a456-426614174020", "profile_picture_url": "p7.jpeg", "team_id": 5, "user_id": 20},
+]
+
+# --- Teams (5 records) ---
+SEED_TEAMS: List[Dict[str, Any]] = [
+    {"id": 1, "team_name": "BSR", "product_owner_user_id": 11, "project_manager_user_id": 2},
+    {"id": 2, "team_name": "GDT", "product_owner_user_id": 13, "project_manager_user_id": 4},
+    {"id": 3, "team_name": "Analytics", "product_owner_user_id": 15, "project_manager_user_id": 6},
+    {"id": 4, "team_name": "Devops", "product_owner_user_id": 17, "project_manager_user_id": 8},
+    {"id": 5, "team_name": "Automation", "product_owner_user_id": 19, "project_manager_user_id": 10},
+]
+
+# --- Projects (9 records, no project 2) ---
+SEED_PROJECTS: List[Dict[str, Any]] = [
+    {"name": "Formula 1", "description": "A space exploration project.", "start_date": "2023-01-01T00:00:00Z", "end_date": "2023-12-31T00:00:00Z", "id": 1},
+    {"name": "Cricket", "description": "A project to boost renewable energy use.", "start_date": "2023-03-05T00:00:00Z", "end_date": "2024-03-05T00:00:00Z", "id": 3},
+    {"name": "Tennis", "description": "Tennis project for new software development techniques.", "start_date": "2023-01-20T00:00:00Z", "end_date": "2023-09-20T00:00:00Z", "id": 4},
+    {"name": "Echo", "description": "Echo project focused on AI advancements.", "start_date": "2023-04-15T00:00:00Z", "end_date": "2023-11-30T00:00:00Z", "id": 5},
+    {"name": "Foot Ball", "description": "Exploring cutting-edge biotechnology.", "start_date": "2023-02-25T00:00:00Z", "end_date": "2023-08-25T00:00:00Z", "id": 6},
+    {"name": "Golf", "description": "Development of new golf equipment using AI.", "start_date": "2023-05-10T00:00:00Z", "end_date": "2023-12-10T00:00:00Z", "id": 7},
+    {"name": "Hockey", "description": "Hockey management system overhaul.", "start_date": "2023-03-01T00:00:00Z", "end_date": "2024-01-01T00:00:00Z", "id": 8},
+    {"name": "India", "description": "Telecommunication infrastructure upgrade.", "start_date": "2023-06-01T00:00:00Z", "end_date": "2023-12-01T00:00:00Z", "id": 9},
+    {"name": "Judo", "description": "Initiative to enhance cyber-security measures.", "start_date": "2023-07-01T00:00:00Z", "end_date": "2024-02-01T00:00:00Z", "id": 10},
+]
+
+# --- Tasks (40 records) ---
+SEED_TASKS: List[Dict[str, Any]] = [
+    {"title": "Task 1", "description": "Design the main module.", "status": "Work In Progress", "priority": "Urgent", "tags": "Design", "start_date": "2023-01-10T00:00:00Z", "due_date": "2023-04-10T00:00:00Z", "points": 5, "project_id": 1, "author_user_id": 1, "assigned_user_id": 2, "id": 1},
+    {"title": "Task 2", "description": "Implement the navigation algorithm.", "status": "To Do", "priority": "High", "tags": "Coding", "start_date": "2023-01-15T00:00:00Z", "due_date": "2023-05-15T00:00:00Z", "points": 8, "project_id": 2, "author_user_id": 3, "assigned_user_id": 4, "id": 2},
+    {"title": "Task 3", "description": "Develop renewable energy solutions.", "status": "Work In Progress", "priority": "Urgent", "tags": "Development", "start_date": "2023-03-20T00:00:00Z", "due_date": "2023-09-20T00:00:00Z", "points": 13, "project_id": 3, "author_user_id": 5, "assigned_user_id": 6, "id": 3},
+    {"title": "Task 4", "description": "Outline new software development workflows.", "status": "To Do", "priority": "High", "tags": "Planning", "start_date": "2023-01-25T00:00:00Z", "due_date": "2023-06-25T00:00:00Z", "points": 2, "project_id": 4, "author_user_id": 7, "assigned_user_id": 8, "id": 4},
+    {"title": "Task 5", "description": "Research AI models for prediction.", "status": "Work In Progress", "priority": "Urgent", "tags": "Research", "start_date": "2023-04-20T00:00:00Z", "due_date": "2023-10-20T00:00:00Z", "points": 5, "project_id": 5, "author_user_id": 9, "assigned_user_id": 10, "id": 5},
+    {"title": "Task 6", "description": "Biotech product testing.", "status": "To Do", "priority": "Backlog", "tags": "Testing", "start_date": "2023-03-01T00:00:00Z", "due_date": "2023-08-01T00:00:00Z", "points": 3, "project_id": 6, "author_user_id": 11, "assigned_user_id": 12, "id": 6},
+    {"title": "Task 7", "description": "AI optimization for golf equipment.", "status": "Work In Progress", "priority": "Urgent", "tags": "Optimization", "start_date": "2023-05-15T00:00:00Z", "due_date": "2023-11-15T00:00:00Z", "points": 8, "project_id": 7, "author_user_id": 13, "assigned_user_id": 14, "id": 7},
+    {"title": "Task 8", "description": "Overhaul of the database for Hockey management.", "status": "To Do", "priority": "High", "tags": "Database", "start_date": "2023-04-01T00:00:00Z", "due_date": "2023-10-01T00:00:00Z", "points": 13, "project_id": 8, "author_user_id": 15, "assigned_user_id": 16, "id": 8},
+    {"title": "Task 9", "description": "Upgrade telecom infrastructure.", "status": "Work In Progress", "priority": "Urgent", "tags": "Infrastructure", "start_date": "2023-06-10T00:00:00Z", "due_date": "2023-12-10T00:00:00Z", "points": 5, "project_id": 9, "author_user_id": 17, "assigned_user_id": 18, "id": 9},
+    {"title": "Task 10", "description": "Enhance security protocols.", "status": "To Do", "priority": "Urgent", "tags": "Security", "start_date": "2023-07-05T00:00:00Z", "due_date": "2024-01-05T00:00:00Z", "points": 8, "project_id": 10, "author_user_id": 19, "assigned_user_id": 20, "id": 10},
+    {"title": "Task 11", "description": "Finalize AI training parameters.", "status": "Work In Progress", "priority": "Urgent", "tags": "AI, Training", "start_date": "2023-01-20T00:00:00Z", "due_date": "2023-05-20T00:00:00Z", "points": 3, "project_id": 5, "author_user_id": 1, "assigned_user_id": 3, "id": 11},
+    {"title": "Task 12", "description": "Update server security protocols.", "status": "To Do", "priority": "High", "tags": "Security", "start_date": "2023-02-10T00:00:00Z", "due_date": "2023-06-10T00:00:00Z", "points": 2, "project_id": 1, "author_user_id": 2, "assigned_user_id": 4, "id": 12},
+    {"title": "Task 13", "description": "Redesign user interface for better UX.", "status": "Work In Progress", "priority": "Urgent", "tags": "Design, UX", "start_date": "2023-03-15T00:00:00Z", "due_date": "2023-07-15T00:00:00Z", "points": 5, "project_id": 2, "author_user_id": 5, "assigned_user_id": 6, "id": 13},
+    {"title": "Task 14", "description": "Implement real-time data analytics.", "status": "To Do", "priority": "High", "tags": "Analytics", "start_date": "2023-04-05T00:00:00Z", "due_date": "2023-08-05T00:00:00Z", "points": 8, "project_id": 3, "author_user_id": 7, "assigned_user_id": 8, "id": 14},
+    {"title": "Task 15", "description": "Develop end-to-end encryption solution.", "status": "Work In Progress", "priority": "Urgent", "tags": "Encryption", "start_date": "2023-05-01T00:00:00Z", "due_date": "2023-09-01T00:00:00Z", "points": 13, "project_id": 4, "author_user_id": 9, "assigned_user_id": 10, "id": 15},
+    {"title": "Task 16", "description": "Optimize cloud storage usage.", "status": "To Do", "priority": "Backlog", "tags": "Cloud, Storage", "start_date": "2023-06-15T00:00:00Z", "due_date": "2023-10-15T00:00:00Z", "points": 3, "project_id": 5, "author_user_id": 11, "assigned_user_id": 12, "id": 16},
+    {"title": "Task 17", "description": "Test software for hardware compatibility.", "status": "Work In Progress", "priority": "Urgent", "tags": "Testing, Hardware", "start_date": "2023-07-10T00:00:00Z", "due_date": "2023-11-10T00:00:00Z", "points": 5, "project_id": 6, "author_user_id": 13, "assigned_user_id": 14, "id": 17},
+    {"title": "Task 18", "description": "Create new data visualization tools.", "status": "To Do", "priority": "High", "tags": "Visualization", "start_date": "2023-08-05T00:00:00Z", "due_date": "2023-12-05T00:00:00Z", "points": 8, "project_id": 7, "author_user_id": 15, "assigned_user_id": 16, "id": 18},
+    {"title": "Task 19", "description": "Build prototype for new IoT devices.", "status": "Work In Progress", "priority": "Urgent", "tags": "IoT", "start_date": "2023-09-01T00:00:00Z", "due_date": "2024-01-01T00:00:00Z", "points": 13, "project_id": 8, "author_user_id": 17, "assigned_user_id": 18, "id": 19},
+    {"title": "Task 20", "description": "Update legacy systems to new tech standards.", "status": "To Do", "priority": "Urgent", "tags": "Legacy, Upgrade", "start_date": "2023-10-10T00:00:00Z", "due_date": "2024-02-10T00:00:00Z", "points": 5, "project_id": 9, "author_user_id": 19, "assigned_user_id": 20, "id": 20},
+    {"title": "Task 21", "description": "Establish new network security framework.", "status": "Work In Progress", "priority": "Urgent", "tags": "Security", "start_date": "2023-01-30T00:00:00Z", "due_date": "2023-05-30T00:00:00Z", "points": 8, "project_id": 10, "author_user_id": 1, "assigned_user_id": 3, "id": 21},
+    {"title": "Task 22", "description": "Revise application deployment strategies.", "status": "To Do", "priority": "High", "tags": "Deployment", "start_date": "2023-02-20T00:00:00Z", "due_date": "2023-06-20T00:00:00Z", "points": 3, "project_id": 1, "author_user_id": 2, "assigned_user_id": 4, "id": 22},
+    {"title": "Task 23", "description": "Conduct market analysis for product fit.", "status": "Work In Progress", "priority": "Urgent", "tags": "Market Analysis", "start_date": "2023-03-25T00:00:00Z", "due_date": "2023-07-25T00:00:00Z", "points": 5, "project_id": 2, "author_user_id": 5, "assigned_user_id": 6, "id": 23},
+    {"title": "Task 24", "description": "Optimize user feedback collection mechanism.", "status": "To Do", "priority": "High", "tags": "Feedback", "start_date": "2023-04-15T00:00:00Z", "due_date": "2023-08-15T00:00:00Z", "points": 8, "project_id": 3, "author_user_id": 7, "assigned_user_id": 8, "id": 24},
+    {"title": "Task 25", "description": "Integrate new API for third-party services.", "status": "Work In Progress", "priority": "Urgent", "tags": "API Integration", "start_date": "2023-05-05T00:00:00Z", "due_date": "2023-09-05T00:00:00Z", "points": 13, "project_id": 4, "author_user_id": 9, "assigned_user_id": 10, "id": 25},
+    {"title": "Task 26", "description": "Update internal tooling for development teams.", "status": "To Do", "priority": "Backlog", "tags": "Tooling", "start_date": "2023-06-25T00:00:00Z", "due_date": "2023-10-25T00:00:00Z", "points": 2, "project_id": 5, "author_user_id": 11, "assigned_user_id": 12, "id": 26},
+    {"title": "Task 27", "description": "Prepare cloud migration strategy document.", "status": "Work In Progress", "priority": "Urgent", "tags": "Cloud Migration", "start_date": "2023-07-20T00:00:00Z", "due_date": "2023-11-20T00:00:00Z", "points": 5, "project_id": 6, "author_user_id": 13, "assigned_user_id": 14, "id": 27},
+    {"title": "Task 28", "description": "Design scalable database architecture.", "status": "To Do", "priority": "Medium", "tags": "Database Design", "start_date": "2023-08-15T00:00:00Z", "due_date": "2023-12-15T00:00:00Z", "points": 8, "project_id": 7, "author_user_id": 15, "assigned_user_id": 16, "id": 28},
+    {"title": "Task 29", "description": "Prototype new mobile technology.", "status": "Work In Progress", "priority": "Urgent", "tags": "Mobile Tech", "start_date": "2023-09-10T00:00:00Z", "due_date": "2024-01-10T00:00:00Z", "points": 13, "project_id": 8, "author_user_id": 17, "assigned_user_id": 18, "id": 29},
+    {"title": "Task 30", "description": "Enhance data encryption levels.", "status": "To Do", "priority": "High", "tags": "Encryption", "start_date": "2023-10-15T00:00:00Z", "due_date": "2024-02-15T00:00:00Z", "points": 5, "project_id": 9, "author_user_id": 19, "assigned_user_id": 20, "id": 30},
+    {"title": "Task 31", "description": "Refactor backend code for better maintainability.", "status": "Work In Progress", "priority": "Urgent", "tags": "Refactoring, Backend", "start_date": "2023-11-01T00:00:00Z", "due_date": "2024-03-01T00:00:00Z", "points": 8, "project_id": 10, "author_user_id": 20, "assigned_user_id": 1, "id": 31},
+    {"title": "Task 32", "description": "Expand the network infrastructure to support increased traffic.", "status": "To Do", "priority": "Medium", "tags": "Networking, Infrastructure", "start_date": "2023-11-05T00:00:00Z", "due_date": "2024-01-05T00:00:00Z", "points": 3, "project_id": 1, "author_user_id": 2, "assigned_user_id": 3, "id": 32},
+    {"title": "Task 33", "description": "Create a new client dashboard interface.", "status": "Work In Progress", "priority": "Urgent", "tags": "UI, Dashboard", "start_date": "2023-11-10T00:00:00Z", "due_date": "2024-02-10T00:00:00Z", "points": 5, "project_id": 2, "author_user_id": 4, "assigned_user_id": 5, "id": 33},
+    {"title": "Task 34", "description": "Develop an automated testing framework for new software releases.", "status": "To Do", "priority": "Medium", "tags": "Testing, Automation", "start_date": "2023-11-15T00:00:00Z", "due_date": "2024-03-15T00:00:00Z", "points": 8, "project_id": 3, "author_user_id": 6, "assigned_user_id": 7, "id": 34},
+    {"title": "Task 35", "description": "Optimize database queries to improve application performance.", "status": "Work In Progress", "priority": "Urgent", "tags": "Database, Optimization", "start_date": "2023-11-20T00:00:00Z", "due_date": "2024-01-20T00:00:00Z", "points": 13, "project_id": 4, "author_user_id": 8, "assigned_user_id": 9, "id": 35},
+    {"title": "Task 36", "description": "Implement end-user training for new system features.", "status": "To Do", "priority": "Backlog", "tags": "Training, User Experience", "start_date": "2023-11-25T00:00:00Z", "due_date": "2024-01-25T00:00:00Z", "points": 2, "project_id": 5, "author_user_id": 10, "assigned_user_id": 11, "id": 36},
+    {"title": "Task 37", "description": "Conduct a comprehensive security audit of the existing infrastructure.", "status": "Work In Progress", "priority": "Urgent", "tags": "Security, Audit", "start_date": "2023-12-01T00:00:00Z", "due_date": "2024-02-01T00:00:00Z", "points": 5, "project_id": 6, "author_user_id": 12, "assigned_user_id": 13, "id": 37},
+    {"title": "Task 38", "description": "Revise mobile app to incorporate new payment integrations.", "status": "To Do", "priority": "Medium", "tags": "Mobile, Payments", "start_date": "2023-12-05T00:00:00Z", "due_date": "2024-02-05T00:00:00Z", "points": 8, "project_id": 7, "author_user_id": 14, "assigned_user_id": 15, "id": 38},
+    {"title": "Task 39", "description": "Update cloud configuration to optimize costs.", "status": "Work In Progress", "priority": "Urgent", "tags": "Cloud, Cost Saving", "start_date": "2023-12-10T00:00:00Z", "due_date": "2024-02-10T00:00:00Z", "points": 13, "project_id": 8, "author_user_id": 16, "assigned_user_id": 17, "id": 39},
+    {"title": "Task 40", "description": "Implement automated backup procedures for critical data.", "status": "To Do", "priority": "High", "tags": "Backup, Automation", "start_date": "2023-12-15T00:00:00Z", "due_date": "2024-02-15T00:00:00Z", "points": 5, "project_id": 9, "author_user_id": 18, "assigned_user_id": 19, "id": 40},
+]
+
+# --- Comments (25 records) ---
+SEED_COMMENTS: List[Dict[str, Any]] = [
+    {"id": 1, "text": "We need to update this design...", "task_id": 1, "user_id": 2},
+    {"id": 2, "text": "Can we move this to next sprint?", "task_id": 1, "user_id": 1},
+    {"id": 3, "text": "Starting implementation today.", "task_id": 2, "user_id": 4},
+    {"id": 4, "text": "Renewable energy research is underway.", "task_id": 3, "user_id": 6},
+    {"id": 5, "text": "Workflow documents finalized.", "task_id": 4, "user_id": 8},
+    {"id": 6, "text": "AI model training failed once.", "task_id": 5, "user_id": 10},
+    {"id": 7, "text": "Product testing successful.", "task_id": 6, "user_id": 12},
+    {"id": 8, "text": "Optimization results are promising.", "task_id": 7, "user_id": 14},
+    {"id": 9, "text": "Database overhaul planned.", "task_id": 8, "user_id": 16},
+    {"id": 10, "text": "Infrastructure upgrade ongoing.", "task_id": 9, "user_id": 18},
+    {"id": 11, "text": "Security protocols reviewed.", "task_id": 10, "user_id": 20},
+    {"id": 12, "text": "Server security update meeting...", "task_id": 12, "user_id": 2},
+    {"id": 13, "text": "UX mockups approved.", "task_id": 13, "user_id": 6},
+    {"id": 14, "text": "Data pipeline setup is complete.", "task_id": 14, "user_id": 8},
+    {"id": 15, "text": "Encryption keys generated.", "task_id": 15, "user_id": 10},
+    {"id": 16, "text": "Cloud storage usage is high.", "task_id": 16, "user_id": 12},
+    {"id": 17, "text": "Hardware compatibility test passed.", "task_id": 17, "user_id": 14},
+    {"id": 18, "text": "Visualization library chosen.", "task_id": 18, "user_id": 16},
+    {"id": 19, "text": "IoT prototype assembly started.", "task_id": 19, "user_id": 18},
+    {"id": 20, "text": "Legacy system analysis complete.", "task_id": 20, "user_id": 20},
+    {"id": 21, "text": "New framework documentation is pending.", "task_id": 21, "user_id": 3},
+    {"id": 22, "text": "Deployment strategy needs final review.", "task_id": 22, "user_id": 4},
+    {"id": 23, "text": "Market analysis report sent to PO.", "task_id": 23, "user_id": 6},
+    {"id": 24, "text": "Feedback mechanism needs testing.", "task_id": 24, "user_id": 8},
+    {"id": 25, "text": "API keys are in the vault.", "task_id": 25, "user_id": 10},
+]
+
+# --- Attachments (10 records) ---
+SEED_ATTACHMENTS: List[Dict[str, Any]] = [
+    {"id": 1, "file_url": "i1.jpg", "file_name": "DesignDoc.pdf", "task_id": 1, "uploaded_by_id": 1},
+    {"id": 2, "file_url": "i2.pdf", "file_name": "Algorithm.zip", "task_id": 2, "uploaded_by_id": 3},
+    {"id": 3, "file_url": "i3.docx", "file_name": "RenewablePlan.docx", "task_id": 3, "uploaded_by_id": 5},
+    {"id": 4, "file_url": "i4.png", "file_name": "Workflow_Mockup.png", "task_id": 4, "uploaded_by_id": 7},
+    {"id": 5, "file_url": "i5.xlsx", "file_name": "AI_Research_Summary.xlsx", "task_id": 5, "uploaded_by_id": 9},
+    {"id": 6, "file_url": "i6.jpeg", "file_name": "Test_Results.jpeg", "task_id": 6, "uploaded_by_id": 11},
+    {"id": 7, "file_url": "i7.mp4", "file_name": "Optimization_Video.mp4", "task_id": 7, "uploaded_by_id": 13},
+    {"id": 8, "file_url": "i8.json", "file_name": "DB_Schema.json", "task_id": 8, "uploaded_by_id": 15},
+    {"id": 9, "file_url": "i9.pptx", "file_name": "Upgrade_Plan.pptx", "task_id": 9, "uploaded_by_id": 17},
+    {"id": 10, "file_url": "i10.html", "file_name": "Security_Checklist.html", "task_id": 10, "uploaded_by_id": 19},
+]
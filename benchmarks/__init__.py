@@ -0,0 +1,9 @@
+"""
+QC performance benchmarks on synthetic data.
+
+    python -m benchmarks.run --rows 10000 100000 --markets 40 --output bench.json
+
+`benchmarks.synthetic` writes BSR / obligation / overnight / Rosco workbooks in
+the layouts the loaders expect; `benchmarks.run` times every check and saves
+the results as JSON (with the git commit) so runs can be compared.
+"""
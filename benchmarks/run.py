@@ -0,0 +1,194 @@
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import build_dataset
+from C_data_processing_f1 import BSRValidator
+from qc_checks import detect_period_from_rosco, load_bsr
+from qc_metrics import CheckProfile
+from qc_registry import QC_CHECKS, run_checks
+
+DEFAULT_ROWS = [10_000, 100_000, 1_000_000]
+DEFAULT_WORKDIR = os.path.join(tempfile.gettempdir(), "qc_benchmarks")
+
+
+# ----------------------------- ⏱️ Timing -----------------------------
+def _timed(name, rows_in, func):
+    """Runs func() under a CheckProfile. Returns (result, entry) where entry is the check's benchmark record."""
+    profile = CheckProfile(rows_in)
+    error = None
+    result = None
+    # The checks print per-row debug output; keep it out of the timings and the table
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), profile:
+        try:
+            result = func()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+    entry = {"check": name, **profile.as_dict()}
+    entry["rows_per_second"] = round(rows_in / entry["wall_seconds"], 1) if rows_in and entry["wall_seconds"] else None
+    if error:
+        entry["error"] = error
+    return result, entry
+
+
+# ----------------------------- 🧪 Suites -----------------------------
+def bench_qc(paths) -> list:
+    """Loads the BSR, then times each qc_checks check in serial order and the full DAG run."""
+    entries = []
+    period, entry = _timed("detect_period_from_rosco", None, lambda: detect_period_from_rosco(paths["rosco"]))
+    entries.append(entry)
+    start_date, end_date = period or (None, None)
+    df, entry = _timed("load_bsr", None, lambda: load_bsr(paths["bsr"]))
+    entry["rows_out"] = len(df)
+    entries.append(entry)
+
+    context = {"start_date": start_date, "end_date": end_date, "df_data": None, "rosco_path": paths["rosco"]}
+    current = df.copy()
+    for spec in QC_CHECKS:
+        kwargs = {param: context.get(key) for param, key in spec.context.items()}
+        out, entry = _timed(spec.name, len(current), lambda: spec.func(current.copy(), **kwargs))
+        if out is not None:
+            entry["rows_out"] = len(out)
+            current = out
+        entries.append(entry)
+
+    _, entry = _timed("run_checks (DAG)", len(df), lambda: run_checks(df, QC_CHECKS, context=context))
+    entry["rows_out"] = len(df)
+    entries.append(entry)
+    return entries
+
+
+def bench_market(paths, checks=None) -> list:
+    """Times BSRValidator loading and every market check, each on a fresh copy of the loaded BSR."""
+    entries = []
+    validator, entry = _timed("BSRValidator (load)", None, lambda: BSRValidator(
+        bsr_path=paths["bsr"], obligation_path=paths["obligation"], overnight_path=paths["overnight"]
+    ))
+    if validator is None:
+        entries.append(entry)
+        return entries
+    entry["rows_out"] = len(validator.df)
+    entries.append(entry)
+
+    _, entry = _timed("_load_full_obligation_data", None, validator._load_full_obligation_data)
+    entries.append(entry)
+    overnight, entry = _timed("_load_overnight_data", None, validator._load_overnight_data)
+    if overnight is not None:
+        entry["rows_out"] = len(overnight)
+    entries.append(entry)
+
+    base = validator.df
+    for key in checks or list(validator.market_check_map):
+        validator.df = base.copy()
+        summaries, entry = _timed(key, len(base), lambda: validator.market_check_processor([key]))
+        entry["rows_out"] = len(validator.df)
+        failed = [s for s in summaries or [] if isinstance(s, dict) and s.get("status") == "Failed"]
+        if failed:
+            entry["error"] = failed[0].get("description")
+        entries.append(entry)
+    return entries
+
+
+# ----------------------------- 📄 Report -----------------------------
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(run):
+    print(f"\n=== {run['rows']:,} rows / {run['markets']} markets ===")
+    for suite in ("qc", "market"):
+        if suite not in run:
+            continue
+        print(f"--- {suite} ---")
+        print(f"{'check':45} {'wall s':>9} {'cpu s':>9} {'rows/s':>12} {'peak MB':>8}")
+        for e in run[suite]:
+            peak = e["peak_rss_delta_bytes"]
+            print(
+                f"{e['check'][:45]:45} {e['wall_seconds']:9.3f} {e['cpu_seconds']:9.3f} "
+                f"{e['rows_per_second'] or 0:12,.0f} {(peak or 0) / 2**20:8.1f}"
+                + ("  ERROR: " + e["error"][:60] if e.get("error") else "")
+            )
+
+
+def compare(previous_path, report):
+    """Prints wall-time ratios (new / old) per check against an earlier JSON report."""
+    with open(previous_path) as f:
+        previous = json.load(f)
+    old = {
+        (run["rows"], suite, e["check"]): e["wall_seconds"]
+        for run in previous["runs"] for suite in ("qc", "market") for e in run.get(suite, [])
+    }
+    print(f"\n=== Compared with {previous.get('git_commit') or previous_path} (new / old wall time) ===")
+    for run in report["runs"]:
+        for suite in ("qc", "market"):
+            for e in run.get(suite, []):
+                before = old.get((run["rows"], suite, e["check"]))
+                if before:
+                    print(f"{run['rows']:>9,} {suite:7} {e['check'][:45]:45} {e['wall_seconds'] / before:6.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the QC checks on synthetic BSR data.")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS)
+    parser.add_argument("--markets", type=int, default=40)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.02)
+    parser.add_argument("--overlap-ratio", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", default=DEFAULT_WORKDIR, help="Where generated workbooks are kept (reused across runs)")
+    parser.add_argument("--output", help="JSON file for the results")
+    parser.add_argument("--compare", help="Earlier JSON results to compare against")
+    parser.add_argument("--skip-qc", action="store_true")
+    parser.add_argument("--skip-market", action="store_true")
+    parser.add_argument("--market-checks", nargs="+", help="Only these market_check_map keys")
+    args = parser.parse_args(argv)
+
+    report = {
+        "git_commit": _git_commit(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "parameters": {
+            "markets": args.markets, "duplicate_ratio": args.duplicate_ratio,
+            "overlap_ratio": args.overlap_ratio, "seed": args.seed,
+        },
+        "runs": [],
+    }
+    for rows in args.rows:
+        print(f"Preparing {rows:,} rows in {args.workdir} ...")
+        paths = build_dataset(args.workdir, rows, args.markets, args.duplicate_ratio, args.overlap_ratio, args.seed)
+        run = {"rows": rows, "markets": args.markets}
+        if not args.skip_qc:
+            run["qc"] = bench_qc(paths)
+        if not args.skip_market:
+            run["market"] = bench_market(paths, args.market_checks)
+        report["runs"].append(run)
+        print_table(run)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✅ Results saved to {args.output}")
+    if args.compare:
+        compare(args.compare, report)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+from qc_reference import DEFAULT_REFERENCE, OBLIGATION_SHEET
+
+# Same layout as a client BSR "Worksheet" (title rows, then the header)
+BSR_COLUMNS = [
+    "Region", "Market", "Market ID", "Broadcaster", "TV-Channel", "Channel ID", "Pay/Free TV",
+    "Date", "Date (UTC/GMT)", "Day", "Start", "End", "Start (UTC)", "End (UTC)", "Duration",
+    "Type of program", "Program Title", "Program Description", "Combined",
+    "Competition", "Event", "Matchday", "Source",
+    "TVR% 3+", "Aud Metered (000s) 3+", "Aud. Estimates ['000s]", "CPT's [Euro]", "Spot price in Euro [30 sec.]",
+]
+OVERNIGHT_COLUMNS = ["Country", "Channel", "Date", "Session", "Grand Prix", "Audience"]
+
+# Markets the market checks have rules for come first
+KNOWN_MARKETS = [
+    "Germany", "Austria", "Switzerland", "Luxembourg", "UK", "Ireland", "France", "Monaco",
+    "South Africa", "Pan Africa", "Fiji", "Papua New Guinea", "Brazil", "Mexico", "Argentina",
+    "Italy", "Netherlands", "Poland", "Latvia", "Andorra", "Serbia", "Japan", "India", "Greece",
+]
+LATAM_MARKETS = {"Brazil", "Mexico", "Argentina"}
+
+SESSIONS = ["Practice 1", "Practice 2", "Practice 3", "Qualifying", "Race"]
+DURATIONS = np.array([5, 15, 30, 60, 90, 120, 150])
+DURATION_WEIGHTS = np.array([0.05, 0.15, 0.2, 0.2, 0.15, 0.15, 0.1])
+FIRST_DAY = datetime.datetime(2025, 7, 3)
+
+
+# ----------------------------- 🏗️ Market Layout -----------------------------
+def market_names(n_markets: int) -> list:
+    """`n_markets` names: the markets with dedicated rules first, then generic ones."""
+    return KNOWN_MARKETS[:n_markets] + [f"Market {i}" for i in range(len(KNOWN_MARKETS), n_markets)]
+
+
+def channels_for(rows: int, n_markets: int) -> int:
+    """Channels per market keeping about a week of airings per channel (~80 rows)."""
+    return max(3, -(-rows // (n_markets * 80)))
+
+
+def market_channels(n_markets: int, channels_per_market: int = 3) -> pd.DataFrame:
+    """
+    One row per (market, channel) with the broadcaster group, region and IDs.
+    Channel / group names come from the reference obligation map, so the
+    obligation check finds matches.
+    """
+    groups = list(DEFAULT_REFERENCE["obligation_channel_to_bsr_group"].items())
+    rows = []
+    for m, market in enumerate(market_names(n_markets)):
+        region = "Central & South America" if market in LATAM_MARKETS else "Europe"
+        for c in range(channels_per_market):
+            channel, group = groups[(m * channels_per_market + c) % len(groups)]
+            rows.append({
+                "Region": region,
+                "Market": market,
+                "Market ID": 1000 + m,
+                "Broadcaster": group,
+                "TV-Channel": channel if c == 0 else f"{channel} {c + 1}",
+                "Channel ID": 100000 + m * channels_per_market + c,
+            })
+    return pd.DataFrame(rows)
+
+
+# ----------------------------- 📺 BSR -----------------------------
+def synthetic_bsr(rows: int, n_markets: int = 40, duplicate_ratio: float = 0.02, overlap_ratio: float = 0.02,
+                  channels_per_market: int = None, seed: int = 0) -> pd.DataFrame:
+    """
+    Synthetic BSR rows.
+
+    Airings are laid out back to back (with gaps) per channel, spilling into
+    the following days; `overlap_ratio` of them start inside the previous
+    airing on their channel and `duplicate_ratio` of the rows are exact copies
+    of other rows. Program types mostly follow the duration, with some noise.
+    """
+    rng = np.random.default_rng(seed)
+    channels = market_channels(n_markets, channels_per_market or channels_for(rows, n_markets))
+    channel = rng.integers(0, len(channels), rows)
+    duration = rng.choice(DURATIONS, rows, p=DURATION_WEIGHTS)
+    gap = rng.integers(0, 45, rows)
+
+    # Back-to-back schedule per channel: start = running total of earlier durations + gaps
+    order = np.argsort(channel, kind="stable")
+    step = (duration + gap)[order]
+    totals = np.cumsum(step) - step
+    first = np.r_[True, channel[order][1:] != channel[order][:-1]]
+    totals -= np.maximum.accumulate(np.where(first, totals, 0))
+    start_min = np.empty(rows, dtype=np.int64)
+    start_min[order] = totals + rng.integers(0, 600, len(channels))[channel[order]]
+
+    # Overlaps: start inside the previous airing of the same channel
+    overlapping = rng.random(rows) < overlap_ratio
+    prev = np.empty(rows, dtype=np.int64)
+    prev[order] = np.r_[order[0], order[:-1]]
+    same_channel = channel[prev] == channel
+    overlapping &= same_channel & (prev != np.arange(rows))
+    start_min = np.where(overlapping, start_min[prev] + np.maximum(duration[prev] // 2, 1), start_min)
+
+    start = pd.to_datetime(FIRST_DAY) + pd.to_timedelta(start_min, unit="min")
+    end = start + pd.to_timedelta(duration, unit="min")
+
+    program_type = np.select(
+        [duration >= 120, duration >= 60, duration >= 30], ["Live", "Repeat", "Highlights"], default="Magazine"
+    ).astype(object)
+    noisy = rng.random(rows) < 0.1
+    program_type[noisy] = rng.choice(["Live", "Repeat", "Highlights", "Magazine", "Support"], noisy.sum())
+    session = rng.choice(SESSIONS, rows)
+
+    df = channels.iloc[channel].reset_index(drop=True)
+    df["Pay/Free TV"] = rng.choice(["Pay", "Free", "Pay OTT", "Client"], rows)
+    df["Date"] = start.normalize()
+    df["Date (UTC/GMT)"] = start.normalize()
+    df["Day"] = start.day_name()
+    df["Start"] = start.strftime("%H:%M:%S")
+    df["End"] = end.strftime("%H:%M:%S")
+    df["Start (UTC)"] = start.time
+    df["End (UTC)"] = end.time
+    df["Duration"] = [f"{d // 60:02d}:{d % 60:02d}:00" for d in duration]
+    df["Type of program"] = program_type
+    df["Program Title"] = "Formula 1 " + pd.Series(session) + " " + pd.Series(program_type)
+    df["Program Description"] = "Dutch Grand Prix"
+    df["Combined"] = df["Program Title"]
+    df["Competition"] = session
+    df["Event"] = "Dutch GP"
+    df["Matchday"] = "Round 15"
+    df["Source"] = rng.choice(["Meter", "Estimate"], rows, p=[0.7, 0.3])
+    df["TVR% 3+"] = np.where(rng.random(rows) < 0.05, np.nan, rng.random(rows).round(3))
+    df["Aud Metered (000s) 3+"] = (rng.gamma(2.0, 150.0, rows)).round(1)
+    df["Aud. Estimates ['000s]"] = (rng.gamma(2.0, 150.0, rows)).round(1)
+    df["CPT's [Euro]"] = np.where(rng.random(rows) < 0.05, np.nan, rng.uniform(1, 40, rows).round(2))
+    df["Spot price in Euro [30 sec.]"] = rng.uniform(100, 5000, rows).round(0)
+
+    # Exact duplicates of other rows
+    source = np.arange(rows)
+    duplicates = rng.random(rows) < duplicate_ratio
+    source[duplicates] = rng.integers(0, rows, duplicates.sum())
+    return df.iloc[source][BSR_COLUMNS].reset_index(drop=True)
+
+
+def write_bsr(path, rows, **options) -> str:
+    """Writes a synthetic BSR workbook ("Worksheet": two title rows, then the header)."""
+    df = synthetic_bsr(rows, **options)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Worksheet")
+    ws.append(["Broadcast Sales Report (synthetic)"])
+    ws.append([])
+    ws.append(BSR_COLUMNS)
+    _append_frame(ws, df)
+    wb.save(path)
+    return path
+
+
+# ----------------------------- 📑 Obligations / Overnight / Rosco -----------------------------
+def write_obligations(path, n_markets: int = 40, channels_per_market: int = 3, seed: int = 0) -> str:
+    """Obligation workbook for the reference target GP: about half the markets' main channels, plus some absent pairs."""
+    rng = np.random.default_rng(seed)
+    channels = market_channels(n_markets, channels_per_market)
+    main = channels.drop_duplicates("Market")
+    picked = main[rng.random(len(main)) < 0.5]
+    df = pd.DataFrame({
+        "GP": DEFAULT_REFERENCE["target_gp"],
+        "Country": picked["Market"].to_numpy(),
+        "Broadcaster": picked["TV-Channel"].to_numpy(),
+    })
+    missing = pd.DataFrame({"GP": DEFAULT_REFERENCE["target_gp"], "Country": ["Nowhere"], "Broadcaster": ["DAZN"]})
+    df = pd.concat([df, missing], ignore_index=True)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(OBLIGATION_SHEET)
+    ws.append(list(df.columns))
+    _append_frame(ws, df)
+    wb.save(path)
+    return path
+
+
+def write_overnight(path, rows: int, n_markets: int = 40, channels_per_market: int = 3, seed: int = 0) -> str:
+    """Overnight audience workbook ("DATA" sheet) on the BSR's markets/channels, GP column included."""
+    rng = np.random.default_rng(seed)
+    channels = market_channels(n_markets, channels_per_market).iloc[rng.integers(0, n_markets * channels_per_market, rows)]
+    df = pd.DataFrame({
+        "Country": channels["Market"].str.upper().to_numpy(),
+        "Channel": channels["TV-Channel"].to_numpy(),
+        "Date": pd.to_datetime(FIRST_DAY) + pd.to_timedelta(rng.integers(0, 4, rows), unit="D"),
+        "Session": rng.choice(SESSIONS, rows),
+        "Grand Prix": np.where(rng.random(rows) < 0.9, "15_Dutch GP", "14_British GP"),
+        "Audience": rng.integers(1_000, 2_000_000, rows),
+    })
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("DATA")
+    ws.append(OVERNIGHT_COLUMNS)
+    _append_frame(ws, df)
+    wb.save(path)
+    return path
+
+
+def write_rosco(path, start: datetime.date, end: datetime.date) -> str:
+    """Minimal Rosco with the 'Monitoring Periods' line detect_period_from_rosco reads."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Rosco")
+    ws.append(["Client", "Synthetic benchmark"])
+    ws.append(["Period", f"Monitoring Periods: {start:%Y-%m-%d} - {end:%Y-%m-%d}"])
+    wb.save(path)
+    return path
+
+
+def _append_frame(ws, df):
+    columns = []
+    for col in df.columns:
+        values = df[col].astype(object).where(df[col].notna(), None)
+        columns.append([v.to_pydatetime() if isinstance(v, pd.Timestamp) else v for v in values])
+    for row in zip(*columns):
+        ws.append(row)
+
+
+# ----------------------------- 📦 Data Sets -----------------------------
+def build_dataset(directory, rows, n_markets=40, duplicate_ratio=0.02, overlap_ratio=0.02, seed=0) -> dict:
+    """
+    Writes (or reuses, when the same parameters were generated before) the
+    workbooks of one benchmark size. Returns {"bsr", "obligation", "overnight", "rosco"} paths.
+    """
+    os.makedirs(directory, exist_ok=True)
+    tag = f"{rows}r_{n_markets}m_d{duplicate_ratio:g}_o{overlap_ratio:g}_s{seed}"
+    paths = {name: os.path.join(directory, f"{name}_{tag}.xlsx") for name in ("bsr", "obligation", "overnight", "rosco")}
+
+    channels = channels_for(rows, n_markets)
+    if not os.path.exists(paths["bsr"]):
+        write_bsr(paths["bsr"], rows, n_markets=n_markets, duplicate_ratio=duplicate_ratio,
+                  overlap_ratio=overlap_ratio, channels_per_market=channels, seed=seed)
+    if not os.path.exists(paths["obligation"]):
+        write_obligations(paths["obligation"], n_markets=n_markets, channels_per_market=channels, seed=seed)
+    if not os.path.exists(paths["overnight"]):
+        write_overnight(paths["overnight"], max(100, rows // 20), n_markets=n_markets, channels_per_market=channels, seed=seed)
+    if not os.path.exists(paths["rosco"]):
+        write_rosco(paths["rosco"], FIRST_DAY.date(), (FIRST_DAY + datetime.timedelta(days=6)).date())
+    return paths
@@ -1,6 +1,7 @@
 # DASHBOARD_BACKEND/main.py
 
 from fastapi import FastAPI
+from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.applications import Starlette
 from starlette.routing import Mount
@@ -11,13 +12,23 @@ import os
 from qc_api import qc_router # Import the APIRouter object
 # Import the Dashboard routes APIRouter
 from app.dashboard_routes import dashboard_router 
+from qc_executor import shutdown_pool
+from qc_reference import reload_reference
 
 # --- CONFIGURATIONS ---
 
-# The master app doesn't need the lifespan context since qc_app handles it.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Preload the QC reference data (maps, schedules, obligation index) once per server.
+    reload_reference()
+    # The QC process pool is created lazily on the first QC request; stop it on shutdown.
+    yield
+    shutdown_pool()
+
 master_app = FastAPI(
     title="Master Data Processing & Dashboard API",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # 1. CORS Middleware (Applied to the master app)
@@ -38,6 +49,8 @@ master_app.add_middleware(
     # --- CHANGE MADE HERE: Explicitly list all methods, including OPTIONS ---
     allow_methods=["GET", "POST", "PATCH", "PUT", "DELETE", "OPTIONS"], 
     allow_headers=["*"],
+    # Lets the browser read the paging cursor of GET /tasks
+    expose_headers=["X-Next-Cursor"],
 )
 
 # --- ROUTING/MOUNTING ---
@@ -343,8 +343,8 @@
 #     )
 
 
-from fastapi import APIRouter, FastAPI, Query, UploadFile, File, HTTPException, Form
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import APIRouter, FastAPI, Query, UploadFile, File, HTTPException, Form, Request, Header
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, StreamingResponse
 from contextlib import asynccontextmanager
 import pandas as pd 
 import os
@@ -353,33 +353,37 @@ import threading
 import shutil
 from typing import Optional, List
 from C_data_processing import DataExplorer
+from qc_cache import ParsedUploadCache
+from qc_ingest import ingest_upload
 from io import BytesIO
 import json
+import asyncio
+import uuid
 
 # --- QC Specific Imports ---
-from qc_checks import (
-    detect_period_from_rosco,
-    load_bsr,
-    period_check,
-    completeness_check,
-    overlap_duplicate_daybreak_check,
-    program_category_check,
-    duration_check,
-    check_event_matchday_competition,
-    market_channel_program_duration_check,
-    domestic_market_coverage_check,
-    rates_and_ratings_check,
-    duplicated_markets_check,
-    country_channel_id_check,
-    client_lstv_ott_check,
-    color_excel,
-    generate_summary_sheet,
-)
-
-from C_data_processing_f1 import ( 
-    BSRValidator, 
-    color_excel,
-    generate_summary_sheet,
+# Pipelines run in worker processes so pandas/openpyxl work never blocks the event loop
+from qc_pipelines import run_qc_pipeline, run_market_pipeline, QC_PIPELINE_CHECKS
+from qc_executor import acquire_qc_slot, run_in_pool
+from qc_reference import get_reference, reload_reference
+from qc_registry import check_versions
+from qc_result_cache import ResultCache, result_key
+from qc_incremental import BaselineStore
+from qc_metrics import record_summaries, render_metrics
+from qc_jobs import (
+    JOBS_DB_PATH,
+    JOB_COMPLETED,
+    JOB_FAILED,
+    TERMINAL_EVENTS,
+    init_job_store,
+    create_job,
+    pin_uploads,
+    release_uploads,
+    active_upload_paths,
+    purge_jobs,
+    fail_job,
+    get_job,
+    events_since,
+    execute_job,
 )
 
 MOCK_QC_SUMMARY = [
@@ -394,6 +398,19 @@ OUTPUT_FOLDER = os.path.join(BASE_DIR, "outputs")
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(OUTPUT_FOLDER, exist_ok=True)
 
+# Parsed uploads (and uploads too large to keep in memory, named by content hash) live under
+# UPLOAD_FOLDER; the folder is size-bounded (LRU)
+UPLOAD_CACHE_MAX_BYTES = int(os.getenv("QC_UPLOAD_CACHE_MAX_MB", "2048")) * 1024 * 1024
+upload_cache = ParsedUploadCache(UPLOAD_FOLDER, max_bytes=UPLOAD_CACHE_MAX_BYTES)
+
+# Finished results by (input hashes, checks + versions, reference version); a resubmission
+# of the same inputs gets the stored summaries and download URL without recomputing
+result_cache = ResultCache(OUTPUT_FOLDER)
+
+# Row fingerprints and check outputs of earlier QC runs, for re-validating a corrected
+# re-upload incrementally (the run's baseline_id is returned to the client)
+baseline_store = BaselineStore(os.path.join(OUTPUT_FOLDER, "baselines"))
+
 # -------------------- 🧹 Cleanup Functions --------------------
 def cleanup_old_files(folder_path, max_age_minutes=30):
     """Deletes files older than max_age_minutes."""
@@ -415,17 +432,40 @@ def start_background_cleanup():
     """Starts a background thread that cleans up old files every 5 minutes."""
     def run_cleanup():
         while True:
-            cleanup_old_files(UPLOAD_FOLDER, max_age_minutes=30)
+            # Uploads (and their parsed cache entries) are evicted by size, not age,
+            # so a re-uploaded workbook can still hit the cache; uploads of unfinished jobs are kept
+            upload_cache.evict(keep=active_upload_paths())
+            result_cache.evict()
+            baseline_store.evict()
             cleanup_old_files(OUTPUT_FOLDER, max_age_minutes=30)
+            purged = purge_jobs()
+            if purged:
+                print(f"🧹 Purged {purged} finished QC jobs")
             time.sleep(300)
 
     thread = threading.Thread(target=run_cleanup, daemon=True)
     thread.start()
 # -----------------------------------------------------------
 
+# Job store (and its upload pins) first: the cleanup thread reads the pins on its first pass
+init_job_store()
+
 # Start the cleanup thread
 start_background_cleanup()
 
+# -------------------- 📥 Upload ingestion --------------------
+async def _ingest(upload, owner):
+    """
+    ingest_upload into UPLOAD_FOLDER. A large upload spooled to disk is pinned
+    for `owner` straight away, so no cleanup pass can evict it before the
+    pipeline has read it; the owner calls release_uploads when done.
+    """
+    ingested = await ingest_upload(upload, UPLOAD_FOLDER)
+    if not ingested.in_memory:
+        pin_uploads(owner, [ingested.path])
+    return ingested
+
+
 # -------------------- 🧠 FastAPI Setup and Lifespan --------------------
 # NOTE: The lifespan context must be handled by the main application (master_app) 
 # or passed to the router via dependencies if state is required. 
@@ -489,82 +529,68 @@ async def read_sales(limit: int = Query(100, gt=0, lt=150000)):
 
 # -------------------- 🚀 FULL QC API Endpoint Using C_data_processing.py --------------------
 
+def _cached_result_response(cached, **extra):
+    """Response for a result cache hit (same shape as a fresh run, plus `cached`)."""
+    print(f"♻️ Result cache hit: {cached['download_url']}")
+    return JSONResponse(content={
+        "status": "Success",
+        "message": cached["message"],
+        "download_url": cached["download_url"],
+        "summaries": cached["summaries"],
+        "cached": True,
+        **extra,
+    })
+
+
 @router.post("/run_qc")
 async def run_qc_checks(
     rosco_file: UploadFile = File(..., description="The Rosco file (.xlsx)"),
     bsr_file: UploadFile = File(..., description="The BSR file (.xlsx)"),
-    data_file: Optional[UploadFile] = File(None, description="The optional Client Data file (.xlsx)")
+    data_file: Optional[UploadFile] = File(None, description="The optional Client Data file (.xlsx)"),
+    baseline_id: Optional[str] = Form(None, description="baseline_id returned for an earlier version of this BSR; only changed rows (and their groups) are re-checked")
 ):
-    # ... (QC logic remains, ensure you use local paths for the QC functions) ...
-    
-    # Define paths for uploaded files
-    rosco_path = os.path.join(UPLOAD_FOLDER, rosco_file.filename)
-    bsr_path = os.path.join(UPLOAD_FOLDER, bsr_file.filename)
-    data_path = None
-
+    # Reserve a QC worker before touching the uploads (503 + Retry-After when saturated)
+    qc_slot = acquire_qc_slot()
+    request_id = uuid.uuid4().hex
     try:
-        # 1. Save uploaded files to disk (for path-based QC functions)
-        with open(rosco_path, "wb") as buffer:
-            shutil.copyfileobj(rosco_file.file, buffer)
-        with open(bsr_path, "wb") as buffer:
-            shutil.copyfileobj(bsr_file.file, buffer)
-        
-        df_data = None
+        # 1. Read each upload once, hashed while streaming; the parsers read the in-memory
+        # bytes directly and only large files are written (under their content hash)
+        rosco_upload = await _ingest(rosco_file, request_id)
+        bsr_upload = await _ingest(bsr_file, request_id)
+        data_upload = None
         if data_file and data_file.filename:
-            data_path = os.path.join(UPLOAD_FOLDER, data_file.filename)
-            with open(data_path, "wb") as buffer:
-                shutil.copyfileobj(data_file.file, buffer)
-            df_data = pd.read_excel(data_path) 
-
-        # 2. Run QC Pipeline 
-        start_date, end_date = detect_period_from_rosco(rosco_path)
-        df = load_bsr(bsr_path)
-
-        df = period_check(df, start_date, end_date)
-        df = completeness_check(df)
-        df = overlap_duplicate_daybreak_check(df)
-        df = program_category_check(df)
-        df = duration_check(df)
-        df = check_event_matchday_competition(df, df_data=df_data, rosco_path=rosco_path)
-        df = market_channel_program_duration_check(df, reference_df=df_data)
-        df = domestic_market_coverage_check(df, reference_df=df_data)
-        df = rates_and_ratings_check(df)
-        df = duplicated_markets_check(df)
-        df = country_channel_id_check(df)
-        df = client_lstv_ott_check(df)
-
-        # 3. Generate Output File on Disk (in OUTPUT_FOLDER)
-        output_file = f"QC_Result_{os.path.splitext(bsr_file.filename)[0]}.xlsx"
+            data_upload = await _ingest(data_file, request_id)
+
+        # Same bytes, checks and check versions as an earlier run: reuse its result
+        cache_key = result_key(
+            "qc",
+            {"rosco": rosco_upload.sha256, "bsr": bsr_upload.sha256, "data": data_upload and data_upload.sha256},
+            check_versions(QC_PIPELINE_CHECKS),
+            get_reference().version,
+        )
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            return _cached_result_response(cached, baseline_id=cache_key)
+
+        # 2. Run QC Pipeline and generate the output file (in OUTPUT_FOLDER) in a worker process
+        # Keyed name: a cached entry must never point at a report another upload overwrote
+        output_file = f"QC_Result_{os.path.splitext(bsr_file.filename)[0]}_{cache_key[:8]}.xlsx"
         output_path = os.path.join(OUTPUT_FOLDER, output_file)
 
-        df.to_excel(output_path, index=False)
-        color_excel(output_path, df)
-        generate_summary_sheet(output_path, df)
-
-        # 💡 Extract the Summary Data (MOCK/Real Logic Needed Here)
-        # Since the backend usually generates this summary table, we need to extract it.
-        # TEMPORARY MOCK FOR SUMMARY DATA (You would replace this with actual logic):
-        summary_data = [
-    # 🚨 FIX 1: Use a dictionary structure instead of QcSummaryResult()
-                {
-                    "id": 1, 
-                    "description": "Period Integrity Check", 
-                    "action": "Audit", 
-                    "status": "Completed", 
-                    "total_issues_flagged": 0
-                },
-                {
-                    "id": 2, 
-                    "description": "Field Completeness Check", 
-                    "action": "Audit", 
-                    "status": "Issue Found", 
-                    "total_issues_flagged": 15
-                },
-                # ... and so on
-            ]
+        # Summary rows of the report, as dicts for the frontend table
+        summary_data = await run_in_pool(
+            run_qc_pipeline,
+            rosco_upload, bsr_upload, output_path,
+            data_path=data_upload, cache=upload_cache,
+            # This run becomes the baseline of the next corrected upload
+            baselines=baseline_store, baseline_id=cache_key, previous_baseline_id=baseline_id
+        )
+        record_summaries("qc", summary_data)
 
         # 4. Return JSON Response with Download URL
         download_url =  f"/api/qc/download_file?filename={output_file}"
+        message = "QC checks complete. File ready for download."
+        result_cache.put(cache_key, output_file, download_url, summary_data, message)
 
         # 4. Return FileResponse
         # return QcRunResponse(
@@ -576,18 +602,18 @@ async def run_qc_checks(
 
         return JSONResponse(content={
             "status": "Success",
-            "message": "QC checks complete. File ready for download.",
+            "message": message,
             "download_url": download_url,
-            "summaries": summary_data # List of dictionaries
+            "summaries": summary_data, # List of dictionaries
+            "baseline_id": cache_key
         })
 
     except Exception as e:
         print(f"QC Error: {e}")
-        for path in [rosco_path, bsr_path, data_path]:
-            if path and os.path.exists(path):
-                os.remove(path)
         raise HTTPException(status_code=500, detail=f"An error occurred during QC processing: {str(e)}")
     finally:
+        qc_slot.release()
+        release_uploads(request_id)
         await rosco_file.close()
         await bsr_file.close()
         if data_file: await data_file.close()
@@ -604,10 +630,6 @@ async def market_check_and_process(
     checks: str = Form(..., alias="checks", description="JSON list of check keys to run")
 ):
     
-    bsr_file_path = os.path.join(UPLOAD_FOLDER, bsr_file.filename)
-    obligation_path = None
-    overnight_path = None 
-    
     output_filename = f"Processed_BSR_{os.path.splitext(bsr_file.filename)[0]}_{int(time.time())}.xlsx"
     output_path = os.path.join(OUTPUT_FOLDER, output_filename)
     
@@ -626,65 +648,254 @@ async def market_check_and_process(
     # 🚨 DEBUGGING: This print statement shows the correctly parsed list
     print(f"Final checks list passed to validator: {checks_list_to_process}")
 
+    # Reserve a QC worker before touching the uploads (503 + Retry-After when saturated)
+    qc_slot = acquire_qc_slot()
+    request_id = uuid.uuid4().hex
     try:
-        # 1. Save Files
-        with open(bsr_file_path, "wb") as buffer: shutil.copyfileobj(bsr_file.file, buffer)
+        # 1. Ingest the uploads (in memory unless large; large ones under their content hash)
+        bsr_upload = await _ingest(bsr_file, request_id)
+        obligation_upload = None
+        overnight_upload = None
         if obligation_file and obligation_file.filename:
-            obligation_path = os.path.join(UPLOAD_FOLDER, obligation_file.filename)
-            with open(obligation_path, "wb") as buffer: shutil.copyfileobj(obligation_file.file, buffer)
+            obligation_upload = await _ingest(obligation_file, request_id)
         if overnight_file and overnight_file.filename:
-            overnight_path = os.path.join(UPLOAD_FOLDER, overnight_file.filename)
-            with open(overnight_path, "wb") as buffer: shutil.copyfileobj(overnight_file.file, buffer)
-
-        # 2. Instantiate and Run Validator
-        # Assuming BSRValidator is accessible
-        validator = BSRValidator(
-            bsr_path=bsr_file_path, 
-            obligation_path=obligation_path, 
-            overnight_path=overnight_path 
-        ) 
-        
-        # 3. Call the processor with the correctly parsed list
+            overnight_upload = await _ingest(overnight_file, request_id)
+
+        # Same bytes, checks (in order) and check versions as an earlier run: reuse its result
+        cache_key = result_key(
+            "market",
+            {
+                "bsr": bsr_upload.sha256,
+                "obligation": obligation_upload and obligation_upload.sha256,
+                "overnight": overnight_upload and overnight_upload.sha256,
+            },
+            check_versions(checks_list_to_process),
+            get_reference().version,
+        )
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            return _cached_result_response(cached)
+
+        # 2-4. Run BSRValidator with the parsed check list and write the output, in a worker process
         # This list is guaranteed to be ['duration_limits', ...]
-        status_summaries = validator.market_check_processor(checks_list_to_process)
-        df_processed = validator.df
-        
-        # 4. Finalize Output
-        clean_summaries = [s for s in status_summaries if isinstance(s, dict)]
-        if df_processed.empty: raise Exception("Processed DataFrame is empty after applying checks.")
-
-        df_processed.to_excel(output_path, index=False)
+        clean_summaries = await run_in_pool(
+            run_market_pipeline,
+            bsr_upload, checks_list_to_process, output_path,
+            obligation_path=obligation_upload,
+            overnight_path=overnight_upload,
+            cache=upload_cache
+        )
+        record_summaries("market", clean_summaries)
         
         # 5. Return Final JSON Response
         download_url = f"/api/qc/download_file?filename={output_filename}" 
+        message = f"Successfully applied {len(checks_list_to_process)} market checks. Processed file is ready for download."
+        result_cache.put(cache_key, output_filename, download_url, clean_summaries, message)
 
         return JSONResponse(content={
             "status": "Success",
-            "message": f"Successfully applied {len(checks_list_to_process)} market checks. Processed file is ready for download.",
+            "message": message,
             "download_url": download_url,
             "summaries": clean_summaries
         })
 
     except Exception as e:
         print(f"Market Check Error: {e}")
-        # Clean up files on error
-        for path in [bsr_file_path, obligation_path, overnight_path]:
-            if path and os.path.exists(path): os.remove(path)
-            
         raise HTTPException(status_code=500, detail=f"An error occurred during market checks: {str(e)}")
     finally:
-        # Close file streams and clean up disk files
+        qc_slot.release()
+        release_uploads(request_id)
+        # Close file streams (content-addressed upload files are left to the LRU eviction,
+        # another request may be reading the same bytes)
         if 'bsr_file' in locals() and bsr_file: await bsr_file.close()
         if 'obligation_file' in locals() and obligation_file: await obligation_file.close()
         if 'overnight_file' in locals() and overnight_file: await overnight_file.close()
-            
-        for path in [bsr_file_path, obligation_path, overnight_path]:
-            if path and os.path.exists(path): os.remove(path)
+
+# -------------------- ⏳ ASYNC QC JOB ENDPOINTS --------------------
+# Jobs return an id immediately; progress lives in the shared SQLite job store so any
+# uvicorn worker can answer status/event requests for a job started on another.
+
+SSE_POLL_SECONDS = float(os.getenv("QC_SSE_POLL_SECONDS", "0.5"))
+SSE_KEEPALIVE_SECONDS = 15
+
+# Keeps references to running job tasks so they are not garbage-collected mid-run
+_background_jobs = set()
+
+
+async def _run_job(job_id, kind, download_url, pipeline_kwargs, qc_slot):
+    try:
+        await run_in_pool(execute_job, job_id, kind, download_url, pipeline_kwargs, JOBS_DB_PATH)
+        job = get_job(job_id)
+        record_summaries(kind, job and job["summaries"])
+    except Exception as e:
+        print(f"QC Job {job_id} Error: {e}")
+        # The worker records its own failures; this covers a worker that died before it could
+        job = get_job(job_id)
+        if job and job["status"] not in (JOB_COMPLETED, JOB_FAILED):
+            fail_job(job_id, e)
+    finally:
+        qc_slot.release()
+        release_uploads(job_id)
+
+
+@router.post("/jobs", status_code=202)
+async def create_qc_job(
+    bsr_file: UploadFile = File(..., description="The BSR file (.xlsx)"),
+    rosco_file: Optional[UploadFile] = File(None, description="The Rosco file (.xlsx), required for the full QC run"),
+    data_file: Optional[UploadFile] = File(None, description="The optional Client Data file (.xlsx)"),
+    obligation_file: Optional[UploadFile] = File(None, description="F1 Obligation file"),
+    overnight_file: Optional[UploadFile] = File(None, description="Overnight Audience file"),
+    checks: Optional[str] = Form(None, description="JSON list of market check keys; runs the market checks instead of the full QC"),
+    baseline_id: Optional[str] = Form(None, description="Full QC only: baseline_id of an earlier version of this BSR to re-validate against")
+):
+    """Starts a QC job in the worker pool and returns its id without waiting for the result."""
+    if checks:
+        try:
+            checks_list_to_process: List[str] = json.loads(checks)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Invalid check list format: Expected JSON string, got {type(checks)}. Error: {e}")
+        if not checks_list_to_process:
+            raise HTTPException(status_code=400, detail="No checks were selected or passed.")
+        kind, job_checks = "market", checks_list_to_process
+    else:
+        if not (rosco_file and rosco_file.filename):
+            raise HTTPException(status_code=400, detail="rosco_file is required for the full QC run.")
+        kind, job_checks = "qc", QC_PIPELINE_CHECKS
+
+    # Reserve a QC worker before touching the uploads (503 + Retry-After when saturated)
+    qc_slot = acquire_qc_slot()
+    job_id = None
+    try:
+        job_id = create_job(kind, job_checks)
+        stem = os.path.splitext(bsr_file.filename)[0]
+
+        # Uploads are ingested once (in memory unless large, large ones under their
+        # content hash), so concurrent jobs never overwrite each other's files
+        bsr_upload = await _ingest(bsr_file, job_id)
+        if kind == "market":
+            output_filename = f"Processed_BSR_{stem}_{job_id[:8]}.xlsx"
+            pipeline_kwargs = {"bsr_path": bsr_upload, "checks": job_checks}
+            for key, upload in (("obligation_path", obligation_file), ("overnight_path", overnight_file)):
+                if upload and upload.filename:
+                    pipeline_kwargs[key] = await _ingest(upload, job_id)
+        else:
+            output_filename = f"QC_Result_{stem}_{job_id[:8]}.xlsx"
+            pipeline_kwargs = {"rosco_path": await _ingest(rosco_file, job_id), "bsr_path": bsr_upload}
+            if data_file and data_file.filename:
+                pipeline_kwargs["data_path"] = await _ingest(data_file, job_id)
+            # Same id the synchronous endpoint returns for these inputs
+            data_upload = pipeline_kwargs.get("data_path")
+            pipeline_kwargs["baselines"] = baseline_store
+            pipeline_kwargs["baseline_id"] = result_key(
+                "qc",
+                {"rosco": pipeline_kwargs["rosco_path"].sha256, "bsr": bsr_upload.sha256, "data": data_upload and data_upload.sha256},
+                check_versions(QC_PIPELINE_CHECKS),
+                get_reference().version,
+            )
+            pipeline_kwargs["previous_baseline_id"] = baseline_id
+        pipeline_kwargs["output_path"] = os.path.join(OUTPUT_FOLDER, output_filename)
+        pipeline_kwargs["cache"] = upload_cache
+        download_url = f"/api/qc/download_file?filename={output_filename}"
+
+        task = asyncio.create_task(_run_job(job_id, kind, download_url, pipeline_kwargs, qc_slot))
+        _background_jobs.add(task)
+        task.add_done_callback(_background_jobs.discard)
+    except Exception as e:
+        qc_slot.release()
+        if job_id: release_uploads(job_id)
+        print(f"QC Job Error: {e}")
+        raise HTTPException(status_code=500, detail=f"An error occurred while starting the QC job: {str(e)}")
+    finally:
+        for upload in (bsr_file, rosco_file, data_file, obligation_file, overnight_file):
+            if upload: await upload.close()
+
+    response = {
+        "job_id": job_id,
+        "status": "Queued",
+        "status_url": f"/api/qc/jobs/{job_id}",
+        "events_url": f"/api/qc/jobs/{job_id}/events",
+    }
+    if kind == "qc":
+        response["baseline_id"] = pipeline_kwargs["baseline_id"]
+    return response
+
+
+@router.get("/jobs/{job_id}")
+async def read_qc_job(job_id: str):
+    """Returns the job status, per-check progress and, once done, the download_url."""
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_qc_job_events(job_id: str, request: Request, last_event_id: Optional[str] = Header(None)):
+    """
+    Server-sent events: one `check_completed` event per finished check, then a final
+    `job_completed` (with download_url) or `job_failed` event. Reconnecting clients
+    resume after the Last-Event-ID they received.
+    """
+    if get_job(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+
+    async def event_stream():
+        last_seq = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+        idle = 0.0
+        while not await request.is_disconnected():
+            events = events_since(job_id, last_seq)
+            for seq, event, data in events:
+                last_seq = seq
+                yield f"id: {seq}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+                if event in TERMINAL_EVENTS:
+                    return
+            idle = 0.0 if events else idle + SSE_POLL_SECONDS
+            if idle >= SSE_KEEPALIVE_SECONDS:
+                idle = 0.0
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(SSE_POLL_SECONDS)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 # -------------------- 📥 DOWNLOAD ENDPOINT --------------------
 # 💡 NOTE: This endpoint needs to remain outside of the /qc prefix if its called as /api/download_file.
 # We will define a separate router for general utility, or rely on dashboard_router for /api.
 
+# -------------------- 📚 Reference Data --------------------
+@router.get("/reference")
+async def reference_info():
+    """Version of the reference data the QC checks are currently using."""
+    reference = get_reference()
+    return {"version": reference.version, "target_gp": reference.target_gp}
+
+
+@router.post("/reference/reload")
+async def reload_reference_data():
+    """
+    Reloads the reference data (QC_REFERENCE_PATH) and swaps it in atomically.
+    The version is published to QC_REFERENCE_STATE, so every uvicorn worker switches to it.
+    Running checks finish on the old version; the next pool task carries the new one to the workers.
+    """
+    previous = get_reference().version
+    try:
+        reference = await asyncio.to_thread(reload_reference)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Reference data could not be loaded, keeping version {previous}: {e}")
+    return {"status": "reloaded", "version": reference.version, "previous_version": previous}
+
+
+
+# -------------------- 📈 Metrics --------------------
+@router.get("/metrics")
+async def qc_metrics():
+    """Per-check wall/CPU time, peak RSS growth and row histograms in the Prometheus text format."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
 @router.get("/download_file")
 async def download_file(filename: str = Query(...)):
     """Retrieves a previously generated file from the output folder."""
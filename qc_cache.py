@@ -0,0 +1,174 @@
+import json
+import os
+import pickle
+import re
+import tempfile
+import threading
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc
+
+from qc_ingest import open_source, source_digest
+from qc_loader import normalize_object_nulls
+
+ENTRY_SUFFIX = ".arrow"
+SIDECAR_SUFFIX = ".pkl"
+# Files still being written (spooled uploads, cache entries before their rename)
+IN_PROGRESS_SUFFIXES = (".part", ".tmp")
+
+
+class ParsedUploadCache:
+    """
+    Content-addressed cache of parsed Excel uploads.
+
+    Entries are keyed by the SHA-256 of the uploaded bytes plus a variant name
+    (the sheet/loader used), and stored as Arrow IPC files under the upload
+    folder so a repeat upload is loaded through a memory map instead of being
+    re-parsed from .xlsx. Object columns Arrow cannot type (e.g. a Start column
+    mixing datetime.time and strings) are kept in a pickle sidecar.
+
+    The whole upload folder is kept under `max_bytes` with least-recently-used
+    eviction; reading an entry refreshes its mtime.
+    """
+
+    # Class-level so instances stay picklable when sent to QC worker processes
+    _lock = threading.Lock()
+
+    def __init__(self, upload_folder: str, max_bytes: int, subdir: str = "parsed"):
+        self.upload_folder = upload_folder
+        self.root = os.path.join(upload_folder, subdir)
+        self.max_bytes = max_bytes
+        os.makedirs(self.root, exist_ok=True)
+
+    def _entry_path(self, digest: str, variant: str) -> str:
+        slug = re.sub(r"[^A-Za-z0-9_-]+", "_", variant).strip("_").lower() or "default"
+        return os.path.join(self.root, f"{digest}.{slug}{ENTRY_SUFFIX}")
+
+    # --- Read / Write ---
+
+    def get(self, digest: str, variant: str):
+        """Returns (df, header_row) for a cached entry, or None on a miss."""
+        path = self._entry_path(digest, variant)
+        try:
+            with pa.memory_map(path, "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+        except (FileNotFoundError, pa.ArrowInvalid):
+            return None
+
+        meta = json.loads(table.schema.metadata[b"qc_cache"])
+        df = table.to_pandas()
+        if meta["pickled_columns"]:
+            sidecar = path[: -len(ENTRY_SUFFIX)] + SIDECAR_SUFFIX
+            try:
+                with open(sidecar, "rb") as f:
+                    extra = pickle.load(f)
+            except FileNotFoundError:
+                return None
+            for name, values in extra.items():
+                df[name] = values
+        df = df[meta["columns"]]
+        df = normalize_object_nulls(df)
+
+        self._touch(path)
+        return df, meta["header_row"]
+
+    def put(self, digest: str, variant: str, df: pd.DataFrame, header_row=None) -> None:
+        """Writes a parsed frame as an Arrow IPC file (atomically, via rename)."""
+        path = self._entry_path(digest, variant)
+        arrays, names, pickled = [], [], {}
+        for name in df.columns:
+            try:
+                arrays.append(pa.Array.from_pandas(df[name]))
+                names.append(name)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                pickled[name] = df[name].tolist()
+
+        meta = {"columns": list(df.columns), "header_row": header_row, "pickled_columns": list(pickled)}
+        table = pa.Table.from_arrays(arrays, names=names, metadata={"qc_cache": json.dumps(meta)})
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        os.close(fd)
+        try:
+            if pickled:
+                sidecar = path[: -len(ENTRY_SUFFIX)] + SIDECAR_SUFFIX
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(pickled, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, sidecar)
+            with pa.OSFile(tmp_path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def load(self, source, variant: str, loader, digest: str = None):
+        """
+        Returns the parsed frame for `source`, parsing it with `loader` only on a miss.
+
+        Args:
+            source: Path of the uploaded workbook or an IngestedUpload.
+            variant: Name of the sheet/loader combination (part of the cache key).
+            loader: Callable(readable source) -> (df, header_row) used on a miss.
+            digest: SHA-256 of the upload if already known.
+        """
+        digest = digest or source_digest(source)
+        cached = self.get(digest, variant)
+        if cached is not None:
+            print(f"Upload cache hit: {digest[:12]} [{variant}]")
+            return cached[0]
+
+        df, header_row = loader(open_source(source))
+        try:
+            self.put(digest, variant, df, header_row)
+        except Exception as e:
+            print(f"⚠️ Could not cache parsed upload {digest[:12]} [{variant}]: {e}")
+        return df
+
+    # --- Eviction ---
+
+    def _touch(self, path: str) -> None:
+        try:
+            os.utime(path, None)
+            sidecar = path[: -len(ENTRY_SUFFIX)] + SIDECAR_SUFFIX
+            if os.path.exists(sidecar):
+                os.utime(sidecar, None)
+        except OSError:
+            pass
+
+    def evict(self, keep=()) -> int:
+        """
+        Deletes least-recently-used files from the upload folder (raw uploads and
+        cache entries alike) until it fits in `max_bytes`. Returns bytes freed.
+
+        Files still being written and the paths in `keep` (uploads a queued or
+        running job has yet to read) are never deleted, but count towards the size.
+        """
+        keep = {os.path.abspath(p) for p in keep}
+        with self._lock:
+            files, total = [], 0
+            for dirpath, _, filenames in os.walk(self.upload_folder):
+                for filename in filenames:
+                    path = os.path.abspath(os.path.join(dirpath, filename))
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    total += st.st_size
+                    if filename.endswith(IN_PROGRESS_SUFFIXES) or path in keep:
+                        continue
+                    files.append((st.st_mtime, st.st_size, path))
+
+            freed = 0
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    freed += size
+                    print(f"🧹 Evicted upload cache file: {path}")
+                except OSError as e:
+                    print(f"⚠️ Error evicting {path}: {e}")
+            return freed
@@ -1,20 +1,27 @@
 import pandas as pd
+import numpy as np
 import re
-from openpyxl import load_workbook
-from openpyxl.styles import PatternFill
-from openpyxl.utils.dataframe import dataframe_to_rows
 
-DATE_FORMAT = "%Y-%m-%d"
+from qc_ingest import open_source
+from qc_loader import read_bsr_sheet
+from qc_report import write_qc_report
+from qc_intervals import find_overlaps
+from qc_idmap import id_bijection_columns
+from qc_matching import event_matchday_competition_columns, load_reference_competitions
+from qc_reference import get_reference
+from qc_durations import (
+    add_duration_minutes,
+    duration_minutes,
+    program_category_columns,
+    start_end_category_columns,
+)
 
-# Excel color styles
-GREEN_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-RED_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-HEADER_FILL = PatternFill(start_color="BDD7EE", end_color="BDD7EE", fill_type="solid")
+DATE_FORMAT = "%Y-%m-%d"
 
 
 # ----------------------------- 1️⃣ Detect Monitoring Period -----------------------------
 def detect_period_from_rosco(rosco_path):
-    df = pd.read_excel(rosco_path, header=None)
+    df = pd.read_excel(open_source(rosco_path), header=None)
     value_col = df.iloc[:, 1].astype(str)
     period_row = value_col[value_col.str.contains("Monitoring Periods", na=False)]
     if period_row.empty:
@@ -30,22 +37,17 @@ def detect_period_from_rosco(rosco_path):
 
 
 # ----------------------------- 2️⃣ Load BSR -----------------------------
-def detect_header_row(bsr_path):
-    df_sample = pd.read_excel(bsr_path, header=None, nrows=200)
-    for i, row in df_sample.iterrows():
-        row_str = " ".join(row.dropna().astype(str).tolist()).lower()
-        if "region" in row_str and "market" in row_str and "broadcaster" in row_str:
-            return i
-        if "date" in row_str and ("utc" in row_str or "gmt" in row_str):
-            return i
-    raise ValueError("Could not detect header row in BSR file.")
-
-
-def load_bsr(bsr_path):
-    header_row = detect_header_row(bsr_path)
-    df = pd.read_excel(bsr_path, header=header_row)
-    df.columns = [str(c).strip() for c in df.columns]
-    return df
+def load_bsr(bsr_path, cache=None):
+    """
+    Loads the first sheet of the BSR in a single streaming pass (header detected on the fly).
+    When a ParsedUploadCache is given, a previously parsed copy of the same bytes is reused.
+    """
+    if cache is not None:
+        df = cache.load(bsr_path, "bsr_sheet0", lambda src: read_bsr_sheet(src, sheet_name=0))
+    else:
+        df, _ = read_bsr_sheet(open_source(bsr_path), sheet_name=0)
+    # Duration is parsed once here; the checks read Duration_Minutes
+    return add_duration_minutes(df)
 
 
 # ----------------------------- 3️⃣ Period Check -----------------------------
@@ -86,27 +88,20 @@ def overlap_duplicate_daybreak_check(df):
         if col:
             df_result[col] = pd.to_datetime(df_result[col], errors="coerce")
 
-    overlap_flags = [False] * len(df_result)
     if channel_col and start_col and end_col and date_col:
-        df_sorted = df_result.sort_values(by=[channel_col, date_col, start_col]).reset_index(drop=True)
-        prev_end = prev_channel = prev_date = None
-        for i, row in df_sorted.iterrows():
-            overlap = False
-            if prev_channel == row[channel_col] and prev_date == row[date_col]:
-                if pd.notna(row[start_col]) and pd.notna(prev_end) and row[start_col] < prev_end:
-                    overlap = True
-            overlap_flags[i] = overlap
-            prev_end = row[end_col]
-            prev_channel = row[channel_col]
-            prev_date = row[date_col]
-        df_result["No_Overlap"] = ~pd.Series(overlap_flags, index=df_sorted.index)
+        # Vectorized sweep: flags rows starting before any earlier airing on the same channel/day ended
+        overlap, conflict_row = find_overlaps(df_result, [channel_col, date_col], start_col, end_col)
+        df_result["No_Overlap"] = ~overlap
     else:
+        conflict_row = pd.NA
         df_result["No_Overlap"] = True
 
     df_result["No_Overlap_Remark"] = df_result["No_Overlap"].apply(lambda x: "" if x else "Overlap detected")
+    df_result["Overlap_With_Row"] = conflict_row
 
     # Duplicate check
-    exclude_keywords = ["_ok", "within", "date_checked"]
+    # Overlap flags differ between otherwise identical rows, so they stay out of the hash
+    exclude_keywords = ["_ok", "within", "date_checked", "overlap"]
     dup_cols = [c for c in df_result.columns if not any(x in str(c).lower() for x in exclude_keywords)]
     if dup_cols:
         hashes = pd.util.hash_pandas_object(df_result[dup_cols], index=False)
@@ -135,49 +130,15 @@ def program_category_check(df):
         df["Program_Category_Remark"] = ""
         return df
 
-    def parse_duration(val):
-        if pd.isna(val):
-            return None
-        val_str = str(val).strip()
-        try:
-            if ":" in val_str:
-                t = pd.to_datetime(val_str, errors="coerce").time()
-                return t.hour * 60 + t.minute
-            else:
-                return float(val_str)
-        except Exception:
-            return None
-
-    def expected_category(duration_min):
-        if duration_min is None:
-            return "unknown"
-        if duration_min >= 120:
-            return "live"
-        elif 60 <= duration_min < 120:
-            return "repeat"
-        elif 30 <= duration_min < 60:
-            return "highlights"
-        elif 0 < duration_min < 30:
-            return "support"
-        else:
-            return "unknown"
-
-    results, remarks = [], []
-    for _, row in df.iterrows():
-        prog_val = str(row[prog_col]).strip().lower()
-        dur_min = parse_duration(row[dur_col])
-        expected = expected_category(dur_min)
-        ok = expected in prog_val or prog_val in expected
-        results.append(ok)
-        remarks.append("" if ok else f"Program type '{prog_val}' does not match duration category '{expected}'")
-
-    df["Program_Category_OK"] = results
+    # Durations come pre-parsed (Duration_Minutes); categories are assigned by vectorized binning
+    ok, remarks = program_category_columns(df, prog_col, dur_col)
+    df["Program_Category_OK"] = ok
     df["Program_Category_Remark"] = remarks
     return df
 
 
 # ----------------------------- 7️⃣ Duration Check -----------------------------
-def duration_check(df):
+def duration_check(df, debug_rows=20):
     """Validate program type vs actual duration (Start (UTC) / End (UTC))."""
     print("\n--- DEBUG: Running Duration Check ---")
 
@@ -207,64 +168,14 @@ def duration_check(df):
     df[start_col] = df[start_col].astype(str).str.strip()
     df[end_col] = df[end_col].astype(str).str.strip()
 
-    # --- Helper: parse HH:MM:SS to minutes ---
-    def parse_hms_to_minutes(val):
-        if not val or val in ["None", "nan", "NaT"]:
-            return None
-        try:
-            parts = val.split(":")
-            if len(parts) >= 2:
-                h, m = int(parts[0]), int(parts[1])
-                s = int(parts[2]) if len(parts) == 3 else 0
-                return h * 60 + m + s / 60
-        except Exception as e:
-            print(f"[WARN] Could not parse time '{val}': {e}")
-        return None
-
-    # --- Helper: classify by duration ---
-    def expected_category(duration_min):
-        if duration_min is None:
-            return "unknown"
-        if duration_min >= 120:
-            return "live"
-        elif 60 <= duration_min < 120:
-            return "repeat"
-        elif 30 <= duration_min < 60:
-            return "highlights"
-        elif 0 < duration_min < 30:
-            return "support"
-        else:
-            return "unknown"
-
-    expected_list = []
-    ok_list = []
-
-    for idx, row in df.iterrows():
-        start_val = row[start_col]
-        end_val = row[end_col]
-        actual_prog = str(row[type_col]).strip().lower() if pd.notna(row[type_col]) else "unknown"
-
-        start_min = parse_hms_to_minutes(start_val)
-        end_min = parse_hms_to_minutes(end_val)
-
-        if start_min is None or end_min is None:
-            duration_min = None
-        else:
-            duration_min = end_min - start_min
-            if duration_min < 0:
-                duration_min += 24 * 60  # Handle midnight crossover
-
-        expected = expected_category(duration_min)
-        ok = expected in actual_prog or actual_prog in expected
+    duration_min, expected, ok = start_end_category_columns(df, start_col, end_col, type_col)
 
-        expected_list.append(expected)
-        ok_list.append(ok)
+    for i in range(min(debug_rows, len(df))):
+        print(f"[Row {df.index[i]}] Start={df[start_col].iat[i]} | End={df[end_col].iat[i]} | Duration(min)={duration_min[i]} | "
+              f"Expected='{expected[i]}' | Actual='{df[type_col].iat[i]}' | OK={ok[i]}")
 
-        print(f"[Row {idx}] Start={start_val} | End={end_val} | Duration(min)={duration_min} | "
-              f"Expected='{expected}' | Actual='{actual_prog}' | OK={ok}")
-
-    df["Expected_Category_From_Duration"] = expected_list
-    df["Duration_Check_OK"] = ok_list
+    df["Expected_Category_From_Duration"] = expected
+    df["Duration_Check_OK"] = ok
 
     print("--- DEBUG: Duration Check Completed ---\n")
     return df
@@ -281,204 +192,20 @@ def check_event_matchday_competition(df_worksheet, df_data=None, rosco_path=None
       - rosco_path : optional path to Excel; used if df_data is None to try to extract reference values from that file.
       - debug_rows: how many rows to print for debug output
 
+    Competitions are matched once per distinct value against an automaton of
+    the reference list (see qc_matching), and results are broadcast back to the rows.
+
     Output:
       - same df_worksheet with two new columns:
           Event_Matchday_Competition_OK (bool)
           Event_Matchday_Competition_Remark (string)
     """
+    reference_comps, reference_matchday_counts = load_reference_competitions(df_data, rosco_path)
 
-    # --- Helper: normalize text ---
-    def norm(x):
-        if pd.isna(x):
-            return ""
-        return str(x).strip()
-
-    def norm_lower(x):
-        return norm(x).lower()
-
-    # --- Get reference competitions / allowed values ---
-    reference_comps = set()
-    reference_matches = set()  # optional: canonical "home vs away" pairs if available
-    reference_matchday_counts = {}  # optional expected counts per (competition, matchday)
-
-    if df_data is None and rosco_path is not None:
-        # attempt to load a 'Data' sheet or the first sheet that looks like the data table
-        try:
-            xls = pd.read_excel(rosco_path, sheet_name=None)
-            # try common names
-            priority = ["Data", "data", "Monitoring list", "monitoring list", "Monitoring List"]
-            found_df = None
-            for p in priority:
-                if p in xls:
-                    found_df = xls[p]
-                    break
-            if found_df is None:
-                # fallback: pick sheet that has words like 'Type of programme' or 'Competition' in header rows
-                for name, sheet in xls.items():
-                    header_text = " ".join(sheet.columns.astype(str).tolist()).lower()
-                    if "competition" in header_text or "type of programme" in header_text or "type of program" in header_text:
-                        found_df = sheet
-                        break
-            if found_df is not None:
-                df_data = found_df
-        except Exception:
-            df_data = None
-
-    # If df_data is available, extract competition names and optional counts
-    if isinstance(df_data, pd.DataFrame):
-        # strategy: scan df_data content for competition-like strings
-        df_tmp = df_data.astype(str).applymap(lambda v: v.strip() if pd.notna(v) else "")
-        # collect distinct non-empty strings that look like competition names
-        for col in df_tmp.columns:
-            for val in df_tmp[col].unique():
-                v = str(val).strip()
-                if v and v not in ["0", "nan", "-", "None"]:
-                    # filter out lines that look numeric counts (only digits)
-                    if not re.fullmatch(r"^\d+$", v):
-                        reference_comps.add(v.lower())
-
-        # attempt to read counts if present: some Data sheets have count rows above/below the headers
-        # Look for numeric entries adjacent to competition names in columns
-        # Heuristic: if the first few rows contain digits under the same columns as competition names, store count.
-        try:
-            # look at the first ~10 rows for numeric counts under columns that are competition names
-            for col in df_data.columns:
-                numeric_counts = []
-                for r in range(min(10, len(df_data))):
-                    try:
-                        v = df_data.iloc[r][col]
-                        if pd.notna(v) and str(v).strip().isdigit():
-                            numeric_counts.append(int(str(v).strip()))
-                    except Exception:
-                        continue
-                if numeric_counts:
-                    # pick a representative (first) numeric if consistent
-                    reference_matchday_counts[col.strip().lower()] = numeric_counts[0]
-        except Exception:
-            pass
-
-    # fallback: if still empty, use some likely defaults
-    if not reference_comps:
-        reference_comps = set([
-            "bundesliga", "2. bundesliga", "dfb-pokal", "dfl supercup",
-            "premier league", "epl", "la liga", "serie a", "champions league"
-        ])
-
-    # Precompute a lowercase set for quick lookup
-    reference_comps_lower = set(x.lower() for x in reference_comps)
-
-    # --- Prepare output columns ---
     df = df_worksheet.copy()
-    df["Event_Matchday_Competition_OK"] = False
-    df["Event_Matchday_Competition_Remark"] = ""
-
-    # We'll build grouping counts to verify number of matches per (Competition, Matchday)
-    grouped_counts = {}
-
-    # iterate rows
-    for idx, row in df.iterrows():
-        competition = norm(row.get("Competition", ""))
-        event = norm(row.get("Event", ""))
-        matchday = norm(row.get("Matchday", ""))
-
-        # some BSRs have 'Matchday' in other column names like 'Matchday ' or 'Match Day' - check alternatives
-        if not matchday:
-            # try columns similar to matchday
-            for c in df.columns:
-                if "matchday" in c.lower() or "match day" in c.lower() or c.lower().strip() == "match":
-                    matchday = norm(row.get(c, ""))
-                    if matchday:
-                        break
-
-        # find home/away or match field
-        home = norm(row.get("Home Team", "")) or norm(row.get("HomeTeam", "")) or norm(row.get("Home", ""))
-        away = norm(row.get("Away Team", "")) or norm(row.get("AwayTeam", "")) or norm(row.get("Away", ""))
-
-        remarks = []
-        ok = True
-
-        # 1) Missing fields
-        if not competition or competition.strip() in ["-", "nan", "none"]:
-            ok = False
-            remarks.append("Missing Competition")
-        if not event or event.strip() in ["-", "nan", "none"]:
-            ok = False
-            remarks.append("Missing Event")
-        if not matchday or matchday.strip() in ["-", "nan", "none"]:
-            ok = False
-            remarks.append("Missing Matchday")
-        if not (home and away):
-            # sometimes matches are in 'Match' or 'Program Title', try match detection
-            match_text = norm(row.get("Match", "")) or norm(row.get("Program Title", "")) or norm(row.get("Combined", ""))
-            # a simple heuristic: look for ' vs ' or ' v ' separators
-            if " vs " in match_text.lower() or " v " in match_text.lower():
-                # we accept this as a match, but still prefer to split
-                try:
-                    parts = re.split(r"\s+v(?:s|)\.?\s+|\s+vs\.?\s+|\s+v\s+", match_text, flags=re.IGNORECASE)
-                    if len(parts) >= 2:
-                        home = parts[0].strip()
-                        away = parts[1].strip()
-                except Exception:
-                    pass
-            else:
-                ok = False
-                remarks.append("Missing Home/Away or Match field")
-
-        # 2) Validate competition against reference list
-        comp_l = competition.lower()
-        # some competitions appear with extra words, do a contains check
-        comp_matches_reference = False
-        for rc in reference_comps_lower:
-            if rc and (rc in comp_l or comp_l in rc):
-                comp_matches_reference = True
-                break
-        if not comp_matches_reference:
-            ok = False
-            remarks.append("Competition not in reference list")
-
-        # 3) Simple event-matchday-match consistency: check if 'matchday' value format looks valid (MD, Round, etc.)
-        # Accept common formats: 'Matchday 01', 'MD01', 'Round 01', 'Round 1', 'Matchday 1'
-        if matchday:
-            if not re.search(r"(matchday|md|round|rd|r|matchday)\s*\d+", matchday.lower()):
-                # allow some textual forms like 'Finals', 'Semi', 'Quarter'
-                if matchday.lower() not in ["final", "finals", "semi", "semifinal", "quarterfinal", "playoffs", "-"]:
-                    # it's not necessarily an error; just add a warning
-                    remarks.append("Unusual matchday format")
-
-        # 4) If we have a reference expected counts mapping (from df_data), count per (competition, matchday)
-        comp_key = (competition.strip().lower(), matchday.strip().lower())
-        grouped_counts.setdefault(comp_key, 0)
-        grouped_counts[comp_key] += 1
-
-        # Compose final remark and set OK
-        df.at[idx, "Event_Matchday_Competition_OK"] = ok
-        df.at[idx, "Event_Matchday_Competition_Remark"] = "; ".join(remarks) if remarks else "OK"
-
-    # 5) If reference_matchday_counts available, compare counts and append remarks for rows belonging to mismatch groups
-    # reference_matchday_counts keys may be competition names -> expected counts per matchday (heuristic)
-    if reference_matchday_counts:
-        # For each group in grouped_counts, compare to reference (best-effort)
-        for (comp, mday), observed in grouped_counts.items():
-            expected = None
-            # try to find matching competition in reference counts map
-            for ref_comp_name, cnt in reference_matchday_counts.items():
-                if ref_comp_name and (ref_comp_name in comp or comp in ref_comp_name):
-                    expected = cnt
-                    break
-            if expected is not None and observed != expected:
-                # flag all rows in df with this (comp, mday)
-                mask = df[
-                    df.get("Competition", "").astype(str).str.strip().str.lower() == comp
-                ]["Competition"].notna()
-                # append a remark for each row in this group
-                for idx in df[
-                    (df.get("Competition", "").astype(str).str.strip().str.lower() == comp) &
-                    (df.get("Matchday", "").astype(str).str.strip().str.lower() == mday)
-                ].index:
-                    prev = df.at[idx, "Event_Matchday_Competition_Remark"]
-                    extra = f"Mismatch matches per matchday: expected {expected}, found {observed}"
-                    df.at[idx, "Event_Matchday_Competition_Remark"] = (prev + "; " + extra) if prev else extra
-                    df.at[idx, "Event_Matchday_Competition_OK"] = False
+    ok, remark = event_matchday_competition_columns(df, reference_comps, reference_matchday_counts)
+    df["Event_Matchday_Competition_OK"] = ok
+    df["Event_Matchday_Competition_Remark"] = remark
 
     # --- Debug prints (first few rows) ---
     print("=== Event/Matchday/Competition QC summary (first rows) ===")
@@ -505,16 +232,6 @@ def market_channel_program_duration_check(df_worksheet, reference_df=None, debug
             return ""
         return str(x).strip()
 
-    def parse_duration_to_minutes(val):
-        try:
-            parts = str(val).split(":")
-            if len(parts) < 2:
-                return None
-            h, m, s = int(parts[0]), int(parts[1]), int(parts[2]) if len(parts) == 3 else 0
-            return h * 60 + m + s / 60
-        except Exception:
-            return None
-
     reference_markets = set()
     reference_channels = set()
     if reference_df is not None:
@@ -523,11 +240,11 @@ def market_channel_program_duration_check(df_worksheet, reference_df=None, debug
         if "TV-Channel" in reference_df.columns:
             reference_channels.update(reference_df["TV-Channel"].dropna().astype(str).str.strip().unique())
 
-    for idx, row in df.iterrows():
+    minutes = duration_minutes(df) if "Duration" in df.columns else pd.Series(np.nan, index=df.index)
+    for (idx, row), duration_min in zip(df.iterrows(), minutes.to_numpy()):
         market = norm(row.get("Market", ""))
         channel = norm(row.get("TV-Channel", ""))
         program = norm(row.get("Program Title", "")) or norm(row.get("Combined", ""))
-        duration_min = parse_duration_to_minutes(row.get("Duration", ""))
 
         remarks = []
         ok1 = True
@@ -551,7 +268,7 @@ def market_channel_program_duration_check(df_worksheet, reference_df=None, debug
             ok2 = False
             remarks.append("Missing Program Title")
 
-        if duration_min is None:
+        if np.isnan(duration_min):
             ok2 = False
             remarks.append("Invalid Duration")
 
@@ -568,24 +285,15 @@ def domestic_market_coverage_check(df_worksheet, reference_df=None, debug_rows=1
     df["Domestic_Market_Coverage_OK"] = True
     df["Domestic_Market_Remark"] = ""
 
-    DOMESTIC_MAP = {
-        "bundesliga": ["germany", "deutschland"],
-        "premier league": ["united kingdom", "england"],
-        "la liga": ["spain"],
-        "serie a": ["italy"],
-        "ligue 1": ["france"],
-    }
+    reference = get_reference()
 
     for idx, row in df.iterrows():
         comp = str(row.get("Competition", "")).lower()
         market = str(row.get("Market", "")).lower()
         progtype = str(row.get("Type of Program", "")).lower()
 
-        domestic_markets = []
-        for key, vals in DOMESTIC_MAP.items():
-            if key in comp:
-                domestic_markets = vals
-                break
+        # Domestic markets of the first competition keyword found (reference data)
+        domestic_markets = reference.domestic_markets_for(comp)
         if domestic_markets and any(k in progtype for k in ["live", "broadcast", "direct"]) and market not in domestic_markets:
             df.at[idx, "Domestic_Market_Coverage_OK"] = False
             df.at[idx, "Domestic_Market_Remark"] = f"Missing domestic live coverage for {market}"
@@ -666,17 +374,8 @@ def duplicated_markets_check(df):
             print(f"⚠️ Missing required column: {col}. Skipping duplicated markets check.")
             return df
 
-    def duration_to_hours(d):
-        try:
-            if pd.isna(d):
-                return 0
-            parts = str(d).split(":")
-            h, m, s = (int(parts[i]) if i < len(parts) else 0 for i in range(3))
-            return h + m/60 + s/3600
-        except:
-            return 0
-
-    df["Duration_Hours"] = df["Duration"].apply(duration_to_hours)
+    # Unparseable durations count as 0 hours
+    df["Duration_Hours"] = (duration_minutes(df) / 60).fillna(0)
     df["Duplicated_Market_Check_OK"] = True
     df["Duplicated_Market_Check"] = "Not Applicable"
 
@@ -713,68 +412,26 @@ def duplicated_markets_check(df):
     return df
 # -----------------------------------------------------------
 # 13️⃣ Country & Channel IDs Check
-def country_channel_id_check(df):
+def country_channel_id_check(df, return_conflicts=False):
     """
     Ensures that each channel and market is mapped to a single, consistent ID.
+    All conflicts are found in one grouped pass (see qc_idmap.py), so every row of a
+    colliding channel/market/ID is flagged, with all colliding values listed.
     Outputs two columns:
       - Market_Channel_ID_OK (True/False)
       - Market_Channel_ID_Remark (string)
+
+    With return_conflicts=True, returns (df, conflicts) where `conflicts` is the
+    conflict table (one row per colliding key).
     """
 
     df_result = df.copy()
-    df_result["Market_Channel_ID_OK"] = True
-    df_result["Market_Channel_ID_Remark"] = ""
-
-    def norm(x):
-        return str(x).strip() if pd.notna(x) else ""
-
-    # Maps to track consistency
-    channel_id_map = {}
-    market_id_map = {}
-
-    for idx, row in df_result.iterrows():
-        channel = norm(row.get("TV-Channel"))
-        channel_id = norm(row.get("Channel ID"))
-        market = norm(row.get("Market"))
-        market_id = norm(row.get("Market ID"))
-
-        remarks = []
-        ok = True
-
-        # ✅ Check 1 – Same channel shouldn't have multiple Channel IDs
-        if channel:
-            if channel in channel_id_map and channel_id_map[channel] != channel_id:
-                remarks.append(
-                    f"Channel '{channel}' has multiple IDs ({channel_id_map[channel]} vs {channel_id})"
-                )
-                ok = False
-            else:
-                channel_id_map[channel] = channel_id
-
-        # ✅ Check 2 – Same market shouldn't have multiple Market IDs
-        if market:
-            if market in market_id_map and market_id_map[market] != market_id:
-                remarks.append(
-                    f"Market '{market}' has multiple IDs ({market_id_map[market]} vs {market_id})"
-                )
-                ok = False
-            else:
-                market_id_map[market] = market_id
-
-        # ✅ Check 3 – Same Channel ID shouldn't be used for multiple channels
-        if channel_id and list(channel_id_map.values()).count(channel_id) > 1:
-            remarks.append(f"Channel ID '{channel_id}' assigned to multiple channels")
-            ok = False
-
-        # ✅ Check 4 – Same Market ID shouldn't be used for multiple markets
-        if market_id and list(market_id_map.values()).count(market_id) > 1:
-            remarks.append(f"Market ID '{market_id}' assigned to multiple markets")
-            ok = False
-
-        # ✅ Write results
-        df_result.at[idx, "Market_Channel_ID_OK"] = ok
-        df_result.at[idx, "Market_Channel_ID_Remark"] = "; ".join(remarks) if remarks else "OK"
+    ok, remark, conflicts = id_bijection_columns(df_result)
+    df_result["Market_Channel_ID_OK"] = ok
+    df_result["Market_Channel_ID_Remark"] = remark
 
+    if return_conflicts:
+        return df_result, conflicts
     return df_result
 
 # -----------------------------------------------------------
@@ -842,46 +499,13 @@ def client_lstv_ott_check(df_worksheet, project_config=None):
 # -----------------------------------------------------------
 # ✅ Excel Coloring for True/False checks
 def color_excel(output_path, df):
-    from openpyxl import load_workbook
-    from openpyxl.styles import PatternFill
-
-    GREEN_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-    RED_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-
-    wb = load_workbook(output_path)
-    ws = wb.active
-    headers = [cell.value for cell in ws[1]]
-    col_map = {name: idx+1 for idx, name in enumerate(headers)}
-
-    qc_columns = [col for col in df.columns if col.endswith("_OK")]
-
-    for col_name in qc_columns:
-        if col_name in col_map:
-            col_idx = col_map[col_name]
-            for row in range(2, ws.max_row + 1):
-                cell = ws.cell(row=row, column=col_idx)
-                val = cell.value
-                if val in [True, "True"]:
-                    cell.fill = GREEN_FILL
-                elif val in [False, "False"]:
-                    cell.fill = RED_FILL
-
-    wb.save(output_path)
+    """Writes `df` to `output_path` with green/red conditional formatting on every *_OK column."""
+    write_qc_report(output_path, df, summary=False)
 # -----------------------------------------------------------
 # Summary Sheet
-def generate_summary_sheet(output_path, df):
-    wb = load_workbook(output_path)
-    if "Summary" in wb.sheetnames: del wb["Summary"]
-    ws = wb.create_sheet("Summary")
-
-    qc_columns = [col for col in df.columns if "_OK" in col]
-    summary_data = []
-    for col in qc_columns:
-        total = len(df)
-        passed = df[col].sum() if df[col].dtype==bool else sum(df[col]=="True")
-        summary_data.append([col, total, passed, total - passed])
-
-    summary_df = pd.DataFrame(summary_data, columns=["Check", "Total", "Passed", "Failed"])
-    for r in dataframe_to_rows(summary_df, index=False, header=True):
-        ws.append(r)
-    wb.save(output_path)
\ No newline at end of file
+def generate_summary_sheet(output_path, df, results=None):
+    """
+    Writes `df` plus the Summary sheet (pass/fail counts per *_OK column) to `output_path` in one pass.
+    Counts are popcounts over the packed result bitmask (`results`, a QCResults).
+    """
+    return write_qc_report(output_path, df, results=results)
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+# Low-cardinality BSR columns encoded as categoricals at load time
+DIMENSION_COLUMNS = ["Market", "TV-Channel", "Broadcaster", "Region", "Competition", "Type of program"]
+
+
+# ----------------------------- 🏷️ Dictionary Encoding -----------------------------
+def encode_dimensions(df: pd.DataFrame, columns=DIMENSION_COLUMNS) -> pd.DataFrame:
+    """
+    Converts the dimension columns (in place) to categoricals, so each distinct
+    text is stored once and the rows hold integer codes. Only plain string
+    columns are converted; anything else (numbers, mixed types) is left as is.
+    """
+    for col in columns:
+        if col in df.columns and df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) == "string":
+            df[col] = df[col].astype("category")
+    return df
+
+
+def map_distinct(values: pd.Series, func, na_value=np.nan) -> np.ndarray:
+    """
+    Evaluates `func` once per distinct value (and once on `na_value` for missing
+    values) and broadcasts the results back to the rows. For a categorical this
+    works on its codes, so the per-row cost is a single take.
+    """
+    codes, uniques = pd.factorize(values)
+    results = [func(u) for u in uniques] + [func(na_value)]
+    return np.array(results, dtype=object)[codes]
+
+
+def _normalizer(case=None, strip=True):
+    def normalize(value):
+        text = str(value)
+        if strip:
+            text = text.strip()
+        if case == "upper":
+            return text.upper()
+        if case == "lower":
+            return text.lower()
+        return text
+    return normalize
+
+
+# ----------------------------- 🔤 Normalized Lookups -----------------------------
+def normalize_dimension(values: pd.Series, case=None, strip=True) -> pd.Series:
+    """
+    `values.astype(str)` (then `.str.strip()` and `.str.upper()` / `.str.lower()`
+    for case='upper' / 'lower'), computed over the distinct values only.
+    Missing values become 'nan', as with astype(str).
+    """
+    return pd.Series(map_distinct(values, _normalizer(case, strip)), index=values.index, dtype=object)
+
+
+def recode_dimension(values: pd.Series, case=None, strip=True) -> pd.Series:
+    """Same text as `normalize_dimension`, kept as a categorical (for writing a normalized column back)."""
+    codes, uniques = pd.factorize(values)
+    normalize = _normalizer(case, strip)
+    labels = [normalize(u) for u in uniques] + [normalize(np.nan)]
+    label_codes, categories = pd.factorize(pd.Series(labels, dtype=object), sort=True)
+    return pd.Series(
+        pd.Categorical.from_codes(label_codes[codes], categories=categories), index=values.index, name=values.name
+    )
+
+
+def dimension_mask(values: pd.Series, predicate, case=None, strip=True) -> pd.Series:
+    """Boolean mask of `predicate(normalized text)`, evaluated once per distinct value."""
+    normalize = _normalizer(case, strip)
+    hits = map_distinct(values, lambda v: bool(predicate(normalize(v)))).astype(bool)
+    return pd.Series(hits, index=values.index)
@@ -0,0 +1,151 @@
+import datetime
+import numbers
+import re
+
+import numpy as np
+import pandas as pd
+
+from qc_dimensions import normalize_dimension
+
+# Parsed copy of the BSR "Duration" column, added once at load time
+DURATION_COLUMN = "Duration"
+DURATION_MINUTES = "Duration_Minutes"
+
+# [D day(s)] H:MM[:SS[.fff]] (also what str() of a timedelta looks like)
+_HMS = re.compile(r"^\s*(?:(\d+)\s+days?,?\s+)?(\d+):(\d{1,2})(?::(\d{1,2}(?:\.\d+)?))?\s*$")
+
+# Category bins on duration minutes (lower bounds, first match wins)
+CATEGORY_BINS = [(120, "live"), (60, "repeat"), (30, "highlights")]
+
+
+# ----------------------------- ⏱️ Duration Parsing -----------------------------
+def _scalar_minutes(value):
+    """Minutes of one non-string value, NaN when it is not a duration."""
+    if isinstance(value, bool):
+        return np.nan
+    if isinstance(value, (datetime.timedelta, pd.Timedelta)):
+        return value.total_seconds() / 60
+    if isinstance(value, (datetime.datetime, datetime.time)):
+        # Excel stores durations as a time of day (or a 1899/1900 datetime)
+        return value.hour * 60 + value.minute + value.second / 60 + value.microsecond / 60_000_000
+    if isinstance(value, numbers.Number):
+        return float(value)
+    return np.nan
+
+
+def parse_clock_minutes(strings: pd.Series) -> np.ndarray:
+    """
+    'H:MM[:SS]' strings to minutes with one compiled regex, run once per
+    distinct string; anything else is NaN.
+    """
+    codes, uniques = pd.factorize(strings)
+    parts = pd.Series(uniques, dtype=object).str.extract(_HMS).astype("float64")
+    days, hours, mins, secs = (parts[i].fillna(0).to_numpy() for i in range(4))
+    minutes = np.append(np.where(parts[1].notna(), days * 1440 + hours * 60 + mins + secs / 60, np.nan), np.nan)
+    return minutes[codes]
+
+
+def _string_minutes(strings: pd.Series) -> np.ndarray:
+    minutes = parse_clock_minutes(strings)
+    # Plain numbers are minutes
+    numeric = pd.to_numeric(strings.str.strip(), errors="coerce").to_numpy(dtype="float64")
+    return np.where(np.isnan(minutes), numeric, minutes)
+
+
+def parse_duration_minutes(values) -> pd.Series:
+    """
+    Converts a duration column to float minutes in one pass.
+
+    Accepts 'HH:MM[:SS]' strings, datetime.time / datetime values (time of day),
+    timedelta values and plain numbers (minutes), mixed in one column. Each
+    distinct value is converted once; unparseable and missing values are NaN.
+    """
+    s = values if isinstance(values, pd.Series) else pd.Series(values)
+    if pd.api.types.is_timedelta64_dtype(s):
+        return s.dt.total_seconds() / 60
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return (s.dt.hour * 60 + s.dt.minute + s.dt.second / 60).astype("float64")
+    if pd.api.types.is_bool_dtype(s):
+        return pd.Series(np.nan, index=s.index)
+    if pd.api.types.is_numeric_dtype(s):
+        return s.astype("float64")
+
+    codes, uniques = pd.factorize(s)
+    uniques = pd.Series(uniques, dtype=object)
+    is_str = uniques.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+    minutes = np.full(len(uniques) + 1, np.nan)  # last slot: missing values (code -1)
+    if is_str.any():
+        minutes[:-1][is_str] = _string_minutes(uniques[is_str].astype(str))
+    if (~is_str).any():
+        minutes[:-1][~is_str] = [_scalar_minutes(v) for v in uniques[~is_str]]
+    return pd.Series(minutes[codes], index=s.index)
+
+
+def add_duration_minutes(df: pd.DataFrame) -> pd.DataFrame:
+    """Adds the parsed Duration_Minutes column (in place) when the BSR has a Duration column."""
+    if DURATION_COLUMN in df.columns:
+        df[DURATION_MINUTES] = parse_duration_minutes(df[DURATION_COLUMN])
+    return df
+
+
+def duration_minutes(df: pd.DataFrame, col: str = DURATION_COLUMN) -> pd.Series:
+    """Parsed minutes of `col`, reusing Duration_Minutes when it was added at load time."""
+    if col == DURATION_COLUMN and DURATION_MINUTES in df.columns:
+        return df[DURATION_MINUTES]
+    return parse_duration_minutes(df[col])
+
+
+# ----------------------------- 🗂️ Category Binning -----------------------------
+def duration_category(minutes) -> np.ndarray:
+    """
+    Expected program category per duration: live (>= 120 min), repeat (60-120),
+    highlights (30-60), support (0-30, exclusive) and unknown otherwise (incl. NaN).
+    """
+    m = np.asarray(minutes, dtype="float64")
+    conditions = [m >= bound for bound, _ in CATEGORY_BINS] + [m > 0]
+    labels = [label for _, label in CATEGORY_BINS] + ["support"]
+    return np.select(conditions, labels, default="unknown").astype(object)
+
+
+def category_matches(program_types: pd.Series, expected: np.ndarray) -> np.ndarray:
+    """`expected in program or program in expected`, evaluated once per distinct pair."""
+    pairs = pd.DataFrame({"program": program_types.to_numpy(dtype=object), "expected": expected})
+    codes, uniques = pd.factorize(pd.MultiIndex.from_frame(pairs))
+    matches = np.array([e in p or p in e for p, e in uniques], dtype=bool)
+    return matches[codes]
+
+
+# ----------------------------- ✅ Check Columns -----------------------------
+def program_category_columns(df: pd.DataFrame, prog_col: str, dur_col: str):
+    """
+    Program type vs the category expected from the Duration column.
+
+    Returns:
+        (ok, remark) arrays aligned to the rows of `df`.
+    """
+    prog = normalize_dimension(df[prog_col], case="lower")
+    expected = duration_category(duration_minutes(df, dur_col))
+    ok = category_matches(prog, expected)
+    mismatch = "Program type '" + prog.to_numpy(dtype=object) + "' does not match duration category '" + expected + "'"
+    return ok, np.where(ok, "", mismatch).astype(object)
+
+
+def start_end_category_columns(df: pd.DataFrame, start_col: str, end_col: str, type_col: str):
+    """
+    Program type vs the category expected from Start/End (string columns), with
+    end times before the start rolling over midnight.
+
+    Returns:
+        (duration_min, expected, ok) arrays aligned to the rows of `df`.
+    """
+    start = parse_clock_minutes(df[start_col].astype(str))
+    end = parse_clock_minutes(df[end_col].astype(str))
+    duration_min = end - start
+    duration_min = np.where(duration_min < 0, duration_min + 24 * 60, duration_min)
+
+    types = df[type_col]
+    codes, uniques = pd.factorize(types)
+    labels = np.append(pd.Series(uniques, dtype=object).astype(str).str.strip().str.lower().to_numpy(dtype=object), "unknown")
+    actual = pd.Series(labels[codes], index=df.index)
+    expected = duration_category(duration_min)
+    return duration_min, expected, category_matches(actual, expected)
@@ -0,0 +1,107 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+from fastapi import HTTPException
+
+from qc_reference import reference_snapshot, use_reference_snapshot
+
+# -------------------- ⚙️ Pool configuration --------------------
+# QC_WORKERS: worker processes running pipelines in parallel.
+# QC_QUEUE_DEPTH: extra jobs allowed to wait for a free worker before we answer 503.
+QC_WORKERS = int(os.getenv("QC_WORKERS", max(1, (os.cpu_count() or 2) - 1)))
+QC_QUEUE_DEPTH = int(os.getenv("QC_QUEUE_DEPTH", QC_WORKERS))
+QC_RETRY_AFTER_SECONDS = int(os.getenv("QC_RETRY_AFTER_SECONDS", "30"))
+
+_pool = None
+_pool_lock = threading.Lock()
+_in_flight = 0
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Creates the QC process pool on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: workers must not inherit the server's threads/sockets
+            _pool = ProcessPoolExecutor(
+                max_workers=QC_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            print(f"⚙️ QC process pool started with {QC_WORKERS} workers (queue depth {QC_QUEUE_DEPTH})")
+        return _pool
+
+
+def shutdown_pool() -> None:
+    """Stops the pool; called from the application lifespan on shutdown."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+# -------------------- 🚦 Admission control --------------------
+class QCSlot:
+    """One admitted QC job. Release it exactly once, in a finally block."""
+
+    def __init__(self):
+        self._released = False
+
+    def release(self) -> None:
+        global _in_flight
+        with _pool_lock:
+            if not self._released:
+                self._released = True
+                _in_flight -= 1
+
+
+def acquire_qc_slot() -> QCSlot:
+    """
+    Reserves capacity for one QC job (running or queued).
+
+    Raises:
+        HTTPException: 503 with a Retry-After header when QC_WORKERS + QC_QUEUE_DEPTH
+        jobs are already admitted.
+    """
+    global _in_flight
+    with _pool_lock:
+        if _in_flight >= QC_WORKERS + QC_QUEUE_DEPTH:
+            raise HTTPException(
+                status_code=503,
+                detail="QC workers are busy. Please retry shortly.",
+                headers={"Retry-After": str(QC_RETRY_AFTER_SECONDS)},
+            )
+        _in_flight += 1
+    return QCSlot()
+
+
+def _run_with_reference(snapshot, func, *args, **kwargs):
+    # Runs in the worker: switch to the server's reference version before the task
+    use_reference_snapshot(snapshot)
+    return func(*args, **kwargs)
+
+
+async def run_in_pool(func, *args, **kwargs):
+    """
+    Runs a module-level (picklable) function in the QC pool without blocking the event loop.
+    The current reference-data version travels with the task, so reloads reach
+    long-lived workers without restarting them.
+    """
+    global _pool
+    loop = asyncio.get_running_loop()
+    pool = get_pool()
+    task = partial(_run_with_reference, reference_snapshot(), func, *args, **kwargs)
+    try:
+        return await loop.run_in_executor(pool, task)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); drop the broken pool so the next job gets a fresh one
+        with _pool_lock:
+            if _pool is pool:
+                _pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
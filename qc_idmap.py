@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+
+# (name column, ID column, label used in remarks)
+ID_PAIRS = [
+    ("TV-Channel", "Channel ID", "Channel"),
+    ("Market", "Market ID", "Market"),
+]
+
+CONFLICT_COLUMNS = ["Conflict", "Key Column", "Key", "Value Column", "Values", "Rows", "Remark"]
+
+
+def _norm_codes(df, col):
+    """
+    Factorizes a column after the normalization the row-wise check used
+    (stripped string, '' for missing values or a missing column).
+    Only distinct values are stringified. Returns (codes, labels).
+    """
+    if col not in df.columns:
+        return np.zeros(len(df), dtype=np.int64), np.array([""], dtype=object)
+    codes, uniques = pd.factorize(df[col], use_na_sentinel=True)
+    normalized = np.array([str(u).strip() for u in uniques] + [""], dtype=object)
+    codes = np.where(codes < 0, len(uniques), codes)
+    merged, labels = pd.factorize(normalized)
+    return merged[codes].astype(np.int64), np.asarray(labels, dtype=object)
+
+
+def _collisions(key_codes, key_labels, value_codes, value_labels, skip_empty_values):
+    """
+    Keys (non-empty) mapped to more than one distinct value.
+
+    Returns:
+        {key code: (all distinct values in first-seen order, row count)}
+    """
+    mask = key_labels[key_codes] != ""
+    if skip_empty_values:
+        mask &= value_labels[value_codes] != ""
+    keys, values = key_codes[mask], value_codes[mask]
+
+    n_values = len(value_labels)
+    pairs = pd.unique(keys * n_values + values)
+    pair_keys, pair_values = pairs // n_values, pairs % n_values
+    distinct = np.bincount(pair_keys, minlength=len(key_labels))
+    bad = np.flatnonzero(distinct > 1)
+    if not len(bad):
+        return {}
+
+    rows = np.bincount(keys, minlength=len(key_labels))
+    in_bad = np.isin(pair_keys, bad)
+    # Stable sort by key keeps each key's values in first-seen order
+    order = np.argsort(pair_keys[in_bad], kind="stable")
+    bad_keys = pair_keys[in_bad][order]
+    bad_values = value_labels[pair_values[in_bad][order]]
+    starts = np.flatnonzero(np.r_[True, bad_keys[1:] != bad_keys[:-1]])
+    return {
+        int(bad_keys[start]): (list(values), int(rows[bad_keys[start]]))
+        for start, values in zip(starts, np.split(bad_values, starts[1:]))
+    }
+
+
+# ----------------------------- 🆔 ID Bijection Conflicts -----------------------------
+def find_id_conflicts(df, pairs=ID_PAIRS):
+    """
+    Finds every many-to-one and one-to-many conflict between names and IDs in one grouped pass.
+
+    For each (name, ID) pair two kinds of conflict are reported:
+      - a name carrying more than one ID ("multiple_ids")
+      - an ID shared by more than one name ("shared_id")
+
+    Returns:
+        (conflicts, row_codes, remark_tables): the conflict table (one row per
+        colliding key, listing all its values), an (n_rows, n_kinds) array of
+        indexes into `remark_tables` (-1 where the row is clean), and the remark
+        strings per kind, ordered like the row-wise check reported them.
+    """
+    table = []
+    multiple_ids, shared_ids = [], []
+
+    for name_col, id_col, label in pairs:
+        name_codes, name_labels = _norm_codes(df, name_col)
+        id_codes, id_labels = _norm_codes(df, id_col)
+
+        # One name -> several IDs (a blank ID counts as a different ID)
+        collided = _collisions(name_codes, name_labels, id_codes, id_labels, skip_empty_values=False)
+        remarks = {}
+        for key, (values, rows) in collided.items():
+            remarks[key] = f"{label} '{name_labels[key]}' has multiple IDs ({', '.join(values)})"
+            table.append(["multiple_ids", name_col, name_labels[key], id_col, values, rows, remarks[key]])
+        multiple_ids.append((name_codes, remarks))
+
+        # One ID -> several names
+        collided = _collisions(id_codes, id_labels, name_codes, name_labels, skip_empty_values=True)
+        remarks = {}
+        for key, (values, rows) in collided.items():
+            remarks[key] = f"{label} ID '{id_labels[key]}' assigned to multiple {label.lower()}s ({', '.join(values)})"
+            table.append(["shared_id", id_col, id_labels[key], name_col, values, rows, remarks[key]])
+        shared_ids.append((id_codes, remarks))
+
+    row_codes, remark_tables = [], []
+    for codes, remarks in multiple_ids + shared_ids:
+        lookup = np.full(int(codes.max(initial=0)) + 1, -1, dtype=np.int64)
+        texts = []
+        for key, text in remarks.items():
+            lookup[key] = len(texts)
+            texts.append(text)
+        row_codes.append(lookup[codes])
+        remark_tables.append(texts)
+
+    conflicts = pd.DataFrame(table, columns=CONFLICT_COLUMNS)
+    return conflicts, np.column_stack(row_codes) if row_codes else np.empty((len(df), 0), int), remark_tables
+
+
+def id_bijection_columns(df, pairs=ID_PAIRS):
+    """
+    Per-row results of the ID bijection check.
+
+    Remarks are joined once per distinct combination of conflicts and broadcast
+    back to the rows.
+
+    Returns:
+        (ok, remark, conflicts): bool Series, remark Series ("OK" when clean) and
+        the conflict table from `find_id_conflicts`.
+    """
+    conflicts, row_codes, remark_tables = find_id_conflicts(df, pairs)
+    if not len(conflicts):
+        return (
+            pd.Series(True, index=df.index),
+            pd.Series("OK", index=df.index, dtype=object),
+            conflicts,
+        )
+
+    combos, inverse = np.unique(row_codes, axis=0, return_inverse=True)
+    texts = np.array([
+        "; ".join(remark_tables[k][code] for k, code in enumerate(combo) if code >= 0) or "OK"
+        for combo in combos
+    ], dtype=object)
+    remark = pd.Series(texts[inverse.reshape(-1)], index=df.index, dtype=object)
+    return remark == "OK", remark, conflicts
@@ -0,0 +1,386 @@
+import os
+import re
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from qc_registry import _resolve, build_check_plan
+
+# Baselines of earlier runs are kept under this size and age
+QC_BASELINE_MAX_BYTES = int(os.getenv("QC_BASELINE_MAX_MB", "2048")) * 1024 * 1024
+QC_BASELINE_MAX_AGE_SECONDS = int(os.getenv("QC_BASELINE_MAX_AGE_HOURS", "24")) * 3600
+BASELINE_SUFFIX = ".pkl"
+BASELINE_ID = re.compile(r"[0-9a-f]{64}")
+
+# Check outputs holding row index labels; reused values are remapped when rows moved
+ROW_LABEL_COLUMNS = ("Overlap_With_Row",)
+
+MISSING_KEYS = {"", "nan", "none", "nat"}
+
+
+# ----------------------------- 🧬 Row Fingerprints -----------------------------
+def row_fingerprints(df) -> np.ndarray:
+    """uint64 hash of every row's values (the hash overlap_duplicate_daybreak_check uses for duplicates)."""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def match_rows(old_fingerprints, new_fingerprints) -> np.ndarray:
+    """
+    Position of an identical earlier row for every new row, -1 for new or edited rows.
+    Repeated rows pair up in order (the k-th copy with the k-th copy).
+    """
+    def keyed(fingerprints):
+        occurrence = pd.Series(fingerprints).groupby(fingerprints).cumcount().to_numpy()
+        return pd.MultiIndex.from_arrays([fingerprints, occurrence])
+
+    return keyed(np.asarray(old_fingerprints)).get_indexer(keyed(np.asarray(new_fingerprints)))
+
+
+def keep_in_order(old_pos) -> np.ndarray:
+    """
+    Drops matches (sets -1) outside the longest run of matches that kept their
+    relative order, so moved rows count as removed and re-added. Checks may
+    depend on the order of rows within a group (first-seen values, ties).
+    """
+    matched = np.flatnonzero(old_pos >= 0)
+    values = old_pos[matched]
+    # Longest increasing subsequence (patience sorting)
+    tails, tail_at, parent = [], [], np.full(len(values), -1)
+    for i, v in enumerate(values):
+        k = bisect_left(tails, v)
+        if k:
+            parent[i] = tail_at[k - 1]
+        if k == len(tails):
+            tails.append(v)
+            tail_at.append(i)
+        else:
+            tails[k] = v
+            tail_at[k] = i
+    keep = np.zeros(len(values), dtype=bool)
+    i = tail_at[-1] if tail_at else -1
+    while i >= 0:
+        keep[i] = True
+        i = parent[i]
+    kept = np.full(len(old_pos), -1, dtype=np.int64)
+    kept[matched[keep]] = values[keep]
+    return kept
+
+
+def group_key(values) -> np.ndarray:
+    """
+    Grouping value of a column: lowercase stripped text, '' for missing values.
+    Never finer than how the checks group (raw, stripped or lowercased values),
+    so every group a check forms falls inside one of these.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    labels = [str(u).strip().lower() for u in uniques]
+    labels = np.array(["" if label in MISSING_KEYS else label for label in labels] + [""], dtype=object)
+    return labels[codes]
+
+
+def _joined(keys, cols, n):
+    if not cols:
+        return np.full(n, "", dtype=object)
+    joined = keys[cols[0]]
+    for col in cols[1:]:
+        joined = joined + "\x1f" + keys[col]
+    return joined
+
+
+# ----------------------------- ♻️ Incremental Re-validation -----------------------------
+class Revalidation:
+    """
+    Runs QC checks against the baseline of an earlier run of the same BSR.
+
+    Rows are matched to the baseline by fingerprint. Each check then reruns only
+    where its input may differ from last time, per its CheckSpec.groups:
+
+      - []: row-local, reruns the rows whose read columns changed
+      - [[cols], ...]: reruns every group (any of the groupings) holding a
+        changed row or a row that was removed
+      - None: reruns the whole frame when anything changed
+
+    Every other row gets the check's stored output. Rows count as changed for a
+    column when they are new or edited, or an earlier check produced a different
+    value for them, so reruns propagate exactly as far as the outputs moved.
+    Rows that moved count as removed and re-added. Falls back to running
+    everything when the baseline does not apply (other columns or dtypes, or
+    other Rosco/Data files, check versions or reference data).
+
+    Without a baseline it runs every check in full and only records the outputs,
+    so `snapshot()` can serve as the baseline of the next upload.
+    """
+
+    def __init__(self, df, specs, baseline=None, context_key=None, baseline_id=None):
+        self.context_key = context_key
+        self.baseline_id = baseline_id
+        self.columns = list(df.columns)
+        self.dtypes = [str(t) for t in df.dtypes]
+        self.index = df.index
+        self.fingerprints = row_fingerprints(df)
+        self.writes = {spec.name: writes for spec, _, writes, _ in build_check_plan(df.columns, specs)}
+        self.outputs = {}
+        self.keys = {}
+        self.rerun = {}
+        self.dirty = {}
+        self.baseline = None
+        self.new_rows = np.ones(len(df), dtype=bool)
+
+        if baseline is None:
+            return
+        reason = self._incompatible(baseline)
+        if reason:
+            print(f"ℹ️ Baseline {baseline_id} not reused ({reason}); running every check")
+            return
+
+        old_pos = keep_in_order(match_rows(baseline["fingerprints"], self.fingerprints))
+        matched = old_pos >= 0
+        self.baseline = baseline
+        self.old_pos = old_pos
+        self.new_rows = ~matched
+        self.removed = np.ones(len(baseline["fingerprints"]), dtype=bool)
+        self.removed[old_pos[matched]] = False
+        self.label_map = pd.Series(self.index[matched], index=pd.Index(baseline["index"])[old_pos[matched]])
+        print(f"♻️ Re-validating against baseline {baseline_id}: "
+              f"{int(self.new_rows.sum())} new/edited rows, {int(self.removed.sum())} removed rows")
+
+    @property
+    def incremental(self) -> bool:
+        return self.baseline is not None
+
+    def _incompatible(self, baseline):
+        if baseline.get("context") != self.context_key:
+            return "Rosco/Data files, check versions or reference data changed"
+        if baseline.get("columns") != self.columns or baseline.get("dtypes") != self.dtypes:
+            return "BSR columns changed"
+        if not len(self.index):
+            return "empty BSR"
+        return None
+
+    def wrap(self, specs) -> list:
+        """The specs with each check routed through this run (for run_checks)."""
+        return [spec.replace(func=partial(self._run, spec)) for spec in specs]
+
+    # --- Per check ---
+
+    def _run(self, spec, projection, **kwargs):
+        previous = self.baseline["outputs"].get(spec.name) if self.incremental else None
+        groupings = None
+        if spec.groups is not None:
+            # A missing key column is one value for every row
+            groupings = [[c for c in _resolve(cols, projection.columns) if c in projection.columns] for cols in spec.groups]
+        keys = {col: group_key(projection[col]) for cols in groupings or [] for col in cols}
+
+        out = None
+        if previous is None:
+            run = np.ones(len(projection), dtype=bool)
+        else:
+            seeds = self.new_rows.copy()
+            for col in projection.columns:
+                if col in self.dirty:
+                    seeds |= self.dirty[col]
+            run, support = self._affected(spec, groupings, keys, seeds)
+            if not support.all():
+                out = self._merge(spec, projection, previous, run, support, kwargs)
+        if out is None:
+            out = spec.func(projection, **kwargs)
+
+        self._record(spec, out, keys, run, previous)
+        return out
+
+    def _affected(self, spec, groupings, keys, seeds):
+        """(rows to rerun, rows the rerun needs as input)."""
+        n = len(seeds)
+        if groupings is None:
+            everything = np.full(n, bool(seeds.any() or self.removed.any()))
+            return everything, everything
+        if not groupings:
+            return seeds, seeds
+
+        old_keys = self.baseline["keys"].get(spec.name)
+        run = np.zeros(n, dtype=bool)
+        codes = []
+        for cols in groupings:
+            if old_keys is None or any(col not in old_keys for col in cols):
+                everything = np.ones(n, dtype=bool)
+                return everything, everything
+            removed = {col: old_keys[col][self.removed] for col in cols}
+            joined, _ = pd.factorize(np.concatenate([
+                _joined(keys, cols, n), _joined(removed, cols, int(self.removed.sum()))
+            ]))
+            new_codes = joined[:n]
+            run |= np.isin(new_codes, np.union1d(new_codes[seeds], joined[n:]))
+            codes.append(new_codes)
+
+        # A rerun row needs the whole of each of its groups, under every grouping
+        support = run.copy()
+        if len(codes) > 1:
+            for new_codes in codes:
+                support |= np.isin(new_codes, new_codes[run])
+        return run, support
+
+    def _reused(self, col, values, positions):
+        """Stored output of `col` for the new rows at `positions` (all matched)."""
+        reused = values.take(self.old_pos[positions])
+        if col in ROW_LABEL_COLUMNS:
+            reused = reused.map(self.label_map).astype(values.dtype)
+        reused.index = positions
+        return reused
+
+    def _merge(self, spec, projection, previous, run, support, kwargs):
+        fresh = spec.func(projection[support].copy(), **kwargs) if support.any() else None
+        if fresh is not None and any(col not in fresh.columns for col in previous.columns):
+            return None
+
+        out = projection.copy()
+        kept_pos, run_pos = np.flatnonzero(~run), np.flatnonzero(run)
+        for col in previous.columns:
+            pieces = [self._reused(col, previous[col], kept_pos)]
+            if fresh is not None:
+                recomputed = fresh[col][run[support]]
+                recomputed.index = run_pos
+                pieces.append(recomputed)
+            values = pd.concat([p for p in pieces if len(p)]).sort_index()
+            values.index = projection.index
+            out[col] = values
+        return out
+
+    def _record(self, spec, out, keys, run, previous):
+        produced = out[[c for c in self.writes[spec.name] if c in out.columns]].reset_index(drop=True)
+        self.outputs[spec.name] = produced
+        if keys:
+            self.keys[spec.name] = keys
+        self.rerun[spec.name] = int(run.sum())
+        if not self.incremental:
+            return
+
+        # Rerun rows whose value came out the same stay clean for the checks reading it
+        check_pos = np.flatnonzero(run & ~self.new_rows)
+        for col in produced.columns:
+            dirty = run.copy()
+            if previous is not None and col in previous.columns and len(check_pos):
+                before = self._reused(col, previous[col], check_pos).reset_index(drop=True)
+                after = produced[col].take(check_pos).reset_index(drop=True)
+                try:
+                    same = (before.astype(object) == after.astype(object)) | (before.isna() & after.isna())
+                    dirty[check_pos[same.to_numpy(dtype=bool)]] = False
+                except (TypeError, ValueError):
+                    pass
+            self.dirty[col] = dirty
+
+    # --- Baseline ---
+
+    def snapshot(self) -> dict:
+        """Baseline of this run for the next upload of the same BSR."""
+        return {
+            "context": self.context_key,
+            "columns": self.columns,
+            "dtypes": self.dtypes,
+            "index": np.asarray(self.index),
+            "fingerprints": self.fingerprints,
+            "outputs": self.outputs,
+            "keys": self.keys,
+        }
+
+    def summary(self) -> dict:
+        """Rows rerun per check (None when every check ran in full)."""
+        if not self.incremental:
+            return None
+        return {
+            "baseline_id": self.baseline_id,
+            "changed_rows": int(self.new_rows.sum()),
+            "removed_rows": int(self.removed.sum()),
+            "rows_rerun": dict(self.rerun),
+        }
+
+
+# ----------------------------- 🗄️ Baseline Store -----------------------------
+class BaselineStore:
+    """
+    Snapshots of earlier QC runs (see Revalidation.snapshot), one pickle per
+    baseline id, written and read only by this service. A hit refreshes the
+    mtime; baselines expire after `max_age_seconds` without a hit, and the least
+    recently used are dropped while the folder exceeds `max_bytes`.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, folder: str, max_bytes: int = QC_BASELINE_MAX_BYTES,
+                 max_age_seconds: int = QC_BASELINE_MAX_AGE_SECONDS):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        os.makedirs(folder, exist_ok=True)
+
+    def _path(self, baseline_id):
+        # Ids come from clients: only our own hex keys map to a file
+        if not baseline_id or not BASELINE_ID.fullmatch(baseline_id):
+            return None
+        return os.path.join(self.folder, f"{baseline_id}{BASELINE_SUFFIX}")
+
+    def get(self, baseline_id):
+        """The stored snapshot, or None (unknown id, expired or unreadable)."""
+        path = self._path(baseline_id)
+        if path is None:
+            return None
+        try:
+            if time.time() - os.path.getmtime(path) > self.max_age_seconds:
+                os.remove(path)
+                return None
+            baseline = pd.read_pickle(path)
+            os.utime(path, None)
+        except Exception:
+            return None
+        return baseline
+
+    def put(self, baseline_id, snapshot) -> None:
+        """Stores a snapshot (written atomically, via rename)."""
+        path = self._path(baseline_id)
+        if path is None:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+        os.close(fd)
+        try:
+            pd.to_pickle(snapshot, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def evict(self) -> int:
+        """Drops expired baselines, then the least recently used until the folder fits. Returns bytes freed."""
+        with self._lock:
+            now = time.time()
+            entries = []
+            freed = 0
+            for filename in os.listdir(self.folder):
+                if not filename.endswith(BASELINE_SUFFIX):
+                    continue
+                path = os.path.join(self.folder, filename)
+                try:
+                    st = os.stat(path)
+                    if now - st.st_mtime > self.max_age_seconds:
+                        os.remove(path)
+                        freed += st.st_size
+                        continue
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                freed += size
+                total -= size
+                print(f"🧹 Evicted QC baseline: {path}")
+            return freed
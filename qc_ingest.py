@@ -0,0 +1,115 @@
+import hashlib
+import os
+import tempfile
+from io import BytesIO
+
+from starlette.formparsers import MultiPartParser
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# Uploads up to this size stay in memory; larger ones are written once under a content-addressed name
+QC_UPLOAD_SPOOL_MAX_BYTES = int(os.getenv("QC_UPLOAD_SPOOL_MAX_MB", "32")) * 1024 * 1024
+
+# Starlette spools multipart parts to a temp file above 1MB by default; keep
+# parts below the same threshold in memory so small workbooks never touch disk
+MultiPartParser.spool_max_size = max(MultiPartParser.spool_max_size, QC_UPLOAD_SPOOL_MAX_BYTES)
+
+
+def sha256_of_file(path) -> str:
+    """Streams a file through SHA-256 and returns the hex digest."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# ----------------------------- 📥 Ingested Uploads -----------------------------
+class IngestedUpload:
+    """
+    One uploaded workbook, hashed and sized while it was received.
+
+    Small uploads keep their bytes in memory (`data`); large ones live on disk
+    at `path`, named by their SHA-256 so concurrent uploads of different files
+    never share a name and repeat uploads of the same bytes reuse the file.
+    Plain attributes only, so it can be sent to the QC worker processes.
+    """
+
+    def __init__(self, filename, sha256, size, data=None, path=None):
+        self.filename = filename
+        self.sha256 = sha256
+        self.size = size
+        self.data = data
+        self.path = path
+
+    @property
+    def in_memory(self) -> bool:
+        return self.data is not None
+
+    def open(self):
+        """Something pandas / openpyxl can read: a fresh buffer over the bytes, or the file path."""
+        return BytesIO(self.data) if self.data is not None else self.path
+
+    def __repr__(self):
+        where = "memory" if self.in_memory else self.path
+        return f"IngestedUpload({self.filename!r}, {self.size} bytes, {self.sha256[:12]}, {where})"
+
+
+def open_source(source):
+    """Readable source for an upload or a plain path (paths are returned as is)."""
+    return source.open() if isinstance(source, IngestedUpload) else source
+
+
+def source_digest(source) -> str:
+    """SHA-256 of an upload (known from ingestion) or of a file on disk."""
+    return source.sha256 if isinstance(source, IngestedUpload) else sha256_of_file(source)
+
+
+async def ingest_upload(upload, folder: str, spool_max_bytes: int = QC_UPLOAD_SPOOL_MAX_BYTES) -> IngestedUpload:
+    """
+    Reads a FastAPI UploadFile once, hashing and sizing it on the way.
+
+    The bytes are buffered in memory until they exceed `spool_max_bytes`; from
+    then on they stream to a temp file in `folder`, renamed to
+    `<sha256><ext>` at the end. Content-addressed files are shared by every
+    request uploading the same bytes, so callers leave them to the upload
+    folder's LRU eviction instead of deleting them.
+    """
+    h = hashlib.sha256()
+    size = 0
+    buffer = BytesIO()
+    spill = None
+    tmp_path = None
+    try:
+        while True:
+            chunk = await upload.read(HASH_CHUNK_BYTES)
+            if not chunk:
+                break
+            h.update(chunk)
+            size += len(chunk)
+            if spill is not None:
+                spill.write(chunk)
+                continue
+            buffer.write(chunk)
+            if size > spool_max_bytes:
+                fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".part")
+                spill = os.fdopen(fd, "wb")
+                spill.write(buffer.getvalue())
+                buffer = None
+
+        digest = h.hexdigest()
+        if spill is None:
+            return IngestedUpload(upload.filename, digest, size, data=buffer.getvalue())
+
+        spill.close()
+        ext = os.path.splitext(upload.filename or "")[1].lower()
+        path = os.path.join(folder, f"{digest}{ext}")
+        # Same name means same bytes, so replacing a concurrent copy is harmless
+        os.replace(tmp_path, path)
+        tmp_path = None
+        return IngestedUpload(upload.filename, digest, size, path=path)
+    finally:
+        if spill is not None and not spill.closed:
+            spill.close()
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
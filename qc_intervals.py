@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+
+# ----------------------------- ⏱️ Interval Overlap Sweep -----------------------------
+def find_overlaps(df, group_cols, start_col, end_col):
+    """
+    Vectorized overlap sweep over airings.
+
+    Rows are sorted by `group_cols` + start (stable). Within each group the
+    running maximum of the previous end times is carried with a grouped
+    cumulative max and shifted by one row, so a row overlaps when it starts
+    before *any* earlier airing in the group has ended, not only the one
+    right before it. Rows with a missing group key or start never overlap.
+
+    Args:
+        df: Frame holding the columns below (index labels are used as row ids).
+        group_cols: Columns defining a timeline, e.g. [channel, date].
+        start_col / end_col: Datetime-like columns of the airing.
+
+    Returns:
+        (overlap, conflict_row): a bool Series and the index label of the earlier
+        airing it collides with (the one ending last), both aligned to `df.index`.
+    """
+    if df.empty:
+        empty = pd.Series(False, index=df.index)
+        return empty, pd.Series(pd.NA, index=df.index, dtype=_label_dtype(df.index))
+
+    # Work on positions so duplicate index labels are fine
+    frame = df[list(group_cols) + [start_col, end_col]].reset_index(drop=True)
+    order = frame.sort_values(by=list(group_cols) + [start_col], kind="mergesort").index.to_numpy()
+    s = frame.iloc[order]
+
+    start = pd.to_datetime(s[start_col], errors="coerce")
+    end = pd.to_datetime(s[end_col], errors="coerce")
+    start_ns = np.where(start.notna(), start.to_numpy(dtype="datetime64[ns]").astype("int64"), np.iinfo("int64").max)
+    end_ns = np.where(end.notna(), end.to_numpy(dtype="datetime64[ns]").astype("int64"), np.iinfo("int64").min)
+
+    group = s.groupby(list(group_cols), sort=False, dropna=False, observed=True).ngroup().to_numpy()
+    valid_key = s[list(group_cols)].notna().all(axis=1).to_numpy()
+
+    # Running max of end times inside each group, and the position that holds it
+    ends = pd.Series(end_ns)
+    running_max = ends.groupby(group).cummax().to_numpy()
+    positions = pd.Series(np.arange(len(s)), dtype="float64")
+    holder = positions.where(end_ns == running_max).groupby(group).ffill()
+
+    # Compare each start with the max end of the rows *before* it in the group
+    first_in_group = np.r_[True, group[1:] != group[:-1]]
+    prev_max = np.r_[np.iinfo("int64").min, running_max[:-1]]
+    prev_holder = np.r_[np.nan, holder.to_numpy()[:-1]]
+    prev_max[first_in_group] = np.iinfo("int64").min
+
+    overlap = valid_key & start.notna().to_numpy() & (start_ns < prev_max)
+
+    hit = np.flatnonzero(overlap)
+    overlap_out = np.zeros(len(df), dtype=bool)
+    overlap_out[order[hit]] = True
+    conflict_out = np.full(len(df), None, dtype=object)
+    conflict_out[order[hit]] = df.index.to_numpy()[order[prev_holder[hit].astype("int64")]]
+
+    overlap_s = pd.Series(overlap_out, index=df.index)
+    conflict_s = pd.Series(conflict_out, index=df.index)
+    return overlap_s, conflict_s.astype(_label_dtype(df.index))
+
+
+def _label_dtype(index):
+    return "Int64" if pd.api.types.is_integer_dtype(index) else object
@@ -0,0 +1,309 @@
+import json
+import os
+import sqlite3
+import time
+import uuid
+
+from qc_pipelines import run_qc_pipeline, run_market_pipeline
+
+# -------------------- ⚙️ Job store setup --------------------
+# One SQLite file shared by every uvicorn worker and QC worker process, so a job
+# started on one worker can be polled/streamed from any other.
+JOBS_DB_PATH = os.getenv("QC_JOBS_DB", os.path.join(os.getcwd(), "qc_jobs.db"))
+
+JOB_QUEUED = "Queued"
+JOB_RUNNING = "Running"
+JOB_COMPLETED = "Completed"
+JOB_FAILED = "Failed"
+
+# Finished jobs (with their events) are kept this long for status/event requests
+JOB_RETENTION_SECONDS = int(os.getenv("QC_JOB_RETENTION_HOURS", "24")) * 3600
+
+# Pins older than this are treated as left behind by a process that died mid-request
+UPLOAD_PIN_MAX_AGE_SECONDS = int(os.getenv("QC_UPLOAD_PIN_MAX_AGE_HOURS", "6")) * 3600
+
+EVENT_CHECK_COMPLETED = "check_completed"
+EVENT_JOB_COMPLETED = "job_completed"
+EVENT_JOB_FAILED = "job_failed"
+TERMINAL_EVENTS = (EVENT_JOB_COMPLETED, EVENT_JOB_FAILED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS qc_jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    checks TEXT NOT NULL,
+    completed_checks INTEGER NOT NULL DEFAULT 0,
+    download_url TEXT,
+    summaries TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS qc_job_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    event TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_qc_job_events_job ON qc_job_events (job_id, seq);
+CREATE INDEX IF NOT EXISTS idx_qc_jobs_status_updated ON qc_jobs (status, updated_at);
+-- Uploads on disk that a request or job still has to read (see pin_uploads)
+DROP TABLE IF EXISTS qc_job_uploads;
+CREATE TABLE IF NOT EXISTS qc_upload_pins (
+    owner TEXT NOT NULL,
+    path TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_qc_upload_pins_owner ON qc_upload_pins (owner);
+"""
+
+
+def _connect(db_path=None):
+    conn = sqlite3.connect(db_path or JOBS_DB_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def init_job_store(db_path=None):
+    """Creates the job tables (idempotent) and switches the file to WAL so readers never block writers."""
+    conn = _connect(db_path)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _add_event(conn, job_id, event, data):
+    conn.execute(
+        "INSERT INTO qc_job_events (job_id, event, data, created_at) VALUES (?, ?, ?, ?)",
+        (job_id, event, json.dumps(data, default=str), time.time()),
+    )
+
+
+# -------------------- 📝 Job lifecycle --------------------
+def create_job(kind, checks, db_path=None) -> str:
+    """Registers a queued job for the given ordered check names and returns its id."""
+    job_id = uuid.uuid4().hex
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.execute(
+                "INSERT INTO qc_jobs (job_id, kind, status, checks, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, JOB_QUEUED, json.dumps(list(checks)), now, now),
+            )
+    finally:
+        conn.close()
+    return job_id
+
+
+def _set_status(job_id, status, db_path=None, **fields):
+    columns = ["status = ?", "updated_at = ?"]
+    values = [status, time.time()]
+    for name, value in fields.items():
+        columns.append(f"{name} = ?")
+        values.append(value)
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.execute(f"UPDATE qc_jobs SET {', '.join(columns)} WHERE job_id = ?", (*values, job_id))
+            if status == JOB_COMPLETED:
+                _add_event(conn, job_id, EVENT_JOB_COMPLETED, {
+                    "status": status,
+                    "download_url": fields.get("download_url"),
+                })
+            elif status == JOB_FAILED:
+                _add_event(conn, job_id, EVENT_JOB_FAILED, {"status": status, "error": fields.get("error")})
+    finally:
+        conn.close()
+
+
+def fail_job(job_id, error, db_path=None):
+    _set_status(job_id, JOB_FAILED, db_path, error=str(error))
+
+
+class JobProgress:
+    """
+    Picklable progress callback handed to the pipelines in the worker process.
+
+    Each call records one finished check as an event and bumps the job's
+    completed counter in the same transaction.
+    """
+
+    def __init__(self, job_id, db_path=None):
+        self.job_id = job_id
+        self.db_path = db_path or JOBS_DB_PATH
+
+    def __call__(self, check_key, summary=None):
+        status = summary.get("status", JOB_COMPLETED) if isinstance(summary, dict) else JOB_COMPLETED
+        conn = _connect(self.db_path)
+        try:
+            with conn:
+                conn.execute(
+                    "UPDATE qc_jobs SET completed_checks = completed_checks + 1, updated_at = ? WHERE job_id = ?",
+                    (time.time(), self.job_id),
+                )
+                row = conn.execute(
+                    "SELECT completed_checks, checks FROM qc_jobs WHERE job_id = ?", (self.job_id,)
+                ).fetchone()
+                _add_event(conn, self.job_id, EVENT_CHECK_COMPLETED, {
+                    "check": check_key,
+                    "status": status,
+                    "completed": row["completed_checks"],
+                    "total": len(json.loads(row["checks"])),
+                })
+        finally:
+            conn.close()
+
+
+# -------------------- 📌 Upload pins --------------------
+# Large uploads are shared files under their content hash; every uvicorn worker's
+# cleanup thread evicts from the same folder, so the files a request or job is
+# still going to read are recorded here rather than in process memory.
+def pin_uploads(owner, paths, db_path=None):
+    """Keeps `paths` out of upload eviction until release_uploads(owner)."""
+    paths = [os.path.abspath(p) for p in paths]
+    if not paths:
+        return
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO qc_upload_pins (owner, path, created_at) VALUES (?, ?, ?)",
+                [(owner, p, now) for p in paths],
+            )
+    finally:
+        conn.close()
+
+
+def release_uploads(owner, db_path=None):
+    """Drops the pins of a finished request or job."""
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.execute("DELETE FROM qc_upload_pins WHERE owner = ?", (owner,))
+    finally:
+        conn.close()
+
+
+def active_upload_paths(db_path=None):
+    """Upload paths pinned by requests and jobs that have not finished yet."""
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT DISTINCT path FROM qc_upload_pins WHERE created_at > ?",
+            (time.time() - UPLOAD_PIN_MAX_AGE_SECONDS,),
+        ).fetchall()
+    finally:
+        conn.close()
+    return {r["path"] for r in rows}
+
+
+# -------------------- 🧹 Retention --------------------
+def purge_jobs(older_than=JOB_RETENTION_SECONDS, db_path=None) -> int:
+    """
+    Deletes jobs that finished more than `older_than` seconds ago, with their
+    events and upload pins, and pins past UPLOAD_PIN_MAX_AGE_SECONDS.
+    Returns the number of jobs deleted.
+    """
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        with conn:
+            job_ids = [r["job_id"] for r in conn.execute(
+                "SELECT job_id FROM qc_jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (JOB_COMPLETED, JOB_FAILED, now - older_than),
+            )]
+            for start in range(0, len(job_ids), 500):
+                chunk = job_ids[start:start + 500]
+                marks = ", ".join("?" * len(chunk))
+                conn.execute(f"DELETE FROM qc_job_events WHERE job_id IN ({marks})", chunk)
+                conn.execute(f"DELETE FROM qc_upload_pins WHERE owner IN ({marks})", chunk)
+                conn.execute(f"DELETE FROM qc_jobs WHERE job_id IN ({marks})", chunk)
+            conn.execute("DELETE FROM qc_upload_pins WHERE created_at < ?", (now - UPLOAD_PIN_MAX_AGE_SECONDS,))
+    finally:
+        conn.close()
+    return len(job_ids)
+
+
+# -------------------- 🔎 Job queries --------------------
+def get_job(job_id, db_path=None):
+    """Returns the job with its per-check progress, or None if unknown."""
+    conn = _connect(db_path)
+    try:
+        row = conn.execute("SELECT * FROM qc_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        done = {}
+        for ev in conn.execute(
+            "SELECT data, created_at FROM qc_job_events WHERE job_id = ? AND event = ? ORDER BY seq",
+            (job_id, EVENT_CHECK_COMPLETED),
+        ):
+            data = json.loads(ev["data"])
+            done[data["check"]] = {"status": data["status"], "finished_at": ev["created_at"]}
+    finally:
+        conn.close()
+
+    checks = json.loads(row["checks"])
+    total = len(checks)
+    return {
+        "job_id": row["job_id"],
+        "kind": row["kind"],
+        "status": row["status"],
+        "completed_checks": row["completed_checks"],
+        "total_checks": total,
+        "progress": round(100 * row["completed_checks"] / total, 1) if total else 0.0,
+        "checks": [
+            {"check": name, **done.get(name, {"status": "Pending", "finished_at": None})}
+            for name in checks
+        ],
+        "download_url": row["download_url"],
+        "summaries": json.loads(row["summaries"]) if row["summaries"] else None,
+        "error": row["error"],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+    }
+
+
+def events_since(job_id, after_seq=0, db_path=None):
+    """Returns the job's events with seq > after_seq, oldest first."""
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT seq, event, data FROM qc_job_events WHERE job_id = ? AND seq > ? ORDER BY seq",
+            (job_id, after_seq),
+        ).fetchall()
+    finally:
+        conn.close()
+    return [(r["seq"], r["event"], json.loads(r["data"])) for r in rows]
+
+
+# -------------------- 🚀 Worker entry point --------------------
+def execute_job(job_id, kind, download_url, pipeline_kwargs, db_path=None):
+    """
+    Runs one job inside a QC worker process and records its outcome.
+    Module-level so it can be submitted to the process pool.
+    """
+    _set_status(job_id, JOB_RUNNING, db_path)
+    progress = JobProgress(job_id, db_path)
+    try:
+        if kind == "market":
+            summaries = run_market_pipeline(progress=progress, **pipeline_kwargs)
+        else:
+            summaries = run_qc_pipeline(progress=progress, **pipeline_kwargs)
+    except Exception as e:
+        print(f"QC Job {job_id} Error: {e}")
+        fail_job(job_id, e, db_path)
+        raise
+
+    _set_status(
+        job_id, JOB_COMPLETED, db_path,
+        download_url=download_url,
+        summaries=json.dumps(summaries, default=str) if summaries is not None else None,
+    )
+    return job_id
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+# Number of leading rows scanned for the BSR header before giving up
+HEADER_SCAN_ROWS = 200
+
+# Same default NA strings pandas.read_excel turns into NaN
+NA_STRINGS = frozenset([
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+])
+
+
+# ----------------------------- 🔎 Header Detection -----------------------------
+def is_header_row(values) -> bool:
+    """Returns True when a row of raw cell values looks like the BSR header."""
+    row_str = " ".join(str(v) for v in values if v is not None).lower()
+    if all(k in row_str for k in ["region", "market", "broadcaster"]):
+        return True
+    if "date" in row_str and ("utc" in row_str or "gmt" in row_str):
+        return True
+    return False
+
+
+def _column_names(header, width):
+    """Builds pandas-style column names: 'Unnamed: i' for blanks and '.N' suffixes for duplicates."""
+    names = []
+    seen = {}
+    for i in range(width):
+        value = header[i] if i < len(header) else None
+        name = f"Unnamed: {i}" if value is None or value == "" else value
+        key = str(name)
+        if key in seen:
+            seen[key] += 1
+            name = f"{key}.{seen[key]}"
+            while name in seen:
+                seen[key] += 1
+                name = f"{key}.{seen[key]}"
+            seen[name] = 0
+        else:
+            seen[key] = 0
+        names.append(name)
+    return [str(c).strip() for c in names]
+
+
+def _row_width(values) -> int:
+    n = len(values)
+    while n and values[n - 1] is None:
+        n -= 1
+    return n
+
+
+# ----------------------------- 📥 Single-Pass Loader -----------------------------
+def _drop_na_strings(values):
+    return tuple(None if (v.__class__ is str and v in NA_STRINGS) else v for v in values)
+
+
+def _stream_sheet(source, sheet_name, scan_rows, na_strings=True):
+    """
+    Header row index, column names and (padded) data rows of one streamed pass
+    over a sheet. NA strings become None as the rows stream in unless `na_strings` is False.
+    """
+    wb = load_workbook(source, read_only=True, data_only=True, keep_links=False)
+    try:
+        if isinstance(sheet_name, str):
+            if sheet_name not in wb.sheetnames:
+                raise ValueError(f"Worksheet named '{sheet_name}' not found")
+            ws = wb[sheet_name]
+        else:
+            ws = wb.worksheets[sheet_name]
+        ws.reset_dimensions()
+
+        rows = ws.iter_rows(values_only=True)
+        header_row = None
+        header = None
+        for i, values in enumerate(rows):
+            if i >= scan_rows:
+                break
+            if is_header_row(values):
+                header_row, header = i, values
+                break
+        if header_row is None:
+            raise ValueError(f"Could not detect header row in '{sheet_name}' sheet of BSR file.")
+
+        # Remaining rows of the same stream are the data block
+        data = [_drop_na_strings(values) for values in rows] if na_strings else list(rows)
+    finally:
+        wb.close()
+
+    while data and _row_width(data[-1]) == 0:
+        data.pop()
+
+    width = max([_row_width(header)] + [_row_width(r) for r in data]) if data else _row_width(header)
+    columns = _column_names(header, width)
+    data = [r[:width] if len(r) >= width else r + (None,) * (width - len(r)) for r in data]
+    return header_row, columns, data
+
+
+def _build_frame(records, names, raw=False):
+    """DataFrame from row tuples, read_excel-style nulls (or left as raw object values)."""
+    if not names:
+        return pd.DataFrame(index=pd.RangeIndex(len(records)))
+    df = pd.DataFrame.from_records(records, columns=range(len(names)), coerce_float=False) if records \
+        else pd.DataFrame(columns=range(len(names)))
+    df = df.astype(object) if raw else normalize_object_nulls(df)
+    df.columns = names
+    return df
+
+
+def read_bsr_sheet(source, sheet_name=0, scan_rows=HEADER_SCAN_ROWS):
+    """
+    Streams a BSR sheet exactly once with a read-only openpyxl iterator.
+
+    The header row is detected from the first `scan_rows` rows of the stream and
+    every following row is collected into the DataFrame, so the sheet is never
+    parsed twice. Values follow pandas.read_excel conventions (NA strings become
+    NaN, blank rows inside the data are kept, trailing blank rows are dropped).
+
+    Args:
+        source: Path or binary file-like object of the .xlsx workbook.
+        sheet_name: Sheet name or index. Defaults to the first sheet (0).
+
+    Returns:
+        (df, header_row): the parsed frame with stripped column names and the
+        0-based index of the detected header row.
+    """
+    header_row, columns, data = _stream_sheet(source, sheet_name, scan_rows)
+    return _build_frame(data, columns), header_row
+
+
+def read_bsr_sheet_split(source, usecols, sheet_name=0, scan_rows=HEADER_SCAN_ROWS):
+    """
+    Like read_bsr_sheet, but only the columns in `usecols` are typed and
+    NA-normalized. Every other column is carried as raw cell values (object
+    dtype) so it can be written back untouched.
+
+    Returns:
+        (df, rest, columns): the `usecols` columns present in the sheet, the
+        remaining columns, and every column name in sheet order.
+    """
+    header_row, columns, data = _stream_sheet(source, sheet_name, scan_rows, na_strings=False)
+    wanted = set(usecols)
+    used = [i for i, c in enumerate(columns) if c in wanted]
+    other = [i for i, c in enumerate(columns) if c not in wanted]
+    df = _build_frame([_drop_na_strings(r[i] for i in used) for r in data], [columns[i] for i in used])
+    rest = _build_frame([tuple(r[i] for i in other) for r in data], [columns[i] for i in other], raw=True)
+    return df, rest, columns
+
+
+def normalize_object_nulls(df):
+    """Matches read_excel dtypes in place: NaN instead of None in object columns, all-empty columns as float."""
+    for i in range(df.shape[1]):
+        col = df.iloc[:, i]
+        if col.dtype == object:
+            mask = col.isna()
+            if mask.all():
+                df.isetitem(i, np.nan)
+            elif mask.any():
+                df.isetitem(i, col.where(~mask, np.nan))
+    return df
@@ -0,0 +1,288 @@
+import re
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from qc_ingest import open_source
+
+# Output columns of the Event / Matchday / Competition check
+EVENT_MATCHDAY_OK = "Event_Matchday_Competition_OK"
+EVENT_MATCHDAY_REMARK = "Event_Matchday_Competition_Remark"
+
+# Defaults used when no reference list can be extracted
+DEFAULT_COMPETITIONS = [
+    "bundesliga", "2. bundesliga", "dfb-pokal", "dfl supercup",
+    "premier league", "epl", "la liga", "serie a", "champions league",
+]
+
+MATCHDAY_FORMAT = re.compile(r"(matchday|md|round|rd|r|matchday)\s*\d+")
+MATCHDAY_TEXT_FORMS = {"final", "finals", "semi", "semifinal", "quarterfinal", "playoffs", "-"}
+MISSING_MARKERS = ["-", "nan", "none"]
+
+# Remarks in the order the row-wise check appended them
+REMARKS = [
+    "Missing Competition",
+    "Missing Event",
+    "Missing Matchday",
+    "Missing Home/Away or Match field",
+    "Competition not in reference list",
+    "Unusual matchday format",
+]
+
+
+# ----------------------------- 🔤 Multi-Pattern Automaton -----------------------------
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over a fixed set of patterns.
+
+    Built once, then `contains_any(text)` tells whether any pattern occurs in
+    `text` with a single left-to-right scan, however many patterns there are.
+    """
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._hit = [False]
+        for pattern in patterns:
+            if pattern:
+                self._add(pattern)
+        self._link()
+
+    def _add(self, pattern):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._hit.append(False)
+            node = nxt
+        self._hit[node] = True
+
+    def _link(self):
+        # Breadth-first, so every failure target is built before it is used
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._hit[nxt] = self._hit[nxt] or self._hit[self._fail[nxt]]
+
+    def contains_any(self, text):
+        goto, fail, hit = self._goto, self._fail, self._hit
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if hit[node]:
+                return True
+        return False
+
+
+class ReferenceMatcher:
+    """
+    Loose membership test against a reference list: a value matches when any
+    (non-empty) reference occurs in it, or it occurs in any reference.
+
+    The first direction runs on the automaton; the second is one substring
+    search in all references joined with a separator no value contains.
+    """
+
+    _SEP = "\x00"
+
+    def __init__(self, references):
+        refs = sorted({r for r in references if r})
+        self._automaton = AhoCorasick(refs)
+        self._joined = self._SEP + self._SEP.join(refs) + self._SEP if refs else ""
+
+    def matches(self, text):
+        if not self._joined:
+            return False
+        if self._SEP not in text and text in self._joined:
+            return True
+        return self._automaton.contains_any(text)
+
+
+# ----------------------------- 🧮 Per-Distinct Helpers -----------------------------
+def per_distinct(values: pd.Series, func) -> np.ndarray:
+    """Evaluates `func` once per distinct value and broadcasts the result back through the codes."""
+    codes, uniques = pd.factorize(values)
+    if not len(uniques):
+        return np.zeros(len(values), dtype=bool)
+    results = np.array([func(u) for u in uniques])
+    return results[codes]
+
+
+def norm_column(df, col) -> pd.Series:
+    """Stripped string of every value, '' for missing values or a missing column."""
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    codes, uniques = pd.factorize(df[col], use_na_sentinel=True)
+    labels = np.array([str(u).strip() for u in uniques] + [""], dtype=object)
+    return pd.Series(labels[codes], index=df.index, dtype=object)
+
+
+def coalesce(columns) -> pd.Series:
+    """First non-empty value across the columns, row by row."""
+    result = columns[0]
+    for col in columns[1:]:
+        result = result.where(result != "", col)
+    return result
+
+
+def matchday_columns(columns):
+    """Columns that can hold the matchday ('Matchday', 'Match Day', 'Match', ...)."""
+    return [
+        c for c in columns
+        if "matchday" in str(c).lower() or "match day" in str(c).lower() or str(c).lower().strip() == "match"
+    ]
+
+
+# ----------------------------- 📚 Reference Competitions -----------------------------
+def _find_data_sheet(rosco_path):
+    try:
+        xls = pd.read_excel(open_source(rosco_path), sheet_name=None)
+    except Exception:
+        return None
+    for name in ["Data", "data", "Monitoring list", "monitoring list", "Monitoring List"]:
+        if name in xls:
+            return xls[name]
+    # Fallback: a sheet whose header mentions competitions or programme types
+    for sheet in xls.values():
+        header_text = " ".join(sheet.columns.astype(str).tolist()).lower()
+        if "competition" in header_text or "type of programme" in header_text or "type of program" in header_text:
+            return sheet
+    return None
+
+
+def load_reference_competitions(df_data=None, rosco_path=None):
+    """
+    Reference competitions and expected matchday counts from the Data sheet.
+
+    Returns:
+        (reference_comps, reference_matchday_counts): lowercase competition names
+        (defaults when nothing usable is found) and {competition: expected count}.
+    """
+    if df_data is None and rosco_path is not None:
+        df_data = _find_data_sheet(rosco_path)
+
+    reference_comps = set()
+    reference_matchday_counts = {}
+    if isinstance(df_data, pd.DataFrame):
+        # Distinct non-empty, non-numeric strings of every column
+        for i in range(df_data.shape[1]):
+            for val in df_data.iloc[:, i].astype(str).unique():
+                v = val.strip()
+                if v and v not in ["0", "nan", "-", "None"] and not re.fullmatch(r"^\d+$", v):
+                    reference_comps.add(v.lower())
+
+        # Heuristic: numeric entries in the first rows under a column are its expected count
+        try:
+            head = df_data.head(10)
+            for col in df_data.columns:
+                numeric_counts = [
+                    int(str(v).strip()) for v in head[col]
+                    if pd.notna(v) and str(v).strip().isdigit()
+                ]
+                if numeric_counts:
+                    reference_matchday_counts[col.strip().lower()] = numeric_counts[0]
+        except Exception:
+            pass
+
+    if not reference_comps:
+        reference_comps = set(DEFAULT_COMPETITIONS)
+    return reference_comps, reference_matchday_counts
+
+
+# ----------------------------- ⚽ Event / Matchday / Competition -----------------------------
+def event_matchday_competition_columns(df, reference_comps, reference_matchday_counts=None):
+    """
+    Vectorized Event / Competition / Matchday / Match validation.
+
+    Matchday and Home/Away column aliases are resolved once for the frame, the
+    competition is matched against a prebuilt automaton of the reference list
+    and the matchday format regex runs once per distinct value; results are
+    broadcast back to the rows.
+
+    Returns:
+        (ok, remark): bool Series and remark Series ("OK" when clean) aligned to `df.index`.
+    """
+    competition = norm_column(df, "Competition")
+    event = norm_column(df, "Event")
+
+    # The check's own output columns are never matchday sources
+    sources = [c for c in df.columns if c not in (EVENT_MATCHDAY_OK, EVENT_MATCHDAY_REMARK)]
+    matchday = coalesce([norm_column(df, "Matchday")] + [norm_column(df, c) for c in matchday_columns(sources)])
+
+    home = coalesce([norm_column(df, c) for c in ("Home Team", "HomeTeam", "Home")])
+    away = coalesce([norm_column(df, c) for c in ("Away Team", "AwayTeam", "Away")])
+    match_text = coalesce([norm_column(df, c) for c in ("Match", "Program Title", "Combined")])
+    has_separator = per_distinct(match_text, lambda t: " vs " in t.lower() or " v " in t.lower())
+
+    comp_lower = competition.str.lower()
+    matchday_lower = matchday.str.lower()
+    matcher = ReferenceMatcher(reference_comps)
+
+    flags = [
+        (competition.eq("") | competition.isin(MISSING_MARKERS)).to_numpy(),
+        (event.eq("") | event.isin(MISSING_MARKERS)).to_numpy(),
+        (matchday.eq("") | matchday.isin(MISSING_MARKERS)).to_numpy(),
+        ((home.eq("") | away.eq("")).to_numpy() & ~has_separator),
+        ~per_distinct(comp_lower, matcher.matches),
+        matchday.ne("").to_numpy() & ~per_distinct(
+            matchday_lower, lambda v: bool(MATCHDAY_FORMAT.search(v)) or v in MATCHDAY_TEXT_FORMS
+        ),
+    ]
+
+    # The format warning does not fail the row
+    ok = ~np.logical_or.reduce(flags[:5]) if len(df) else np.ones(0, dtype=bool)
+
+    # One remark string per distinct combination of flags
+    combo = np.zeros(len(df), dtype=np.int64)
+    for bit, flag in enumerate(flags):
+        combo |= flag.astype(np.int64) << bit
+    combos, inverse = np.unique(combo, return_inverse=True)
+    texts = np.array([
+        "; ".join(text for bit, text in enumerate(REMARKS) if c >> bit & 1) or "OK" for c in combos
+    ], dtype=object)
+    remark = texts[inverse.reshape(-1)] if len(df) else np.empty(0, dtype=object)
+
+    if reference_matchday_counts and len(df):
+        ok, remark = _apply_matchday_counts(df, comp_lower, matchday_lower, ok, remark, reference_matchday_counts)
+
+    return pd.Series(ok, index=df.index, dtype=bool), pd.Series(remark, index=df.index, dtype=object)
+
+
+def _apply_matchday_counts(df, comp_lower, matchday_lower, ok, remark, reference_matchday_counts):
+    """Flags rows of (competition, matchday) groups whose size differs from the reference count."""
+    observed = pd.DataFrame({"comp": comp_lower, "mday": matchday_lower}).value_counts(sort=False)
+    bad = []
+    for (comp, mday), count in observed.items():
+        expected = next(
+            (cnt for name, cnt in reference_matchday_counts.items() if name and (name in comp or comp in name)),
+            None,
+        )
+        if expected is not None and count != expected:
+            bad.append((comp, mday, f"Mismatch matches per matchday: expected {expected}, found {count}"))
+    if not bad:
+        return ok, remark
+
+    # Rows are matched on the raw column text, as the row-wise check did
+    def raw(col):
+        if col not in df.columns:
+            return pd.Series("", index=df.index, dtype=object)
+        return df[col].astype(str).str.strip().str.lower()
+
+    keys = pd.DataFrame({"comp": raw("Competition").to_numpy(), "mday": raw("Matchday").to_numpy()})
+    extra = keys.merge(pd.DataFrame(bad, columns=["comp", "mday", "extra"]), how="left", on=["comp", "mday"])["extra"]
+    hit = extra.notna().to_numpy()
+    remark = np.where(hit, remark + "; " + extra.fillna("").to_numpy(dtype=object), remark)
+    return ok & ~hit, remark
@@ -0,0 +1,162 @@
+import os
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, peak RSS is not reported
+    resource = None
+
+# Histogram bucket upper bounds (comma-separated env overrides)
+QC_METRICS_SECONDS_BUCKETS = tuple(
+    float(b) for b in os.getenv("QC_METRICS_SECONDS_BUCKETS", "0.01,0.05,0.1,0.25,0.5,1,2.5,5,10,30,60,120,300").split(",")
+)
+QC_METRICS_BYTES_BUCKETS = tuple(
+    float(b) * 1024 * 1024 for b in os.getenv("QC_METRICS_MB_BUCKETS", "1,8,32,128,512,1024,4096").split(",")
+)
+QC_METRICS_ROWS_BUCKETS = tuple(
+    float(b) for b in os.getenv("QC_METRICS_ROWS_BUCKETS", "100,1000,10000,100000,1000000,10000000").split(",")
+)
+
+
+# ----------------------------- ⏱️ Check Profiling -----------------------------
+def _peak_rss_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class CheckProfile:
+    """
+    Profiles one check invocation (use as a context manager).
+
+    Wall time, CPU time of the calling thread, growth of the process peak RSS
+    and rows in/out. Peak RSS is process-wide, so checks running side by side
+    on the DAG thread pool can see each other's allocations.
+
+        profile = CheckProfile(len(df))
+        with profile:
+            out = check(df)
+        profile.rows_out = len(out)
+        summary["details"]["profile"] = profile.as_dict()
+    """
+
+    def __init__(self, rows_in=None):
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.wall_seconds = None
+        self.cpu_seconds = None
+        self.peak_rss_delta_bytes = None
+
+    def __enter__(self):
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        self._rss = _peak_rss_bytes()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.wall_seconds = time.perf_counter() - self._wall
+        self.cpu_seconds = time.thread_time() - self._cpu
+        rss = _peak_rss_bytes()
+        if rss is not None:
+            self.peak_rss_delta_bytes = max(0, rss - self._rss)
+        return False
+
+    def as_dict(self) -> dict:
+        """Plain (JSON-safe) profile for a summary's `details`."""
+        return {
+            "wall_seconds": round(self.wall_seconds, 6) if self.wall_seconds is not None else None,
+            "cpu_seconds": round(self.cpu_seconds, 6) if self.cpu_seconds is not None else None,
+            "peak_rss_delta_bytes": self.peak_rss_delta_bytes,
+            "rows_in": None if self.rows_in is None else int(self.rows_in),
+            "rows_out": None if self.rows_out is None else int(self.rows_out),
+        }
+
+
+# ----------------------------- 📈 Prometheus Histograms -----------------------------
+class Histogram:
+    """Cumulative histogram per label set, rendered in the Prometheus text format."""
+
+    def __init__(self, name, help_text, buckets, label_names=("pipeline", "check")):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.label_names = label_names
+        self._series = {}  # labels -> [bucket counts, sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, labels: tuple, value) -> None:
+        with self._lock:
+            series = self._series.setdefault(labels, [[0] * len(self.buckets), 0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = sorted((labels, list(counts), total, count) for labels, (counts, total, count) in self._series.items())
+        for labels, counts, total, count in snapshot:
+            base = ",".join(f'{k}="{_escape(v)}"' for k, v in zip(self.label_names, labels))
+            for bound, n in zip(self.buckets, counts):
+                lines.append(f'{self.name}_bucket{{{base},le="{bound:.15g}"}} {n}')
+            lines.append(f'{self.name}_bucket{{{base},le="+Inf"}} {count}')
+            lines.append(f"{self.name}_sum{{{base}}} {total!r}")
+            lines.append(f"{self.name}_count{{{base}}} {count}")
+        return lines
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# Profile field -> histogram
+CHECK_HISTOGRAMS = {
+    "wall_seconds": Histogram("qc_check_wall_seconds", "Wall time per QC check invocation.", QC_METRICS_SECONDS_BUCKETS),
+    "cpu_seconds": Histogram("qc_check_cpu_seconds", "CPU time (calling thread) per QC check invocation.", QC_METRICS_SECONDS_BUCKETS),
+    "peak_rss_delta_bytes": Histogram("qc_check_peak_rss_delta_bytes", "Growth of the worker peak RSS during a QC check.", QC_METRICS_BYTES_BUCKETS),
+    "rows_in": Histogram("qc_check_rows_in", "Rows passed into a QC check.", QC_METRICS_ROWS_BUCKETS),
+    "rows_out": Histogram("qc_check_rows_out", "Rows left after a QC check.", QC_METRICS_ROWS_BUCKETS),
+}
+
+
+# ----------------------------- 📤 Recording / Export -----------------------------
+def observe_profile(pipeline: str, check: str, profile: dict) -> None:
+    """Adds one check profile (CheckProfile.as_dict()) to the histograms."""
+    for field, histogram in CHECK_HISTOGRAMS.items():
+        value = profile.get(field)
+        if value is not None:
+            histogram.observe((pipeline, check), value)
+
+
+def record_summaries(pipeline: str, summaries) -> None:
+    """
+    Feeds the profiles found in check summaries (`details["profile"]`) to the
+    histograms. Pipelines run in worker processes, so the API process records
+    them from the summaries it gets back. A check reported in several summaries
+    (one per *_OK column) is counted once.
+    """
+    seen = set()
+    for summary in summaries or []:
+        details = summary.get("details") if isinstance(summary, dict) else None
+        profile = details.get("profile") if isinstance(details, dict) else None
+        if not profile:
+            continue
+        check = details.get("check") or summary.get("check_key") or summary.get("description")
+        if check in seen:
+            continue
+        seen.add(check)
+        observe_profile(pipeline, check, profile)
+
+
+def render_metrics() -> str:
+    """All check histograms in the Prometheus text exposition format."""
+    lines = []
+    for histogram in CHECK_HISTOGRAMS.values():
+        lines += histogram.render()
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,123 @@
+import pandas as pd
+
+from qc_checks import detect_period_from_rosco, load_bsr
+from qc_incremental import Revalidation
+from qc_ingest import open_source, source_digest
+from qc_reference import get_reference
+from qc_registry import QC_CHECKS, build_check_plan, check_versions, run_checks
+from qc_result_cache import result_key
+
+from C_data_processing_f1 import BSRValidator
+from qc_report import write_qc_report
+from qc_results import QCResults, qc_summaries
+
+# NOTE: Everything here runs inside QC worker processes (see qc_executor.py).
+# Functions must stay module-level and take/return only picklable values
+# (paths / IngestedUploads, lists, dicts) -- never UploadFile objects or DataFrames.
+
+
+# Check names of the general pipeline in declared order (also the job progress list)
+QC_PIPELINE_CHECKS = [spec.name for spec in QC_CHECKS]
+
+
+def baseline_context(rosco_path, data_path=None) -> str:
+    """Everything besides the BSR that a QC baseline is only valid for."""
+    return result_key(
+        "qc_baseline",
+        {"rosco": source_digest(rosco_path), "data": data_path and source_digest(data_path)},
+        check_versions(QC_PIPELINE_CHECKS),
+        get_reference().version,
+    )
+
+
+# ----------------------------- 🚀 General QC Pipeline -----------------------------
+def run_qc_pipeline(rosco_path, bsr_path, output_path, data_path=None, cache=None, progress=None,
+                    baselines=None, baseline_id=None, previous_baseline_id=None):
+    """
+    Runs the full qc_checks pipeline on ingested uploads (IngestedUpload or
+    paths) and writes the colored
+    report (with Summary sheet) to `output_path`. Returns the check summary
+    dicts (one per *_OK column, counted from the result bitmask), each with the
+    profile of the check that wrote the column in its `details`.
+
+    `progress(check_name)` is called as each check finishes when given.
+
+    With a BaselineStore (`baselines`), the run is stored as `baseline_id`, and
+    when `previous_baseline_id` names the run of an earlier version of this
+    BSR, only changed rows and the groups they fall in are re-checked (see
+    qc_incremental.py); `details` then also hold the rows each check reran.
+    """
+    df_data = None
+    if data_path:
+        if cache is not None:
+            df_data = cache.load(data_path, "data_sheet0", lambda src: (pd.read_excel(src), 0))
+        else:
+            df_data = pd.read_excel(open_source(data_path))
+
+    start_date, end_date = detect_period_from_rosco(rosco_path)
+    df = load_bsr(bsr_path, cache=cache)
+
+    # Independent checks run concurrently on column projections (see qc_registry.py);
+    # pass/fail and remark columns are packed into `results` as they complete
+    specs = QC_CHECKS
+    revalidation = None
+    if baselines is not None:
+        previous = baselines.get(previous_baseline_id) if previous_baseline_id else None
+        if previous_baseline_id and previous is None:
+            print(f"ℹ️ Baseline {previous_baseline_id} not found (expired?); running every check")
+        revalidation = Revalidation(
+            df, QC_CHECKS, previous, context_key=baseline_context(rosco_path, data_path), baseline_id=previous_baseline_id
+        )
+        specs = revalidation.wrap(QC_CHECKS)
+
+    results = QCResults(len(df))
+    profiles = {}
+    # *_OK column -> check that (last) writes it, for attaching the check's profile
+    written_by = {col: spec.name for spec, _, writes, _ in build_check_plan(df.columns, QC_CHECKS) for col in writes}
+    df = run_checks(
+        df, specs,
+        context={"start_date": start_date, "end_date": end_date, "df_data": df_data, "rosco_path": rosco_path},
+        progress=progress,
+        results=results,
+        profiles=profiles
+    )
+
+    # Data sheet, *_OK coloring and Summary sheet in a single write pass
+    summary_rows = write_qc_report(output_path, df, results=results)
+    details = {
+        col: {"check": name, "profile": profiles[name]} for col, name in written_by.items() if name in profiles
+    }
+    if revalidation is not None:
+        if baseline_id:
+            baselines.put(baseline_id, revalidation.snapshot())
+        if revalidation.incremental:
+            for col, name in written_by.items():
+                if col in details:
+                    details[col]["rows_rerun"] = revalidation.rerun.get(name)
+    return qc_summaries(summary_rows, details)
+
+
+# ----------------------------- 🌍 Market Check Pipeline -----------------------------
+def run_market_pipeline(bsr_path, checks, output_path, obligation_path=None, overnight_path=None, cache=None, progress=None):
+    """
+    Applies the selected market checks with BSRValidator and writes the processed
+    sheet to `output_path`. Returns the list of check summary dicts.
+
+    `progress(check_key, summary)` is called after each check when given.
+    """
+    validator = BSRValidator(
+        bsr_path=bsr_path,
+        obligation_path=obligation_path,
+        overnight_path=overnight_path,
+        cache=cache,
+        checks=checks
+    )
+    status_summaries = validator.market_check_processor(checks, on_check=progress)
+    # Full BSR again: columns the checks did not need were carried through untouched
+    df_processed = validator.output_frame()
+
+    clean_summaries = [s for s in status_summaries if isinstance(s, dict)]
+    if df_processed.empty: raise Exception("Processed DataFrame is empty after applying checks.")
+
+    df_processed.to_excel(output_path, index=False)
+    return clean_summaries
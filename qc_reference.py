@@ -0,0 +1,342 @@
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+import pandas as pd
+
+from qc_ingest import source_digest
+from qc_schedule import SessionSchedule
+
+# Optional JSON/YAML file overriding the built-in reference data (top-level keys of DEFAULT_REFERENCE)
+QC_REFERENCE_PATH = os.getenv("QC_REFERENCE_PATH")
+# Active version shared by every uvicorn worker: a reload publishes it here and the
+# other workers switch to it on their next get_reference()
+QC_REFERENCE_STATE_PATH = os.getenv("QC_REFERENCE_STATE", os.path.join(os.getcwd(), "qc_reference_state.json"))
+# Obligation workbooks kept indexed per process
+QC_OBLIGATION_SLOTS = int(os.getenv("QC_OBLIGATION_SLOTS", "8"))
+
+OBLIGATION_SHEET = "F1 - Broadcaster Obligations"
+
+DEFAULT_REFERENCE = {
+    "target_gp": "15_Dutch GP",
+    # Obligation Channel : BSR Group Name (inverted for lookups by broadcaster)
+    "obligation_channel_to_bsr_group": {
+        'DigitAlb': 'Digit-Alb',
+        'Fox Sports 1': 'Mediapro',
+        'Fast Sports': 'Fast Media',
+        'beIN': 'beIN Media Group',
+        'Fox Sport': 'Fox Broadcasting Company',
+        'ORF': 'ORF',
+        'Sky Sport': 'Sky',
+        'Idman TV': 'Idman TV',
+        'RTBF': 'RTBF',
+        'Telenet': 'Telenet',
+        'ESPN': 'ESPN',
+        'Bandsports': 'Grupo Bandeirantes de Comunicacao',
+        'TV Bandeirantes': 'Grupo Bandeirantes de Comunicaçao',
+        'Nova TV': 'Nova Broadcasting Group',
+        'TSN': 'CTV Specialty Television',
+        'CCTV5': 'CCTV',
+        'Great Sports': 'Shanghai Media Group',
+        'Guangdong TV': 'Guangdong TV',
+        'Tencent': 'Tencent',
+        'Cytavision': 'Cytavision',
+        'Nova Sport': 'CME Group',
+        'TV3': 'TV3',
+        'Go3': 'Go3',
+        'TV6': 'All Media Baltics',
+        'Setanta Sports': 'Setanta Eurasia',
+        'Viasat': 'Viasat',
+        'Canal+': 'Canal+ Group',
+        'ANT1': 'Antenna Group',
+        'Now Sports': 'Now Sports',
+        'M4': 'MTVA',
+        'Viaplay': 'Viaplay Group',
+        'Fancode': 'Fancode',
+        'Sport5': 'Sport5',
+        'DAZN': 'DAZN',
+        'Fuji TV': 'Fuji Media Holdings Inc.',
+        'RTL Lux': 'RTL',
+        'V Sport': 'Viaplay Group',
+        'TVWAN': 'TVWAN',
+        'SuperSport': 'MultiChoice',
+        'beIN Sports': 'beIN Media Group',
+        'Arena Sport': 'Arena TV',
+        'Sportklub': 'United Media',
+        'RUSH Sports': 'RUSH Sports',
+        'Eleven Sports': 'Eleven Sports Network',
+        'Polsat': 'Polsat Group',
+        'Antena': 'Antena TV Group',
+        'Coupang': 'Coupang',
+        'Vsport': 'Viaplay Group',
+        'RSI': 'RSI',
+        'RTS': 'RTS',
+        'SRF': 'SRG SSR',
+        'ELTA': 'ELTA TV',
+        'Videoland Sports': 'Videoland Sports',
+        'K+': 'Vietnam Telecom Digital TV Co. Ltd',
+        'Fox Sports': 'Fox Broadcasting Company',
+        'Fox Sports 2': 'Fox Broadcasting Company',
+        'SRF INFO': 'SRG SSR',
+        'ORF 1': 'ORF',
+        'ORF 2': 'ORF',
+    },
+    # Competition keyword -> markets counted as domestic (first matching keyword wins)
+    "domestic_markets": {
+        "bundesliga": ["germany", "deutschland"],
+        "premier league": ["united kingdom", "england"],
+        "la liga": ["spain"],
+        "serie a": ["italy"],
+        "ligue 1": ["france"],
+    },
+    # Official live sessions of the target GP (dates/times in UTC; "end" defaults to one hour after "start")
+    "live_schedule": [
+        {"session": "Practice 1", "date": "4-Jul-2025", "start": "11:30:00", "end": "12:30:00"},
+        {"session": "Practice 2", "date": "4-Jul-2025", "start": "15:00:00", "end": "16:00:00"},
+        {"session": "Practice 3", "date": "5-Jul-2025", "start": "10:30:00", "end": "11:30:00"},
+        {"session": "Qualifying", "date": "5-Jul-2025", "start": "14:00:00", "end": "15:00:00"},
+        {"session": "Race", "date": "6-Jul-2025", "start": "14:00:00", "end": "16:00:00"},
+    ],
+    "session_competition_map": {
+        "Practice 1": "Training",
+        "Practice 2": "Training",
+        "Practice 3": "Training",
+    },
+    # Program title keyword -> confidence score used by the program type imputation
+    "keyword_scores": {
+        'live': 25, 'en vivo': 25,
+        'repeat': 20, 'replay': 20, 'rerun': 20,
+        'highlights': 15, 'review': 15, 'summary': 15, 'best of': 15,
+        'magazine': 5, 'show': 5, 'pre-race': 5, 'post-race': 5,
+    },
+    # Optional obligation workbook indexed at startup
+    "obligation_workbook": None,
+}
+
+
+# ----------------------------- 📚 Reference Data -----------------------------
+class ObligationIndex:
+    """
+    Obligation rows of one workbook for the target GP, with the lookup sets
+    the obligation check needs.
+
+    Attributes:
+        frame: Filtered obligation rows (treat as read-only).
+        required_keys: frozenset of 'COUNTRY|Broadcaster' keys.
+        channel_names: frozenset of obligated broadcaster/channel names.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        country = frame["Country"].astype(str).str.strip().str.upper()
+        broadcaster = frame["Broadcaster"].astype(str).str.strip()
+        self.required_keys = frozenset(country + "|" + broadcaster)
+        self.channel_names = frozenset(broadcaster)
+
+
+class ReferenceData:
+    """
+    One immutable version of the static QC reference data.
+
+    Mappings are read-only views and sequences are tuples, so a version can be
+    shared by concurrent checks; a reload builds a new instance and swaps it in.
+    Only the obligation index memo changes after construction.
+    """
+
+    def __init__(self, source: dict, version: str):
+        self.source = source
+        self.version = version
+        self.target_gp = source["target_gp"]
+
+        groups = dict(source["obligation_channel_to_bsr_group"])
+        self.obligation_channel_to_group = MappingProxyType(groups)
+        # BSR group (lowercase) -> obligation channel; later entries win, as in the original inversion
+        self.broadcaster_to_obligation_channel = MappingProxyType({v.lower(): k for k, v in groups.items()})
+
+        self.domestic_markets = tuple(
+            (key.lower(), tuple(m.lower() for m in markets)) for key, markets in source["domestic_markets"].items()
+        )
+        self.keyword_scores = MappingProxyType(dict(source["keyword_scores"]))
+
+        schedule = pd.DataFrame(source["live_schedule"], columns=["session", "date", "start"])
+        schedule["Competition_Map"] = schedule["session"].replace(source["session_competition_map"]).str.strip()
+        schedule["Scheduled_Date_Clean"] = pd.to_datetime(schedule["date"]).dt.date
+        self._live_schedule = schedule[["Competition_Map", "Scheduled_Date_Clean"]]
+        # Session windows for matching airings (program type imputation)
+        self.session_schedule = SessionSchedule.from_reference(source["live_schedule"], source["session_competition_map"])
+
+        self._obligations = OrderedDict()
+        self._obligations_lock = threading.Lock()
+
+    def live_schedule(self) -> pd.DataFrame:
+        """Scheduled (Competition_Map, Scheduled_Date_Clean) rows, as a copy the caller may modify."""
+        return self._live_schedule.copy()
+
+    def domestic_markets_for(self, competition: str) -> tuple:
+        """Domestic markets of the first competition keyword contained in `competition` (lowercase)."""
+        for key, markets in self.domestic_markets:
+            if key in competition:
+                return markets
+        return ()
+
+    def obligations(self, path: str, loader) -> ObligationIndex:
+        """
+        Indexed obligation rows of a workbook, memoized by its content hash, so
+        every validator sharing the same bytes reads and filters it once.
+
+        Args:
+            path: Obligation workbook (path or IngestedUpload).
+            loader: Callable() -> DataFrame of the obligation sheet (only called on a miss).
+        """
+        key = (source_digest(path), self.target_gp)
+        with self._obligations_lock:
+            if key in self._obligations:
+                self._obligations.move_to_end(key)
+                return self._obligations[key]
+
+        df_obl = loader()
+        index = ObligationIndex(df_obl[df_obl.get("GP") == self.target_gp].copy())
+        print(f"Obligation data loaded and filtered for: {self.target_gp}. Rows found: {len(index.frame)}")
+
+        with self._obligations_lock:
+            self._obligations[key] = index
+            while len(self._obligations) > QC_OBLIGATION_SLOTS:
+                self._obligations.popitem(last=False)
+        return index
+
+
+# ----------------------------- 🔄 Loading / Hot Reload -----------------------------
+def _read_source_file(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        if path.lower().endswith((".yml", ".yaml")):
+            import yaml
+            data = yaml.safe_load(f) or {}
+        else:
+            data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"Reference file {path} must hold a mapping at the top level.")
+    unknown = set(data) - set(DEFAULT_REFERENCE)
+    if unknown:
+        raise ValueError(f"Unknown reference keys in {path}: {', '.join(sorted(unknown))}")
+    return data
+
+
+def load_reference(path: str = None) -> ReferenceData:
+    """Builds a ReferenceData version from the defaults plus the overrides in `path` (if any)."""
+    source = copy.deepcopy(DEFAULT_REFERENCE)
+    if path:
+        source.update(_read_source_file(path))
+    version = hashlib.sha256(json.dumps(source, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:12]
+    reference = ReferenceData(source, version)
+
+    workbook = source.get("obligation_workbook")
+    if workbook:
+        # Warm the obligation index so the first validator does not pay for it
+        reference.obligations(
+            workbook, lambda: pd.read_excel(workbook, sheet_name=OBLIGATION_SHEET).rename(columns=lambda c: str(c).strip())
+        )
+    return reference
+
+
+_current = None
+_current_lock = threading.Lock()
+# (mtime_ns, size) of the published state _current corresponds to
+_current_stamp = None
+# Pool workers take their version from each task's snapshot instead of the published state
+_follow_published = True
+
+
+def _published_stamp():
+    try:
+        st = os.stat(QC_REFERENCE_STATE_PATH)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _publish(reference: ReferenceData):
+    """Writes the version and its resolved source to QC_REFERENCE_STATE_PATH (atomically, via rename)."""
+    folder = os.path.dirname(os.path.abspath(QC_REFERENCE_STATE_PATH))
+    fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": reference.version, "source": reference.source}, f, default=str)
+        os.replace(tmp_path, QC_REFERENCE_STATE_PATH)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return _published_stamp()
+
+
+def _adopt_published(stamp) -> None:
+    """Switches to the published version when it differs from the current one (caller holds _current_lock)."""
+    global _current, _current_stamp
+    _current_stamp = stamp
+    try:
+        with open(QC_REFERENCE_STATE_PATH, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        version, source = state["version"], state["source"]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ Could not read published QC reference data {QC_REFERENCE_STATE_PATH}: {e}")
+        return
+    if _current is None or _current.version != version:
+        # The resolved source is used as published, so every worker builds the same version
+        _current = ReferenceData(source, version)
+        print(f"📚 QC reference data switched to published version {version}")
+
+
+def get_reference() -> ReferenceData:
+    """
+    The current reference version: the one last published by a reload on any
+    worker, else loaded on first use when the lifespan did not preload it.
+    """
+    global _current
+    if _follow_published:
+        stamp = _published_stamp()
+        if stamp is not None and stamp != _current_stamp:
+            with _current_lock:
+                if stamp != _current_stamp:
+                    _adopt_published(stamp)
+    if _current is None:
+        with _current_lock:
+            if _current is None:
+                _current = load_reference(QC_REFERENCE_PATH)
+    return _current
+
+
+def reload_reference(path: str = None) -> ReferenceData:
+    """
+    Loads a new version, publishes it for the other workers and swaps it in
+    atomically. Checks already running keep the version they started with.
+    On error the current version stays in place.
+    """
+    global _current, _current_stamp
+    reference = load_reference(path or QC_REFERENCE_PATH)
+    with _current_lock:
+        _current_stamp = _publish(reference)
+        _current = reference
+    print(f"📚 QC reference data loaded (version {reference.version})")
+    return reference
+
+
+# --- Worker processes ---
+def reference_snapshot() -> tuple:
+    """(version, source) of the current version, sent along with every pool task."""
+    reference = get_reference()
+    return reference.version, reference.source
+
+
+def use_reference_snapshot(snapshot) -> ReferenceData:
+    """Makes a worker process use the snapshot's version, rebuilding only when the version changed."""
+    global _current, _follow_published
+    _follow_published = False
+    version, source = snapshot
+    with _current_lock:
+        if _current is None or _current.version != version:
+            _current = ReferenceData(source, version)
+        return _current
@@ -0,0 +1,416 @@
+import copy
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+
+from qc_checks import (
+    period_check,
+    completeness_check,
+    overlap_duplicate_daybreak_check,
+    program_category_check,
+    duration_check,
+    check_event_matchday_competition,
+    market_channel_program_duration_check,
+    domestic_market_coverage_check,
+    rates_and_ratings_check,
+    duplicated_markets_check,
+    country_channel_id_check,
+    client_lstv_ott_check,
+)
+from qc_durations import DURATION_MINUTES
+from qc_matching import matchday_columns
+from qc_metrics import CheckProfile
+
+# Threads used to run independent checks of one QC run side by side
+QC_CHECK_THREADS = int(os.getenv("QC_CHECK_THREADS", min(4, os.cpu_count() or 1)))
+
+
+# ----------------------------- 📋 Check Specs -----------------------------
+class CheckSpec:
+    """
+    Declares one QC check for the scheduler.
+
+    Args:
+        name: Check key (also reported to progress callbacks).
+        func: Callable(df, **kwargs) -> df. Receives a projection holding only `reads`.
+        reads / writes: Column declarations. Each item is a column name or a
+            callable(available_columns) -> list of names, resolved against the
+            columns that exist at this check's position in the declared order.
+        context: {parameter name: context key} passed to `func` as keyword arguments.
+        groups: Which other rows a row's output depends on, for incremental
+            re-validation (qc_incremental.py): [] for row-local checks, a list
+            of groupings (each a list of column declarations) for checks that
+            compare rows within groups, None (default) for the whole frame.
+    """
+
+    def __init__(self, name, func, reads=(), writes=(), context=None, groups=None):
+        self.name = name
+        self.func = func
+        self.reads = list(reads)
+        self.writes = list(writes)
+        self.context = context or {}
+        self.groups = None if groups is None else [list(cols) for cols in groups]
+
+    def replace(self, **changes):
+        spec = copy.copy(self)
+        for key, value in changes.items():
+            setattr(spec, key, value)
+        return spec
+
+
+def _resolve(declared, available):
+    cols = []
+    for item in declared:
+        names = item(available) if callable(item) else [item]
+        for name in names:
+            if name not in cols:
+                cols.append(name)
+    return cols
+
+
+# --- Column declaration helpers (mirror how each check picks its columns) ---
+def all_columns(available):
+    return list(available)
+
+
+def first_containing(*keywords):
+    """First column whose lowercase name contains every keyword (like `next(c for c in df.columns if ...)`)."""
+    def pick(available):
+        col = next((c for c in available if all(k in str(c).lower() for k in keywords)), None)
+        return [col] if col is not None else []
+    return pick
+
+
+def any_containing(*keywords):
+    """Every column whose lowercase name contains any of the keywords."""
+    def pick(available):
+        return [c for c in available if any(k in str(c).lower() for k in keywords)]
+    return pick
+
+
+def last_named(*names):
+    """Last column whose stripped lowercase name is one of `names` (duration_check's detection loop)."""
+    def pick(available):
+        found = [c for c in available if str(c).lower().strip() in names]
+        return found[-1:]
+    return pick
+
+
+# Reads/writes shared by the qc_checks functions and their BSRValidator method versions
+CHECK_COLUMNS = {
+    "period_check": (
+        [first_containing("date")],
+        ["Date_checked", "Within_Period_OK", "Within_Period_Remark"],
+    ),
+    "completeness_check": (
+        [any_containing("channel", "aud", "price", "match")],
+        ["Completeness_OK", "Completeness_Remark"],
+    ),
+    "overlap_duplicate_daybreak_check": (
+        # The duplicate hash covers every column present, and Start/End are converted in place
+        [all_columns],
+        [first_containing("start"), first_containing("end"),
+         "No_Overlap", "No_Overlap_Remark", "Overlap_With_Row", "Is_Duplicate", "Is_Duplicate_OK", "Is_Duplicate_Remark",
+         "Day_Break_OK", "Day_Break_Remark"],
+    ),
+    "program_category_check": (
+        [first_containing("type", "program"), first_containing("duration"), DURATION_MINUTES],
+        ["Program_Category_OK", "Program_Category_Remark"],
+    ),
+    "duration_check": (
+        # Start/End are rewritten as strings
+        [last_named("start (utc)", "start"), last_named("end (utc)", "end"), first_containing("type", "program")],
+        [last_named("start (utc)", "start"), last_named("end (utc)", "end"),
+         "Expected_Category_From_Duration", "Duration_Check_OK"],
+    ),
+    "check_event_matchday_competition": (
+        ["Competition", "Event", "Matchday", "Home Team", "HomeTeam", "Home", "Away Team", "AwayTeam", "Away",
+         "Match", "Program Title", "Combined", matchday_columns],
+        ["Event_Matchday_Competition_OK", "Event_Matchday_Competition_Remark"],
+    ),
+    "market_channel_program_duration_check": (
+        ["Market", "TV-Channel", "Program Title", "Combined", "Duration", DURATION_MINUTES],
+        ["Market_Channel_Consistency_OK", "Program_Duration_Consistency_OK", "Market_Channel_Program_Remark"],
+    ),
+    "domestic_market_coverage_check": (
+        ["Competition", "Market", "Type of Program"],
+        ["Domestic_Market_Coverage_OK", "Domestic_Market_Remark"],
+    ),
+    "rates_and_ratings_check": (
+        ["Source", "TVR% 3+", "CPT's [Euro]", "Spot price in Euro [30 sec.]", "TV-Channel", "Date", "Type of program"],
+        # Source / TVR% 3+ / CPT's [Euro] are added when missing
+        ["Source", "TVR% 3+", "CPT's [Euro]", "Rates_Ratings_QC_OK", "Rates_Ratings_QC_Remark"],
+    ),
+    "duplicated_markets_check": (
+        ["Market", "TV-Channel", "Duration", DURATION_MINUTES],
+        ["Duration_Hours", "Duplicated_Market_Check_OK", "Duplicated_Market_Check"],
+    ),
+    "country_channel_id_check": (
+        ["TV-Channel", "Channel ID", "Market", "Market ID"],
+        ["Market_Channel_ID_OK", "Market_Channel_ID_Remark"],
+    ),
+    "client_lstv_ott_check": (
+        ["Market ID", "Channel ID", "Pay/Free TV"],
+        ["Client_LSTV_OTT_OK", "Client_LSTV_OTT_Remark"],
+    ),
+}
+
+
+# Rows each check compares a row with (see CheckSpec.groups). Unlisted checks depend on the whole frame
+CHECK_GROUPS = {
+    "period_check": [],
+    "completeness_check": [],
+    # Overlaps are per channel/day; duplicate rows share their channel and date too
+    "overlap_duplicate_daybreak_check": [[first_containing("channel"), first_containing("date")]],
+    "program_category_check": [],
+    "duration_check": [],
+    # Matchday counts are per competition
+    "check_event_matchday_competition": [["Competition"]],
+    "market_channel_program_duration_check": [],
+    "domestic_market_coverage_check": [],
+    "rates_and_ratings_check": [["TV-Channel", "Date"]],
+    "duplicated_markets_check": [["TV-Channel"]],
+    "country_channel_id_check": [["TV-Channel"], ["Channel ID"], ["Market"], ["Market ID"]],
+    "client_lstv_ott_check": [["Channel ID"], ["Market ID"]],
+}
+
+
+def _spec(func, context=None, name=None):
+    name = name or func.__name__
+    reads, writes = CHECK_COLUMNS[name]
+    return CheckSpec(name, func, reads=reads, writes=writes, context=context, groups=CHECK_GROUPS.get(name))
+
+
+# qc_checks pipeline, in the order the checks were historically run
+QC_CHECKS = [
+    _spec(period_check, {"start_date": "start_date", "end_date": "end_date"}),
+    _spec(completeness_check),
+    _spec(overlap_duplicate_daybreak_check),
+    _spec(program_category_check),
+    _spec(duration_check),
+    _spec(check_event_matchday_competition, {"df_data": "df_data", "rosco_path": "rosco_path"}),
+    _spec(market_channel_program_duration_check, {"reference_df": "df_data"}),
+    _spec(domestic_market_coverage_check, {"reference_df": "df_data"}),
+    _spec(rates_and_ratings_check),
+    _spec(duplicated_markets_check),
+    _spec(country_channel_id_check),
+    _spec(client_lstv_ott_check),
+]
+
+
+# --- BSRValidator method versions (BSRValidator.run_full_qc) ---
+def _call_validator_method(method_name, df, validator, **kwargs):
+    """Runs a BSRValidator QC method on a shallow clone whose .df is the column projection."""
+    clone = copy.copy(validator)
+    clone.df = df
+    return getattr(clone, method_name)(**kwargs)
+
+
+def _validator_spec(spec, context=None):
+    return spec.replace(
+        func=partial(_call_validator_method, spec.name),
+        context={"validator": "validator", **(context or {})},
+    )
+
+
+VALIDATOR_CHECKS = [
+    # The method version skips the Rosco period and only writes the OK/Remark pair
+    _validator_spec(QC_CHECKS[0].replace(reads=[], writes=["Within_Period_OK", "Within_Period_Remark"])),
+    *[_validator_spec(spec) for spec in QC_CHECKS[1:5]],
+    _validator_spec(QC_CHECKS[5], {"df_data": "df_data"}),
+    _validator_spec(QC_CHECKS[6], {"reference_df": "df_data"}),
+    _validator_spec(QC_CHECKS[7], {"reference_df": "df_data"}),
+    *[_validator_spec(spec) for spec in QC_CHECKS[8:]],
+]
+
+
+# ----------------------------- 🌍 Market Check Columns -----------------------------
+# BSR columns each BSRValidator market check reads or rewrites (keys of market_check_map).
+# Columns a check only adds are not listed. Placeholder checks need none.
+MARKET_CHECK_COLUMNS = {
+    "check_latam_espn": ["Region", "Broadcaster", "Market"],
+    "check_italy_mexico": [
+        "TV-Channel", "Channel ID", "Start", "End", "Region", "Market", "Duration", "Combined", "Broadcaster",
+        "Program Description", "Program Title", "TVR% 3+", "Aud Metered (000s) 3+", "Start (UTC)", "End (UTC)", "Day",
+    ],
+    "check_channel4plus1": [],
+    "check_espn4_bsa": [],
+    "check_f1_obligations": ["Broadcaster", "TV-Channel", "Market"],
+    "duration_limits": ["Duration"],
+    "live_date_integrity": ["Type of program", "Competition", "Date (UTC/GMT)"],
+    "impute_program_type_confidence": ["Program Title", "Date (UTC/GMT)", "Start (UTC)", "End (UTC)"],
+    "apply_duplication_weights": [
+        "Market", "Broadcaster", "Master_Broadcaster", "TV-Channel", "Aud. Estimates ['000s]",
+        "Obligation_Broadcaster_Status",
+    ],
+    "check_session_completeness": ["Competition", "TV-Channel", "Type of program", "Market"],
+    "update_audience_from_overnight": ["Market", "TV-Channel", "Date", "Competition", "Aud Metered (000s) 3+"],
+    "check_youtube_global": [],
+    "check_pan_mena": [],
+    "check_china_tencent": [],
+    "check_czech_slovakia": [],
+    "check_ant1_greece": [],
+    "check_india": [],
+    "check_usa_espn": [],
+    "check_dazn_japan": [],
+    "check_aztv": [],
+    "check_rush_caribbean": [],
+    "remove_andorra": ["Market", "Country"],
+    "remove_serbia": ["Market", "Country"],
+    "remove_montenegro": ["Market", "Country"],
+    "remove_brazil_espn_fox": ["Market", "Broadcaster"],
+    "remove_switz_canal": ["Market", "TV-Channel"],
+    "remove_viaplay_baltics": ["Broadcaster", "Market"],
+    "recreate_viaplay": [],
+    "recreate_disney_latam": [],
+}
+
+
+# ----------------------------- 🔖 Check Versions -----------------------------
+# Part of the result cache key. Bump a check's entry when its output changes, so
+# results cached by the earlier logic stop matching. Unlisted checks are "1".
+CHECK_VERSIONS = {
+    # Vectorized schedule matching (qc_schedule.py); the earlier version failed at runtime
+    "impute_program_type_confidence": "2",
+}
+
+
+def check_versions(checks) -> list:
+    """[check key, version] pairs in run order."""
+    return [[key, CHECK_VERSIONS.get(key, "1")] for key in checks]
+
+
+def market_check_columns(checks):
+    """
+    Union of the BSR columns the given market checks need, in declaration order.
+    Returns None (load every column) when a check has no declaration.
+    """
+    columns = []
+    for key in checks:
+        if key not in MARKET_CHECK_COLUMNS:
+            return None
+        columns += [c for c in MARKET_CHECK_COLUMNS[key] if c not in columns]
+    return columns
+
+
+# ----------------------------- 🕸️ DAG Scheduler -----------------------------
+def build_check_plan(columns, specs):
+    """
+    Resolves every spec's reads/writes in declared order and derives its dependencies.
+
+    A check depends on each earlier check it shares a column with as
+    read-after-write, write-after-read or write-after-write, so running the DAG
+    gives the same result as running the list in order.
+
+    Returns:
+        List of (spec, reads, writes, deps) with deps as indexes into `specs`.
+    """
+    available = list(columns)
+    plan = []
+    for i, spec in enumerate(specs):
+        reads = [c for c in _resolve(spec.reads, available) if c in available]
+        writes = _resolve(spec.writes, available)
+        deps = set()
+        for j, (_, prev_reads, prev_writes, _) in enumerate(plan):
+            if (set(prev_writes) & set(reads)) or (set(prev_reads) & set(writes)) or (set(prev_writes) & set(writes)):
+                deps.add(j)
+        plan.append((spec, reads, writes, deps))
+        available += [c for c in writes if c not in available]
+    return plan
+
+
+def _profiled_call(func, projection, kwargs):
+    # Runs on the pool thread, so the CPU time is the check's own
+    profile = CheckProfile(len(projection))
+    with profile:
+        out = func(projection, **kwargs)
+    profile.rows_out = len(out)
+    return out, profile
+
+
+def run_checks(df, specs, context=None, max_workers=None, progress=None, results=None, profiles=None):
+    """
+    Runs the checks as a column-dependency DAG.
+
+    Each ready check gets a projection of only the columns it reads and runs
+    on a thread pool alongside the other ready checks. Only its declared output
+    columns are merged back. The result has the same columns, in the same order,
+    as running the checks one after another.
+
+    Args:
+        df: Input frame (copied once, not modified).
+        specs: CheckSpec list in their serial order.
+        context: Values for the specs' context parameters.
+        max_workers: Thread count (defaults to QC_CHECK_THREADS).
+        progress: Optional callable(check_name) called as each check finishes.
+        results: Optional QCResults. Check outputs it can hold (flags, remark
+            text) move into it as soon as no pending check reads them, and are
+            left out of the returned frame; `results.columns` gets the full order.
+        profiles: Optional dict filled with {check name: CheckProfile.as_dict()}.
+    """
+    context = context or {}
+    plan = build_check_plan(df.columns, specs)
+    result = df.copy()
+    initial_columns = list(result.columns)
+    added_columns = {}
+    done = set()
+    running = {}
+
+    def pack(col, pending):
+        # Only once no check still waiting to start reads it (running checks hold their own projection)
+        if results is None or col in initial_columns or col not in result.columns:
+            return
+        if any(col in plan[j][1] for j in pending):
+            return
+        if results.pack(col, result[col]):
+            del result[col]
+
+    def submit(pool, i):
+        spec, reads, _, _ = plan[i]
+        # An owned copy: checks assign columns in place
+        projection = result[[c for c in result.columns if c in reads]].copy()
+        kwargs = {param: context.get(key) for param, key in spec.context.items()}
+        running[pool.submit(_profiled_call, spec.func, projection, kwargs)] = i
+
+    with ThreadPoolExecutor(max_workers=max_workers or QC_CHECK_THREADS) as pool:
+        pending = set(range(len(plan)))
+        while pending or running:
+            for i in sorted(pending):
+                if plan[i][3] <= done:
+                    pending.discard(i)
+                    submit(pool, i)
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                i = running.pop(future)
+                spec, reads, writes, _ = plan[i]
+                try:
+                    out, profile = future.result()
+                except Exception:
+                    for other in running:
+                        other.cancel()
+                    raise
+                added_columns[i] = [c for c in out.columns if c not in reads]
+                for col in writes:
+                    if col in out.columns:
+                        if results is not None:
+                            results.drop(col)
+                        result[col] = out[col]
+                        pack(col, pending)
+                done.add(i)
+                if profiles is not None:
+                    profiles[spec.name] = profile.as_dict()
+                if progress is not None:
+                    progress(spec.name)
+
+    # Same column order a serial run produces: source columns, then each check's new columns in order
+    ordered = list(initial_columns)
+    for i in range(len(plan)):
+        ordered += [c for c in added_columns.get(i, []) if c not in ordered and (c in result.columns or c in (results or ()))]
+    if results is None:
+        return result[ordered]
+
+    for col in ordered:
+        pack(col, ())
+    results.columns = ordered
+    return result[[c for c in ordered if c in result.columns]]
@@ -0,0 +1,130 @@
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+from qc_durations import DURATION_MINUTES
+from qc_results import pack_frame
+
+# Same colors the old per-cell color_excel used
+GREEN_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+RED_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+
+# pandas.to_excel header look (bold, thin border, centered)
+_HEADER_FONT = Font(bold=True)
+_HEADER_BORDER = Border(*(Side(style="thin"),) * 4)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="top")
+
+SUMMARY_HEADER = ["Check", "Total", "Passed", "Failed"]
+
+# Rows converted per slice when streaming the data sheet
+QC_REPORT_CHUNK_ROWS = int(os.getenv("QC_REPORT_CHUNK_ROWS", "20000"))
+
+# Helper columns added at load time for the checks; never written to reports
+INTERNAL_COLUMNS = (DURATION_MINUTES,)
+
+
+# ----------------------------- 🔢 Cell Conversion -----------------------------
+def _column_values(col: pd.Series) -> list:
+    """Converts one column to plain Python cell values the way to_excel writes them (NaN/NaT -> blank)."""
+    if pd.api.types.is_datetime64_any_dtype(col):
+        if getattr(col.dt, "tz", None) is not None:
+            col = col.dt.tz_localize(None)
+        values = col.dt.to_pydatetime().tolist()
+        return [None if v is pd.NaT or v is None else v for v in values]
+
+    values = col.astype(object).where(col.notna(), None).tolist()
+    out = []
+    for v in values:
+        if v is None or isinstance(v, (str, bool, int, float, datetime.date, datetime.time, datetime.timedelta)):
+            out.append(v)
+        elif isinstance(v, pd.Timestamp):
+            out.append(v.to_pydatetime())
+        elif isinstance(v, np.generic):
+            out.append(v.item())
+        else:
+            out.append(str(v))
+    return out
+
+
+def summarize_qc_columns(df: pd.DataFrame, results=None) -> list:
+    """
+    Rows of the Summary sheet: [check, total, passed, failed] for every *_OK column.
+
+    Counts come from popcounts over a QCResults bitmask; without `results` the
+    frame's True/False *_OK columns are packed into one first.
+    """
+    if results is None:
+        ok_columns = [c for c in df.columns if "_OK" in str(c)]
+        _, results = pack_frame(df[ok_columns], ok_columns)
+    return results.summary_rows(df)
+
+
+# ----------------------------- 📝 Report Writer -----------------------------
+def write_qc_report(output_path, df, sheet_name="Sheet1", summary=True, results=None):
+    """
+    Writes the QC report in a single streaming pass.
+
+    Rows are streamed into a write-only workbook, every `*_OK` column gets one
+    green/red conditional-formatting rule (instead of a fill per cell), and the
+    Summary sheet is written in the same pass, so the file is serialized once
+    and never re-opened.
+
+    When `results` (QCResults) is given, its packed columns are materialized
+    one slice of rows at a time while streaming, in `results.columns` order.
+    INTERNAL_COLUMNS (the parsed Duration_Minutes) are left out.
+
+    Returns:
+        The Summary rows ([check, total, passed, failed]) that were written.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+    names = list(results.columns) if results is not None else list(df.columns)
+    names = [name for name in names if name not in INTERNAL_COLUMNS]
+    positions = {name: i for i, name in enumerate(df.columns)}
+
+    header = []
+    for name in names:
+        cell = WriteOnlyCell(ws, value=str(name))
+        cell.font, cell.border, cell.alignment = _HEADER_FONT, _HEADER_BORDER, _HEADER_ALIGNMENT
+        header.append(cell)
+    ws.append(header)
+
+    for start in range(0, len(df), QC_REPORT_CHUNK_ROWS):
+        rows = slice(start, start + QC_REPORT_CHUNK_ROWS)
+        columns = [
+            _column_values(df.iloc[rows, positions[name]] if name in positions else results.column(name, rows))
+            for name in names
+        ]
+        for row in zip(*columns):
+            ws.append(row)
+
+    last_row = len(df) + 1
+    if len(df):
+        for i, name in enumerate(names):
+            if str(name).endswith("_OK"):
+                letter = get_column_letter(i + 1)
+                cell_range = f"{letter}2:{letter}{last_row}"
+                first = f"{letter}2"
+                ws.conditional_formatting.add(
+                    cell_range, FormulaRule(formula=[f'OR({first}=TRUE,{first}="True")'], fill=GREEN_FILL)
+                )
+                ws.conditional_formatting.add(
+                    cell_range, FormulaRule(formula=[f'OR({first}=FALSE,{first}="False")'], fill=RED_FILL)
+                )
+
+    summary_rows = summarize_qc_columns(df, results) if summary else []
+    if summary:
+        ws_summary = wb.create_sheet("Summary")
+        ws_summary.append(SUMMARY_HEADER)
+        for row in summary_rows:
+            ws_summary.append(row)
+
+    wb.save(output_path)
+    return summary_rows
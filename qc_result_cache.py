@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+# Cached results (entries + their output workbooks) are kept under this size and age
+QC_RESULT_CACHE_MAX_BYTES = int(os.getenv("QC_RESULT_CACHE_MAX_MB", "1024")) * 1024 * 1024
+QC_RESULT_CACHE_MAX_AGE_SECONDS = int(os.getenv("QC_RESULT_CACHE_MAX_AGE_MINUTES", "30")) * 60
+ENTRY_SUFFIX = ".json"
+
+
+def result_key(kind: str, inputs: dict, checks: list, reference_version: str) -> str:
+    """
+    Deterministic key of one pipeline run.
+
+    Args:
+        kind: "qc" or "market".
+        inputs: {input name: SHA-256 of the upload, or None when not given}.
+        checks: [check key, version] pairs in run order (see qc_registry.check_versions).
+        reference_version: Version of the reference data the checks read.
+    """
+    payload = {"kind": kind, "inputs": inputs, "checks": checks, "reference": reference_version}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+# ----------------------------- 🗃️ Result Cache -----------------------------
+class ResultCache:
+    """
+    Finished pipeline results keyed by `result_key`.
+
+    An entry is a small JSON file (summaries, output filename, download URL)
+    next to the output workbook it points to. A hit refreshes the mtime of
+    both, so the outputs cleanup does not delete a workbook that is still
+    being served. Entries expire after `max_age_seconds` without a hit, and
+    the least recently used ones (with their workbooks) are dropped while the
+    total exceeds `max_bytes`. JSON files on disk, so every uvicorn worker
+    shares the same cache.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, output_folder: str, max_bytes: int = QC_RESULT_CACHE_MAX_BYTES,
+                 max_age_seconds: int = QC_RESULT_CACHE_MAX_AGE_SECONDS, subdir: str = "results"):
+        self.output_folder = output_folder
+        self.root = os.path.join(output_folder, subdir)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        os.makedirs(self.root, exist_ok=True)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}{ENTRY_SUFFIX}")
+
+    def _output_path(self, entry: dict) -> str:
+        return os.path.join(self.output_folder, os.path.basename(entry["output_file"]))
+
+    # --- Read / Write ---
+
+    def get(self, key: str):
+        """Returns the stored entry, or None on a miss (also when it expired or its workbook is gone)."""
+        path = self._entry_path(key)
+        try:
+            age = time.time() - os.path.getmtime(path)
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        output_path = self._output_path(entry)
+        if age > self.max_age_seconds or not os.path.exists(output_path):
+            self._remove(path)
+            return None
+        for p in (path, output_path):
+            try:
+                os.utime(p, None)
+            except OSError:
+                pass
+        return entry
+
+    def put(self, key: str, output_file: str, download_url: str, summaries, message: str = None) -> None:
+        """Stores a finished run (written atomically, via rename)."""
+        entry = {
+            "output_file": os.path.basename(output_file),
+            "download_url": download_url,
+            "summaries": summaries,
+            "message": message,
+            "created_at": time.time(),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp_path, self._entry_path(key))
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    # --- Eviction ---
+
+    def _remove(self, path: str, with_output: bool = False) -> int:
+        freed = 0
+        targets = [path]
+        if with_output:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    targets.append(self._output_path(json.load(f)))
+            except (OSError, ValueError):
+                pass
+        for p in targets:
+            try:
+                freed += os.path.getsize(p)
+                os.remove(p)
+            except OSError:
+                pass
+        return freed
+
+    def evict(self) -> int:
+        """
+        Drops expired entries and entries whose workbook is gone, then the least
+        recently used entries (and their workbooks) until the cache fits in
+        `max_bytes`. Returns bytes freed.
+        """
+        with self._lock:
+            now = time.time()
+            entries = []
+            freed = 0
+            for filename in os.listdir(self.root):
+                if not filename.endswith(ENTRY_SUFFIX):
+                    continue
+                path = os.path.join(self.root, filename)
+                try:
+                    st = os.stat(path)
+                    with open(path, "r", encoding="utf-8") as f:
+                        output_path = self._output_path(json.load(f))
+                except (OSError, ValueError):
+                    continue
+                if now - st.st_mtime > self.max_age_seconds or not os.path.exists(output_path):
+                    freed += self._remove(path)
+                    continue
+                entries.append((st.st_mtime, st.st_size + os.path.getsize(output_path), path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                freed += self._remove(path, with_output=True)
+                total -= size
+                print(f"🧹 Evicted cached QC result: {path}")
+            return freed
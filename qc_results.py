@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+
+# One bit per *_OK column
+MAX_FLAGS = 64
+
+
+# ----------------------------- 🧮 Compact QC Results -----------------------------
+class QCResults:
+    """
+    Compact store for the columns the QC checks add.
+
+    Pass/fail columns (`*_OK` holding only True/False) become one bit each in a
+    per-row uint64 bitmask; string columns (remarks, expected categories) become
+    categorical codes with a lookup table of the distinct texts. Everything else
+    stays in the DataFrame. Text is only materialized again, a slice of rows at
+    a time, when a report is written.
+
+    Attributes:
+        flags: uint64 array, bit i set where check `flag_columns[i]` passed.
+        flag_columns: Column name of each bit.
+        remarks: {column: pd.Categorical}.
+        columns: Full column order of the report (source + every check output).
+    """
+
+    def __init__(self, n_rows: int):
+        self.n_rows = n_rows
+        self.flags = np.zeros(n_rows, dtype=np.uint64)
+        self.flag_columns = []
+        self.remarks = {}
+        self.columns = []
+
+    def __contains__(self, name):
+        return name in self.flag_columns or name in self.remarks
+
+    # --- Packing ---
+
+    def pack(self, name, values: pd.Series) -> bool:
+        """Stores a column compactly if it is a flag or string column. Returns True when packed."""
+        self.drop(name)
+        if str(name).endswith("_OK") and _is_flag(values):
+            if None not in self.flag_columns and len(self.flag_columns) >= MAX_FLAGS:
+                return False
+            bit = self._free_bit()
+            self.flag_columns[bit] = name
+            self.flags |= values.to_numpy(dtype=bool).astype(np.uint64) << np.uint64(bit)
+            return True
+        if values.dtype == object and pd.api.types.infer_dtype(values, skipna=True) in ("string", "empty"):
+            self.remarks[name] = pd.Categorical(values.to_numpy())
+            return True
+        return False
+
+    def _free_bit(self):
+        # Bits of dropped columns are reused
+        if None in self.flag_columns:
+            return self.flag_columns.index(None)
+        self.flag_columns.append(None)
+        return len(self.flag_columns) - 1
+
+    def drop(self, name):
+        """Forgets a packed column (e.g. before a later check rewrites it)."""
+        if name in self.flag_columns:
+            bit = self.flag_columns.index(name)
+            self.flags &= ~(np.uint64(1) << np.uint64(bit))
+            self.flag_columns[bit] = None
+        self.remarks.pop(name, None)
+
+    # --- Reading ---
+
+    def column(self, name, rows=slice(None)) -> pd.Series:
+        """Materializes one packed column (optionally a slice of rows) as bool / object values."""
+        if name in self.flag_columns:
+            bit = np.uint64(self.flag_columns.index(name))
+            return pd.Series(((self.flags[rows] >> bit) & np.uint64(1)).astype(bool), name=name)
+        values = pd.Series(self.remarks[name][rows], name=name).astype(object)
+        return values.where(values.notna(), None)
+
+    def passed_counts(self, chunk_rows=65536) -> dict:
+        """Rows passing each flag column: a popcount per bit position over the bitmask."""
+        counts = np.zeros(64, dtype=np.int64)
+        for start in range(0, self.n_rows, chunk_rows):
+            chunk = self.flags[start:start + chunk_rows]
+            counts += np.unpackbits(chunk.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little").sum(axis=0, dtype=np.int64)
+        return {name: int(counts[bit]) for bit, name in enumerate(self.flag_columns) if name is not None}
+
+    def failed_checks_per_row(self) -> np.ndarray:
+        """Number of failed flag checks on every row (popcount of the cleared bits)."""
+        n_flags = sum(1 for name in self.flag_columns if name is not None)
+        return n_flags - np.bitwise_count(self.flags).astype(np.int64)
+
+    def summary_rows(self, df: pd.DataFrame = None) -> list:
+        """
+        Summary sheet rows ([check, total, passed, failed]) for every *_OK column
+        in report order; unpacked *_OK columns are counted from `df`.
+        """
+        passed = self.passed_counts()
+        rows = []
+        for col in self.columns:
+            if "_OK" not in str(col):
+                continue
+            if col in passed:
+                count = passed[col]
+            elif df is not None and col in df.columns:
+                count = int(df[col].isin([True, "True"]).sum())
+            else:
+                continue
+            rows.append([col, self.n_rows, count, self.n_rows - count])
+        return rows
+
+
+def _is_flag(values: pd.Series) -> bool:
+    if values.dtype == bool:
+        return True
+    return values.dtype == object and pd.api.types.infer_dtype(values, skipna=False) == "boolean"
+
+
+def pack_frame(df: pd.DataFrame, columns) -> tuple:
+    """
+    Packs the given columns of a checked frame.
+
+    Returns:
+        (frame without the packed columns, QCResults whose `columns` is the full original order).
+    """
+    results = QCResults(len(df))
+    results.columns = list(df.columns)
+    packed = [c for c in columns if results.pack(c, df[c])]
+    return df.drop(columns=packed), results
+
+
+def qc_summaries(summary_rows, details=None) -> list:
+    """
+    Summary rows as the dicts the QC endpoints return to the frontend table.
+    `details` ({*_OK column: dict}) adds extra entries (e.g. the check profile)
+    to the row's `details`.
+    """
+    details = details or {}
+    return [
+        {
+            "id": i,
+            "description": str(check).replace("_OK", "").replace("_", " "),
+            "action": "Audit",
+            "status": "Completed" if failed == 0 else "Issue Found",
+            "total_issues_flagged": int(failed),
+            "details": {"total_rows": int(total), "passed": int(passed), **details.get(check, {})},
+        }
+        for i, (check, total, passed, failed) in enumerate(summary_rows, start=1)
+    ]
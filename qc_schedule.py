@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+from qc_durations import parse_duration_minutes
+
+# Session length assumed when the reference schedule gives no end time
+DEFAULT_SESSION_MINUTES = 60
+NO_SESSION = -1
+
+
+# ----------------------------- 🕒 Airing Times -----------------------------
+def _parse_dates(values) -> pd.Series:
+    """Calendar day of each value (NaT when unparseable), parsed once per distinct value."""
+    s = values if isinstance(values, pd.Series) else pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s.dt.normalize()
+    codes, uniques = pd.factorize(s)
+    parsed = pd.to_datetime(pd.Series(uniques, dtype=object).astype(str), errors="coerce", format="mixed")
+    days = np.append(parsed.dt.normalize().to_numpy("datetime64[ns]"), np.datetime64("NaT"))
+    return pd.Series(days[codes], index=s.index)
+
+
+def time_strings(values) -> pd.Series:
+    """'HH:MM:SS' of each time of day ('00:00:00' when missing or unparseable)."""
+    minutes = parse_duration_minutes(values).fillna(0)
+    clock = pd.Timestamp(0) + pd.to_timedelta(minutes, unit="min").dt.round("s")
+    return clock.dt.strftime("%H:%M:%S")
+
+
+def airing_times(dates, starts, ends):
+    """
+    Start and end datetimes of each airing from its date and time-of-day columns.
+    Times may be strings, datetime.time or datetime values; airings ending
+    before they start run past midnight and end on the next day.
+    """
+    day = _parse_dates(dates)
+    start = day + pd.to_timedelta(parse_duration_minutes(starts).to_numpy(), unit="min")
+    end = day + pd.to_timedelta(parse_duration_minutes(ends).to_numpy(), unit="min")
+    end = end.where(~(end < start), end + pd.Timedelta(days=1))
+    return start, end
+
+
+# ----------------------------- 🏁 Session Schedule -----------------------------
+class SessionSchedule:
+    """
+    Official live sessions of one event, sorted by start.
+
+    Airings are matched with binary searches over the session starts (the
+    same lookup merge_asof does), so matching n airings against s sessions
+    is O(n log s) and never loops over sessions. Lookups return session
+    positions, NO_SESSION (-1) where nothing matches.
+
+    Attributes:
+        frame: Session, Competition_Type, Live_Start_UTC and Live_End_UTC per session (treat as read-only).
+    """
+
+    def __init__(self, sessions: pd.DataFrame):
+        self.frame = sessions.sort_values("Live_Start_UTC", kind="mergesort").reset_index(drop=True)
+        self._starts = self.frame["Live_Start_UTC"].to_numpy("datetime64[ns]").astype("int64")
+        self._minutes = ((self.frame["Live_End_UTC"] - self.frame["Live_Start_UTC"]) / pd.Timedelta(minutes=1)).to_numpy()
+        self._competitions = self.frame["Competition_Type"].to_numpy(dtype=object)
+
+    @classmethod
+    def from_reference(cls, live_schedule, competition_map, default_minutes=DEFAULT_SESSION_MINUTES):
+        """Builds the schedule from the reference `live_schedule` entries (session, date, start[, end])."""
+        rows = pd.DataFrame(list(live_schedule), columns=["session", "date", "start", "end"])
+        start = pd.to_datetime(rows["date"] + " " + rows["start"], errors="coerce")
+        end = pd.to_datetime(rows["date"] + " " + rows["end"], errors="coerce")
+        end = end.fillna(start + pd.Timedelta(minutes=default_minutes))
+        end = end.where(end > start, end + pd.Timedelta(days=1))
+        sessions = pd.DataFrame({
+            "Session": rows["session"],
+            "Competition_Type": rows["session"].replace(dict(competition_map)).str.strip(),
+            "Live_Start_UTC": start,
+            "Live_End_UTC": end,
+        })
+        return cls(sessions[start.notna()])
+
+    def __len__(self):
+        return len(self._starts)
+
+    @staticmethod
+    def _ns(times):
+        times = pd.Series(times)
+        return times.to_numpy("datetime64[ns]").astype("int64"), times.notna().to_numpy()
+
+    def nearest(self, times) -> np.ndarray:
+        """Session whose start is closest to each time (the earlier one on ties)."""
+        ns, valid = self._ns(times)
+        if not len(self):
+            return np.full(len(ns), NO_SESSION)
+        right = np.searchsorted(self._starts, ns).clip(max=len(self) - 1)
+        left = (right - 1).clip(min=0)
+        pick = np.where(np.abs(ns - self._starts[left]) <= np.abs(self._starts[right] - ns), left, right)
+        return np.where(valid, pick, NO_SESSION)
+
+    def latest_started(self, times) -> np.ndarray:
+        """Last session started at or before each time (the one in progress, or the most recent)."""
+        ns, valid = self._ns(times)
+        position = np.searchsorted(self._starts, ns, side="right") - 1
+        return np.where(valid, position, NO_SESSION)
+
+    def offset_minutes(self, times, positions) -> np.ndarray:
+        """Minutes from each matched session's start to the time (NaN where unmatched)."""
+        ns, _ = self._ns(times)
+        matched = positions != NO_SESSION
+        offsets = np.full(len(ns), np.nan)
+        offsets[matched] = (ns[matched] - self._starts[positions[matched]]) / 60e9
+        return offsets
+
+    def minutes_at(self, positions) -> np.ndarray:
+        """Length in minutes of each matched session (NaN where unmatched)."""
+        return np.where(positions != NO_SESSION, self._minutes[positions.clip(min=0)] if len(self) else np.nan, np.nan)
+
+    def competitions_at(self, positions) -> np.ndarray:
+        """Competition type of each matched session ('' where unmatched)."""
+        if not len(self):
+            return np.full(len(positions), "", dtype=object)
+        return np.where(positions != NO_SESSION, self._competitions[positions.clip(min=0)], "")